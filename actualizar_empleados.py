@@ -7,24 +7,136 @@ Este script:
 1. Lee el Excel maestro (con columna UUID)
 2. Si UUID existe → usa ese UUID (empleado existente, preserva QR)
 3. Si UUID vacío → genera UUID nuevo (empleado nuevo)
-4. Genera empleados.json actualizado
+4. Genera empleados.json actualizado (o empleados.ndjson, ver escritores.py)
+
+El maestro puede ser xlsx, CSV o Parquet con las mismas columnas
+(ver lectores.py).
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
+
+Los ids que ya no están en el Excel se agregan al filtro de credenciales
+revocadas junto al JSON (revocados.bin, ver revocaciones.py).
 """
 
-import json
-import openpyxl
 import sys
 import uuid
 from pathlib import Path
 
+from escritores import agregar_empleados, es_ndjson, escribir_empleados
+from indice_busqueda import actualizar_indice
+from lectores import iterar_empleados, leer_filas
+from metricas import SIN_METRICAS, metricas_desde_argv
+from revocaciones import actualizar_revocaciones, fp_desde_argv
 
-def actualizar_empleados(excel_file, json_file='empleados.json'):
+
+def guardar_incremental(empleados, ndjson_file):
+    """
+    Agrega al NDJSON existente solo los empleados nuevos, si es posible.
+
+    Solo se puede agregar cuando ningún empleado existente cambió ni fue
+    eliminado; en otro caso hay que reescribir el archivo completo.
+
+    Returns:
+        Número de empleados agregados, o None si hay que reescribir
+    """
+    anteriores = {emp['id']: emp for emp in iterar_empleados(ndjson_file)}
+    ids_actuales = {emp['id'] for emp in empleados}
+
+    if not ids_actuales.issuperset(anteriores):
+        return None  # Hay empleados eliminados
+
+    nuevos = []
+    for emp in empleados:
+        anterior = anteriores.get(emp['id'])
+        if anterior is None:
+            nuevos.append(emp)
+        elif anterior != emp:
+            return None  # Hay empleados modificados
+
+    return agregar_empleados(nuevos, ndjson_file)
+
+
+def leer_maestro(excel_file, metricas=None):
+    """
+    Lee los empleados del Excel maestro.
+
+    Columnas: A=UUID, B=NOMBRE, C=PUESTO, D=GERENCIA, E=CELULAR (desde la fila 2).
+    Las filas con UUID vacío reciben un UUID nuevo (empleado nuevo).
+
+    Args:
+        excel_file: Ruta al archivo Excel maestro (o CSV/Parquet)
+        metricas: Metricas para el reporte por fase (opcional)
+
+    Returns:
+        Tupla (empleados, sin_uuid, errores): sin_uuid son las posiciones en
+        empleados de los que tenían el UUID vacío; errores, las filas con error
+    """
+    metricas = metricas or SIN_METRICAS
+    empleados = []
+    sin_uuid = []
+    errores = 0
+
+    # Iterar desde la fila 2 (la fila 1 es encabezado)
+    filas = metricas.iterar('parse', leer_filas(excel_file, min_row=2), cuerpo='transform')
+    for idx, row in enumerate(filas, start=2):
+        try:
+            # Leer columnas (índice 0-based)
+            empleado_uuid = row[0] if len(row) > 0 and row[0] else ""
+            nombre = row[1] if len(row) > 1 and row[1] else ""
+            puesto = row[2] if len(row) > 2 and row[2] else ""
+            gerencia = row[3] if len(row) > 3 and row[3] else ""
+            celular = row[4] if len(row) > 4 and row[4] else ""
+
+            # Saltar filas vacías
+            if not nombre:
+                continue
+
+            # Limpiar y formatear datos
+            nombre = str(nombre).strip().upper()
+            puesto = str(puesto).strip() if puesto else "Asesor"
+            gerencia = str(gerencia).strip() if gerencia else ""
+            celular = str(celular).strip() if celular else ""
+
+            # Si UUID está vacío, generar uno nuevo (empleado nuevo)
+            if not empleado_uuid or str(empleado_uuid).strip() == "":
+                empleado_uuid = str(uuid.uuid4())
+                sin_uuid.append(len(empleados))
+            else:
+                # UUID existe, es empleado existente (actualización)
+                empleado_uuid = str(empleado_uuid).strip()
+
+            # Crear objeto empleado
+            empleados.append({
+                "id": empleado_uuid,
+                "nombre": nombre,
+                "puesto": puesto,
+                "gerencia": gerencia,
+                "celular": celular
+            })
+            metricas.contar()
+
+        except Exception as e:
+            errores += 1
+            print(f"⚠️  Error en fila {idx}: {str(e)}")
+            continue
+
+    return empleados, sin_uuid, errores
+
+
+def actualizar_empleados(excel_file, json_file='empleados.json', metricas=None, fp_revocacion=None):
     """
     Actualiza empleados.json desde Excel maestro preservando UUIDs.
 
     Args:
-        excel_file: Ruta al archivo Excel maestro
-        json_file: Ruta al archivo JSON de salida (default: empleados.json)
+        excel_file: Ruta al archivo Excel maestro (o CSV/Parquet)
+        json_file: Ruta al archivo JSON de salida (default: empleados.json).
+                   Si es .ndjson y ya existe, los empleados nuevos se agregan
+                   al final sin reescribir el archivo.
+        metricas: Metricas para el reporte por fase (opcional)
+        fp_revocacion: Tasa de falsos positivos del filtro de revocados
+                       (default: la anterior, o 0.1 %)
     """
+    metricas = metricas or SIN_METRICAS
     try:
         print("=" * 70)
         print("  ACTUALIZADOR DE EMPLEADOS - THE MONEY CENTER")
@@ -32,66 +144,29 @@ def actualizar_empleados(excel_file, json_file='empleados.json'):
         print()
         print(f"📂 Leyendo Excel maestro: {excel_file}")
 
-        # Cargar el archivo Excel
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-
-        empleados = []
-        nuevos = 0
-        actualizados = 0
-        errores = 0
-
-        # Iterar desde la fila 2 (la fila 1 es encabezado)
-        # Columnas: A=UUID, B=NOMBRE, C=PUESTO, D=GERENCIA, E=CELULAR
-        for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-            try:
-                # Leer columnas (índice 0-based)
-                empleado_uuid = row[0] if len(row) > 0 and row[0] else ""
-                nombre = row[1] if len(row) > 1 and row[1] else ""
-                puesto = row[2] if len(row) > 2 and row[2] else ""
-                gerencia = row[3] if len(row) > 3 and row[3] else ""
-                celular = row[4] if len(row) > 4 and row[4] else ""
-
-                # Saltar filas vacías
-                if not nombre:
-                    continue
-
-                # Limpiar y formatear datos
-                nombre = str(nombre).strip().upper()
-                puesto = str(puesto).strip() if puesto else "Asesor"
-                gerencia = str(gerencia).strip() if gerencia else ""
-                celular = str(celular).strip() if celular else ""
-
-                # Si UUID está vacío, generar uno nuevo (empleado nuevo)
-                if not empleado_uuid or empleado_uuid.strip() == "":
-                    empleado_uuid = str(uuid.uuid4())
-                    nuevos += 1
-                else:
-                    # UUID existe, es empleado existente (actualización)
-                    empleado_uuid = str(empleado_uuid).strip()
-                    actualizados += 1
-
-                # Crear objeto empleado
-                empleado = {
-                    "id": empleado_uuid,
-                    "nombre": nombre,
-                    "puesto": puesto,
-                    "gerencia": gerencia,
-                    "celular": celular
-                }
-
-                empleados.append(empleado)
-
-            except Exception as e:
-                errores += 1
-                print(f"⚠️  Error en fila {idx}: {str(e)}")
-                continue
+        empleados, sin_uuid, errores = leer_maestro(excel_file, metricas)
+        nuevos = len(sin_uuid)
+        actualizados = len(empleados) - nuevos
 
-        # Guardar a JSON
-        print(f"\n💾 Guardando {len(empleados)} empleados en {json_file}")
+        # Guardar a JSON (o NDJSON según la extensión)
+        agregados = None
+        indice_file = None
+        revocaciones = None
+        if es_ndjson(json_file) and Path(json_file).exists():
+            with metricas.fase('write'):
+                agregados = guardar_incremental(empleados, json_file)
 
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(empleados, f, ensure_ascii=False, indent=2)
+        if agregados is not None:
+            print(f"\n💾 Agregando {agregados} empleados nuevos a {json_file} (sin reescribir)")
+        else:
+            print(f"\n💾 Guardando {len(empleados)} empleados en {json_file}")
+            # Ids actuales, para revocar los que se eliminen del Excel
+            ids_anteriores = ([emp['id'] for emp in iterar_empleados(json_file)]
+                              if Path(json_file).exists() else [])
+            with metricas.fase('write'):
+                escribir_empleados(empleados, json_file)
+                indice_file = actualizar_indice(empleados, json_file)
+                revocaciones = actualizar_revocaciones(ids_anteriores, empleados, json_file, fp_revocacion)
 
         # Resumen
         print("\n✅ Actualización completada exitosamente!")
@@ -100,9 +175,15 @@ def actualizar_empleados(excel_file, json_file='empleados.json'):
         print(f"   • Total empleados:     {len(empleados)}")
         print(f"   • Empleados nuevos:    {nuevos}")
         print(f"   • Empleados actualizados: {actualizados}")
+        if revocaciones:
+            print(f"   • Credenciales revocadas: {revocaciones['total']} ({revocaciones['nuevos']} nuevas)")
         if errores > 0:
             print(f"   ⚠️  Filas con error:    {errores}")
         print(f"\n📁 Archivo generado: {json_file}")
+        if indice_file:
+            print(f"📁 Índice de búsqueda: {indice_file}")
+        if revocaciones:
+            print(f"📁 Filtro de revocados: {revocaciones['ruta']}")
         print("=" * 70)
         print()
 
@@ -129,17 +210,30 @@ def main():
     """Función principal del script."""
     print()
 
+    metricas = metricas_desde_argv(sys.argv, 'actualizar_empleados')
+    try:
+        fp_revocacion = fp_desde_argv(sys.argv)
+    except ValueError as e:
+        print(f"❌ Error: {str(e)}")
+        sys.exit(1)
+
     # Verificar argumentos
     if len(sys.argv) < 2:
-        print("Uso: python actualizar_empleados.py <archivo_excel_maestro.xlsx> [archivo_salida.json]")
+        print("Uso: python actualizar_empleados.py <archivo_excel_maestro.xlsx> [archivo_salida.json] [--metricas] [--perfil] [--fp-revocacion=0.001]")
         print()
         print("Ejemplo:")
         print("  python actualizar_empleados.py empleados_maestro.xlsx")
         print("  python actualizar_empleados.py empleados_maestro.xlsx empleados.json")
+        print("  python actualizar_empleados.py empleados_maestro.csv empleados.json")
+        print("  python actualizar_empleados.py empleados_maestro.xlsx empleados.ndjson")
+        print("  python actualizar_empleados.py empleados_maestro.xlsx empleados.json --metricas")
         print()
         print("IMPORTANTE:")
         print("  • Si UUID está vacío → Genera UUID nuevo (empleado nuevo)")
         print("  • Si UUID existe → Preserva UUID (actualización, QR sigue funcionando)")
+        print("  • Salida .ndjson → Un empleado por línea; los nuevos se agregan al final")
+        print("    (python compactar_empleados.py genera el JSON para la web)")
+        print("  • Empleados eliminados del Excel → revocados.bin (filtro de revocación)")
         print()
         sys.exit(1)
 
@@ -152,7 +246,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar conversión
-    success = actualizar_empleados(excel_file, json_file)
+    success = actualizar_empleados(excel_file, json_file, metricas, fp_revocacion)
+    metricas.guardar()
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Almacén SQLite de empleados (opcional).
+The Money Center - Directorio de Empleados
+
+Guarda los empleados en una base SQLite con índices por id, nombre
+normalizado, gerencia y celular. Las búsquedas y las diferencias contra
+el Excel maestro se resuelven con consultas indexadas en lugar de cargar
+y recorrer todo empleados.json.
+
+Los scripts que leen o escriben la exportación aceptan una base SQLite
+como archivo (extensión .db, .sqlite o .sqlite3), por ejemplo:
+
+    python actualizar_empleados.py empleados_maestro.xlsx empleados.db
+    python generar_qrs_faltantes.py empleados.db
+
+Uso directo:
+
+    python almacen_sqlite.py importar empleados.json empleados.db
+    python almacen_sqlite.py exportar empleados.db public/empleados.json
+    python almacen_sqlite.py buscar "PEREZ" empleados.db
+"""
+
+import re
+import sqlite3
+import sys
+import unicodedata
+from pathlib import Path
+
+
+EXTENSIONES_SQLITE = {'.db', '.sqlite', '.sqlite3'}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS empleados (
+    id TEXT PRIMARY KEY,
+    orden INTEGER NOT NULL,
+    nombre TEXT NOT NULL,
+    nombre_normalizado TEXT NOT NULL,
+    puesto TEXT NOT NULL DEFAULT '',
+    gerencia TEXT NOT NULL DEFAULT '',
+    celular TEXT NOT NULL DEFAULT '',
+    baja INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_empleados_orden ON empleados (orden);
+CREATE INDEX IF NOT EXISTS idx_empleados_nombre ON empleados (nombre_normalizado);
+CREATE INDEX IF NOT EXISTS idx_empleados_gerencia ON empleados (gerencia);
+CREATE INDEX IF NOT EXISTS idx_empleados_celular ON empleados (celular);
+"""
+
+def es_sqlite(ruta):
+    """Indica si la ruta corresponde a una base SQLite de empleados."""
+    return Path(ruta).suffix.lower() in EXTENSIONES_SQLITE
+
+
+def normalizar_nombre(nombre):
+    """
+    Normaliza un nombre para búsquedas: mayúsculas, sin acentos y con
+    espacios simples. Ejemplo: "  José  Pérez " -> "JOSE PEREZ"
+    """
+    sin_acentos = ''.join(
+        c for c in unicodedata.normalize('NFKD', str(nombre))
+        if not unicodedata.combining(c)
+    )
+    return re.sub(r'\s+', ' ', sin_acentos).strip().upper()
+
+
+def abrir_almacen(ruta):
+    """Abre (o crea) la base SQLite de empleados con su esquema e índices."""
+    conn = sqlite3.connect(ruta)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(ESQUEMA)
+    return conn
+
+
+def _a_empleado(fila):
+    """Convierte una fila de la base al diccionario de la exportación JSON."""
+    empleado = {
+        'id': fila['id'],
+        'nombre': fila['nombre'],
+        'puesto': fila['puesto'],
+        'gerencia': fila['gerencia'],
+        'celular': fila['celular'],
+    }
+    if fila['baja'] is not None:
+        empleado['baja'] = bool(fila['baja'])
+    return empleado
+
+
+def _valores(empleado):
+    """Valores de un empleado: id, nombre, puesto, gerencia, celular, baja."""
+    baja = empleado.get('baja')
+    return (
+        str(empleado['id']),
+        empleado.get('nombre', ''),
+        empleado.get('puesto', ''),
+        empleado.get('gerencia', ''),
+        empleado.get('celular', ''),
+        None if baja is None else int(bool(baja)),
+    )
+
+
+def guardar_empleados(conn, empleados):
+    """
+    Sincroniza la base con la lista completa de empleados.
+
+    Cada empleado se compara con su fila por id (índice de la llave
+    primaria); solo se insertan los nuevos, se actualizan los modificados
+    y se eliminan los que ya no están.
+
+    Returns:
+        Diccionario con los conteos: nuevos, modificados, eliminados, total
+    """
+    conteos = {'nuevos': 0, 'modificados': 0, 'eliminados': 0, 'total': 0}
+
+    with conn:
+        conn.execute('CREATE TEMP TABLE IF NOT EXISTS ids_actuales (id TEXT PRIMARY KEY)')
+        conn.execute('DELETE FROM ids_actuales')
+
+        for orden, empleado in enumerate(empleados):
+            valores = _valores(empleado)
+            actual = conn.execute(
+                'SELECT orden, nombre, puesto, gerencia, celular, baja FROM empleados WHERE id = ?',
+                (valores[0],)
+            ).fetchone()
+
+            if actual is None:
+                conn.execute(
+                    'INSERT INTO empleados (id, orden, nombre, nombre_normalizado, puesto, gerencia, celular, baja) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (valores[0], orden, valores[1], normalizar_nombre(valores[1])) + valores[2:]
+                )
+                conteos['nuevos'] += 1
+            elif tuple(actual)[1:] != valores[1:]:
+                conn.execute(
+                    'UPDATE empleados SET orden = ?, nombre = ?, nombre_normalizado = ?, puesto = ?, '
+                    'gerencia = ?, celular = ?, baja = ? WHERE id = ?',
+                    (orden, valores[1], normalizar_nombre(valores[1])) + valores[2:] + (valores[0],)
+                )
+                conteos['modificados'] += 1
+            elif actual['orden'] != orden:
+                conn.execute('UPDATE empleados SET orden = ? WHERE id = ?', (orden, valores[0]))
+
+            conn.execute('INSERT OR IGNORE INTO ids_actuales (id) VALUES (?)', (valores[0],))
+            conteos['total'] += 1
+
+        cursor = conn.execute('DELETE FROM empleados WHERE id NOT IN (SELECT id FROM ids_actuales)')
+        conteos['eliminados'] = cursor.rowcount
+
+    return conteos
+
+
+def agregar_empleados_db(conn, empleados):
+    """Agrega empleados al final de la base (sin tocar los existentes)."""
+    with conn:
+        siguiente = conn.execute('SELECT COALESCE(MAX(orden) + 1, 0) FROM empleados').fetchone()[0]
+        total = 0
+        for orden, empleado in enumerate(empleados, start=siguiente):
+            valores = _valores(empleado)
+            conn.execute(
+                'INSERT INTO empleados (id, orden, nombre, nombre_normalizado, puesto, gerencia, celular, baja) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (valores[0], orden, valores[1], normalizar_nombre(valores[1])) + valores[2:]
+            )
+            total += 1
+    return total
+
+
+def iterar_empleados_db(ruta):
+    """Itera los empleados de la base en el orden de la exportación."""
+    if not Path(ruta).exists():
+        raise FileNotFoundError(ruta)
+
+    conn = abrir_almacen(ruta)
+    try:
+        for fila in conn.execute('SELECT * FROM empleados ORDER BY orden'):
+            yield _a_empleado(fila)
+    finally:
+        conn.close()
+
+
+def contar_empleados_db(ruta):
+    """Número de empleados de la base (sin recorrerlos)."""
+    conn = abrir_almacen(ruta)
+    try:
+        return conn.execute('SELECT COUNT(*) FROM empleados').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def buscar_por_id(conn, empleado_id):
+    """Devuelve el empleado con ese id, o None."""
+    fila = conn.execute('SELECT * FROM empleados WHERE id = ?', (empleado_id,)).fetchone()
+    return _a_empleado(fila) if fila else None
+
+
+def buscar_por_nombre(conn, texto, contiene=False):
+    """
+    Empleados cuyo nombre normalizado empieza con el texto (usa el índice).
+
+    Con contiene=True busca el texto en cualquier parte del nombre
+    (por ejemplo un apellido); esa búsqueda recorre la tabla.
+    """
+    normalizado = normalizar_nombre(texto)
+    if contiene:
+        filas = conn.execute(
+            "SELECT * FROM empleados WHERE instr(nombre_normalizado, ?) > 0 ORDER BY orden",
+            (normalizado,)
+        )
+    else:
+        # Rango [prefijo, prefijo + U+FFFF) en lugar de LIKE para aprovechar el índice
+        filas = conn.execute(
+            'SELECT * FROM empleados WHERE nombre_normalizado >= ? AND nombre_normalizado < ? ORDER BY orden',
+            (normalizado, normalizado + '\uffff')
+        )
+    return [_a_empleado(fila) for fila in filas]
+
+
+def buscar_por_gerencia(conn, gerencia):
+    """Empleados de una gerencia."""
+    filas = conn.execute('SELECT * FROM empleados WHERE gerencia = ? ORDER BY orden', (gerencia,))
+    return [_a_empleado(fila) for fila in filas]
+
+
+def buscar_por_celular(conn, celular):
+    """Empleados con ese número de celular."""
+    filas = conn.execute('SELECT * FROM empleados WHERE celular = ? ORDER BY orden', (celular,))
+    return [_a_empleado(fila) for fila in filas]
+
+
+def main():
+    """Función principal del script."""
+    # Importaciones locales: escritores/lectores importan este módulo
+    from escritores import escribir_empleados
+    from lectores import EXTENSIONES, iterar_empleados
+
+    if len(sys.argv) < 2 or sys.argv[1] in ['-h', '--help']:
+        print("Uso: python almacen_sqlite.py <comando> [argumentos]")
+        print()
+        print("Comandos:")
+        print("  importar <empleados.json|.ndjson> [empleados.db]   : Carga la exportación en la base")
+        print("  exportar [empleados.db] [empleados.json]           : Genera el JSON para la web")
+        print("  buscar <id|nombre|celular> [empleados.db]          : Busca empleados")
+        print()
+        print("Ejemplos:")
+        print("  python almacen_sqlite.py importar empleados.json")
+        print("  python almacen_sqlite.py exportar empleados.db public/empleados.json")
+        print('  python almacen_sqlite.py buscar "PEREZ"')
+        sys.exit(0 if len(sys.argv) > 1 else 1)
+
+    comando = sys.argv[1]
+    args = sys.argv[2:]
+
+    try:
+        if comando == 'importar':
+            if not args:
+                print("❌ Error: Falta el archivo a importar")
+                sys.exit(1)
+            origen = args[0]
+            db_file = args[1] if len(args) > 1 else 'empleados.db'
+
+            if Path(origen).suffix.lower() in EXTENSIONES:
+                print("❌ Error: importar recibe la exportación (JSON/NDJSON), no el Excel maestro")
+                print(f"   Usa: python actualizar_empleados.py {origen} {db_file}")
+                sys.exit(1)
+
+            print(f"📂 Importando {origen} → {db_file}")
+            conn = abrir_almacen(db_file)
+            conteos = guardar_empleados(conn, iterar_empleados(origen))
+            conn.close()
+
+            print("\n✅ Importación completada!")
+            print(f"   • Total empleados:  {conteos['total']}")
+            print(f"   • Nuevos:           {conteos['nuevos']}")
+            print(f"   • Modificados:      {conteos['modificados']}")
+            print(f"   • Eliminados:       {conteos['eliminados']}")
+
+        elif comando == 'exportar':
+            db_file = args[0] if len(args) > 0 else 'empleados.db'
+            json_file = args[1] if len(args) > 1 else 'empleados.json'
+
+            if not Path(db_file).exists():
+                print(f"❌ Error: El archivo '{db_file}' no existe")
+                sys.exit(1)
+
+            total = escribir_empleados(iterar_empleados_db(db_file), json_file)
+            print(f"✅ {total} empleados exportados a {json_file}")
+
+        elif comando == 'buscar':
+            if not args:
+                print("❌ Error: Falta el texto a buscar")
+                sys.exit(1)
+            texto = args[0]
+            db_file = args[1] if len(args) > 1 else 'empleados.db'
+
+            if not Path(db_file).exists():
+                print(f"❌ Error: El archivo '{db_file}' no existe")
+                sys.exit(1)
+
+            conn = abrir_almacen(db_file)
+            encontrado = buscar_por_id(conn, texto)
+            resultados = [encontrado] if encontrado else (
+                buscar_por_celular(conn, texto)
+                or buscar_por_nombre(conn, texto)
+                or buscar_por_nombre(conn, texto, contiene=True)
+            )
+            conn.close()
+
+            print(f"🔍 {len(resultados)} resultados para '{texto}'\n")
+            for emp in resultados:
+                print(f"   • {emp['nombre']} — {emp['puesto']} — {emp['gerencia']} ({emp['id']})")
+
+        else:
+            print(f"❌ Error: Comando desconocido '{comando}'")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Benchmark de las etapas del pipeline con datos sintéticos.
+The Money Center - Directorio de Empleados
+
+Para cada tamaño (1k, 10k, 100k, 1M empleados) este script:
+1. Genera datos sintéticos (generar_datos_sinteticos.py)
+2. Ejecuta cada etapa en un proceso aparte (memoria medida por etapa)
+3. Registra tiempo, empleados por segundo y pico de memoria (RSS)
+4. Compara contra una línea base guardada y marca las regresiones
+
+Las etapas de QR (generar_qrs_imagenes, diagnosticar_qrs) escriben un PNG
+por empleado; se miden sobre una muestra (--max-qr, default 1000) y el
+rendimiento se reporta por empleado procesado.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from generar_datos_sinteticos import generar_datos
+from metricas import pico_rss_mb
+
+
+TAMANOS = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+ETAPAS = [
+    'excel_to_json',
+    'actualizar_empleados',
+    'limpiar_excel_maestro',
+    'crear_excel_maestro',
+    'generar_qrs_imagenes',
+    'diagnosticar_qrs',
+]
+
+# Una etapa es regresión si es más lenta o usa más memoria que la línea base
+# por encima de esta tolerancia
+TOLERANCIA = 0.20
+
+
+def _ejecutar_etapa(etapa, archivos, tmp_dir, cola):
+    """Ejecuta una etapa (en un proceso hijo) y envía sus métricas por la cola."""
+    tmp = Path(tmp_dir)
+
+    # Importar dentro del proceso hijo para que la memoria de openpyxl/PIL
+    # cuente solo en la etapa que la usa
+    if etapa == 'excel_to_json':
+        from excel_to_json import excel_to_json
+        funcion, args = excel_to_json, (archivos['asesores'], tmp / 'asesores.json')
+    elif etapa == 'actualizar_empleados':
+        from actualizar_empleados import actualizar_empleados
+        funcion, args = actualizar_empleados, (archivos['maestro'], tmp / 'actualizado.json')
+    elif etapa == 'limpiar_excel_maestro':
+        from limpiar_excel_maestro import limpiar_excel_maestro
+        funcion, args = limpiar_excel_maestro, (archivos['maestro'], tmp / 'limpio.xlsx')
+    elif etapa == 'crear_excel_maestro':
+        from crear_excel_maestro import crear_excel_maestro
+        funcion, args = crear_excel_maestro, (archivos['json'], archivos['gerentes'], tmp / 'maestro_nuevo.xlsx')
+    elif etapa == 'generar_qrs_imagenes':
+        from generar_qrs_imagenes import generar_qrs
+        funcion, args = generar_qrs, (archivos['json_qr'], None, tmp / 'qr_codes')
+    elif etapa == 'diagnosticar_qrs':
+        from diagnosticar_qrs import diagnosticar_qrs
+        funcion, args = diagnosticar_qrs, (archivos['json_qr'], tmp / 'qr_codes', None)
+    else:
+        raise ValueError(f"Etapa desconocida: {etapa}")
+
+    # Los scripts imprimen una línea por empleado: descartar la salida
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        inicio = time.perf_counter()
+        exito = funcion(*(str(a) if isinstance(a, Path) else a for a in args))
+        segundos = time.perf_counter() - inicio
+
+    cola.put({'exito': bool(exito), 'segundos': segundos, 'pico_rss_mb': pico_rss_mb()})
+
+
+def medir_etapa(etapa, archivos, tmp_dir, filas):
+    """Mide una etapa en un proceso nuevo y devuelve sus métricas."""
+    cola = multiprocessing.Queue()
+    proceso = multiprocessing.Process(target=_ejecutar_etapa, args=(etapa, archivos, tmp_dir, cola))
+    proceso.start()
+    proceso.join()
+
+    if proceso.exitcode != 0 or cola.empty():
+        return {'exito': False, 'filas': filas}
+
+    metricas = cola.get()
+    metricas['filas'] = filas
+    metricas['filas_por_segundo'] = filas / metricas['segundos'] if metricas['segundos'] > 0 else None
+    return metricas
+
+
+def ejecutar_benchmark(tamanos, etapas=None, max_qr=1000, semilla=42):
+    """
+    Ejecuta todas las etapas para cada tamaño.
+
+    Returns:
+        Diccionario tamaño → etapa → métricas
+    """
+    # Siempre en el orden del pipeline
+    etapas = [etapa for etapa in ETAPAS if etapa in (etapas or ETAPAS)]
+    resultados = {}
+
+    for nombre_tamano in tamanos:
+        cantidad = TAMANOS[nombre_tamano]
+        print(f"\n📦 Tamaño {nombre_tamano} ({cantidad:,} empleados)")
+
+        with tempfile.TemporaryDirectory(prefix=f'bench_{nombre_tamano}_') as tmp_dir:
+            print("   🔨 Generando datos sintéticos...")
+            archivos = {k: str(v) for k, v in generar_datos(cantidad, tmp_dir, semilla).items()}
+
+            # Muestra para las etapas de QR
+            filas_qr = min(cantidad, max_qr)
+            archivos['json_qr'] = str(Path(tmp_dir) / 'empleados_qr.json')
+            with open(archivos['json'], 'r', encoding='utf-8') as f:
+                muestra = list(islice(json.load(f), filas_qr))
+            with open(archivos['json_qr'], 'w', encoding='utf-8') as f:
+                json.dump(muestra, f, ensure_ascii=False)
+            del muestra
+
+            # diagnosticar_qrs necesita los PNG: si no se mide la generación,
+            # se generan antes sin contarlos
+            if 'diagnosticar_qrs' in etapas and 'generar_qrs_imagenes' not in etapas:
+                print("   🔨 Generando QR codes para diagnosticar_qrs...")
+                medir_etapa('generar_qrs_imagenes', archivos, tmp_dir, filas_qr)
+
+            resultados[nombre_tamano] = {}
+            for etapa in etapas:
+                filas = filas_qr if etapa in ('generar_qrs_imagenes', 'diagnosticar_qrs') else cantidad
+                metricas = medir_etapa(etapa, archivos, tmp_dir, filas)
+                resultados[nombre_tamano][etapa] = metricas
+
+                if metricas['exito']:
+                    print(f"   ✅ {etapa:24} {metricas['segundos']:9.2f} s"
+                          f" {metricas['filas_por_segundo']:12,.0f} filas/s"
+                          f" {metricas['pico_rss_mb'] or 0:9.1f} MB")
+                else:
+                    print(f"   ❌ {etapa:24} falló")
+
+    return resultados
+
+
+def comparar_con_baseline(resultados, baseline, tolerancia=TOLERANCIA):
+    """
+    Compara los resultados contra la línea base.
+
+    Returns:
+        Lista de regresiones (texto), vacía si no hay
+    """
+    regresiones = []
+    for tamano, etapas in resultados.items():
+        for etapa, actual in etapas.items():
+            base = baseline.get(tamano, {}).get(etapa)
+            if not base or not base.get('exito'):
+                continue
+            if not actual.get('exito'):
+                regresiones.append(f"{tamano}/{etapa}: falló (antes funcionaba)")
+                continue
+
+            for metrica, unidad in (('segundos', 's'), ('pico_rss_mb', 'MB')):
+                if base.get(metrica) and actual.get(metrica):
+                    cambio = actual[metrica] / base[metrica] - 1
+                    if cambio > tolerancia:
+                        regresiones.append(
+                            f"{tamano}/{etapa}: {metrica} {base[metrica]:.2f} → "
+                            f"{actual[metrica]:.2f} {unidad} (+{cambio:.0%})"
+                        )
+    return regresiones
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    baseline_file = 'benchmark_baseline.json'
+    output_file = 'benchmark_resultados.json'
+    guardar_baseline = False
+    max_qr = 1000
+    etapas = None
+
+    if args and args[0] in ['-h', '--help']:
+        print("Uso: python benchmark_pipeline.py [tamaños] [opciones]")
+        print()
+        print("Parámetros:")
+        print("  tamaños              : 1k, 10k, 100k, 1m separados por coma (default: 1k,10k)")
+        print("  --etapas a,b         : Solo estas etapas (default: todas)")
+        print("  --max-qr N           : Empleados para las etapas de QR (default: 1000)")
+        print("  --baseline archivo   : Línea base a comparar (default: benchmark_baseline.json)")
+        print("  --guardar-baseline   : Guarda estos resultados como nueva línea base")
+        print()
+        print("Etapas: " + ", ".join(ETAPAS))
+        print()
+        print("Ejemplos:")
+        print("  python benchmark_pipeline.py")
+        print("  python benchmark_pipeline.py 1k,10k,100k --guardar-baseline")
+        print("  python benchmark_pipeline.py 100k --etapas excel_to_json,actualizar_empleados")
+        sys.exit(0)
+
+    # Opciones con valor
+    for opcion in ('--etapas', '--max-qr', '--baseline'):
+        if opcion in args:
+            i = args.index(opcion)
+            valor = args[i + 1]
+            del args[i:i + 2]
+            if opcion == '--etapas':
+                etapas = valor.split(',')
+            elif opcion == '--max-qr':
+                max_qr = int(valor)
+            else:
+                baseline_file = valor
+
+    if '--guardar-baseline' in args:
+        guardar_baseline = True
+        args.remove('--guardar-baseline')
+
+    tamanos = args[0].lower().split(',') if args else ['1k', '10k']
+
+    desconocidos = [t for t in tamanos if t not in TAMANOS] + [e for e in etapas or [] if e not in ETAPAS]
+    if desconocidos:
+        print(f"❌ Error: Valores desconocidos: {', '.join(desconocidos)}")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("  BENCHMARK DEL PIPELINE - THE MONEY CENTER")
+    print("=" * 70)
+
+    resultados = ejecutar_benchmark(tamanos, etapas, max_qr)
+
+    reporte = {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'plataforma': sys.platform,
+        'cpus': os.cpu_count(),
+        'resultados': resultados,
+    }
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
+    print(f"\n📁 Resultados: {output_file}")
+
+    regresiones = []
+    if Path(baseline_file).exists() and not guardar_baseline:
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['resultados']
+        regresiones = comparar_con_baseline(resultados, baseline)
+
+        print(f"\n📊 Comparación contra {baseline_file} (tolerancia {TOLERANCIA:.0%}):")
+        if regresiones:
+            for regresion in regresiones:
+                print(f"   ⚠️  {regresion}")
+        else:
+            print("   ✅ Sin regresiones")
+
+    if guardar_baseline:
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, ensure_ascii=False, indent=2)
+        print(f"📁 Línea base guardada: {baseline_file}")
+
+    sys.exit(1 if regresiones else 0)
+
+
+if __name__ == '__main__':
+    main()
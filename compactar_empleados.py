@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Script para compactar la exportación NDJSON en el arreglo JSON de la web.
+The Money Center - Directorio de Empleados
+
+Este script:
+1. Lee empleados.ndjson línea por línea
+2. Si un UUID aparece varias veces, conserva la última versión
+   (en la posición de su primera aparición)
+3. Genera empleados.json (arreglo con sangría, el que usa la app web)
+4. Opcionalmente reescribe el NDJSON ya compactado
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from escritores import es_ndjson, escribir_empleados
+from indice_busqueda import actualizar_indice
+from lectores import iterar_empleados
+
+
+def compactar_empleados(ndjson_file='empleados.ndjson', json_file='empleados.json', reescribir_ndjson=False):
+    """
+    Reconstruye el arreglo JSON a partir de la exportación NDJSON.
+
+    Args:
+        ndjson_file: Archivo NDJSON de entrada
+        json_file: Archivo JSON de salida (default: empleados.json)
+        reescribir_ndjson: Si True, también reescribe el NDJSON sin duplicados
+    """
+    try:
+        print("=" * 70)
+        print("  COMPACTADOR DE EMPLEADOS - THE MONEY CENTER")
+        print("=" * 70)
+        print()
+        print(f"📂 Leyendo: {ndjson_file}")
+
+        # Los dict conservan el orden de inserción: reasignar una clave
+        # existente actualiza el empleado sin moverlo de lugar
+        empleados = {}
+        lineas = 0
+        for empleado in iterar_empleados(ndjson_file):
+            empleados[empleado['id']] = empleado
+            lineas += 1
+
+        print(f"   ✓ {lineas} líneas leídas")
+
+        print(f"\n💾 Guardando {len(empleados)} empleados en {json_file}")
+        escribir_empleados(empleados.values(), json_file)
+        indice_file = actualizar_indice(empleados.values(), json_file)
+
+        if reescribir_ndjson:
+            print(f"💾 Reescribiendo {ndjson_file} sin duplicados")
+            escribir_empleados(empleados.values(), ndjson_file)
+
+        # Resumen
+        print("\n✅ Compactación completada!")
+        print("=" * 70)
+        print(f"📊 RESUMEN:")
+        print(f"   • Líneas en NDJSON:     {lineas}")
+        print(f"   • Empleados únicos:     {len(empleados)}")
+        print(f"   • Versiones reemplazadas: {lineas - len(empleados)}")
+        print(f"\n📁 Archivo generado: {json_file}")
+        if indice_file:
+            print(f"📁 Índice de búsqueda: {indice_file}")
+        print("=" * 70)
+        print()
+
+        return True
+
+    except FileNotFoundError:
+        print(f"❌ Error: No se encontró el archivo '{ndjson_file}'")
+        return False
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"❌ Error: Línea inválida en '{ndjson_file}': {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    ndjson_file = 'empleados.ndjson'
+    json_file = 'empleados.json'
+    reescribir_ndjson = False
+
+    args = sys.argv[1:]
+    if '--reescribir' in args:
+        reescribir_ndjson = True
+        args.remove('--reescribir')
+
+    if args and args[0] in ['-h', '--help']:
+        print("Uso: python compactar_empleados.py [archivo.ndjson] [archivo_salida.json] [--reescribir]")
+        print()
+        print("Parámetros:")
+        print("  archivo.ndjson      : Exportación NDJSON (default: empleados.ndjson)")
+        print("  archivo_salida.json : Arreglo JSON para la web (default: empleados.json)")
+        print("  --reescribir        : También reescribe el NDJSON sin duplicados")
+        print()
+        print("Ejemplos:")
+        print("  python compactar_empleados.py")
+        print("  python compactar_empleados.py empleados.ndjson public/empleados.json")
+        sys.exit(0)
+
+    if len(args) > 0:
+        ndjson_file = args[0]
+
+    if len(args) > 1:
+        json_file = args[1]
+
+    # Verificar archivos
+    if not Path(ndjson_file).exists():
+        print(f"❌ Error: El archivo '{ndjson_file}' no existe")
+        sys.exit(1)
+
+    if not es_ndjson(ndjson_file):
+        print(f"❌ Error: '{ndjson_file}' no es un archivo .ndjson/.jsonl")
+        sys.exit(1)
+
+    success = compactar_empleados(ndjson_file, json_file, reescribir_ndjson)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Script para construir los datos de cada franquicia desde un solo maestro.
+The Money Center - Directorio de Empleados
+
+Cada franquicia (MTY, MSN, MOD 40...) tiene su propio sitio. En lugar de
+filtrar por gerencia a mano y correr el pipeline una vez por sitio:
+
+1. Lee el maestro una sola vez y reparte a cada empleado en la primera
+   franquicia cuyo patrón de gerencia coincide
+2. Escribe por franquicia empleados.json, indice_busqueda.json y
+   revocados.bin (en <salida>/<franquicia>/)
+3. Genera los QR (con la base_url de cada franquicia) y las páginas
+   c/<id>.html de todas las franquicias en un solo grupo de procesos: el
+   tiempo total depende del número de empleados, no del de franquicias
+4. Elimina los QR y páginas de empleados que ya no son de la franquicia
+
+Archivo de franquicias (JSON), en orden de prioridad:
+
+    {
+      "mty":   {"gerencias": ["THE MONEY CENTER MTY*"],
+                "base_url": "https://usuario.github.io/credenciales-mty"},
+      "msn":   {"gerencias": ["THE MONEY CENTER MSN*", "THE MONEY CENTER MNS*"],
+                "base_url": "https://usuario.github.io/credenciales-msn"},
+      "mod40": {"gerencias": ["*MOD 40*"],
+                "base_url": "https://usuario.github.io/credenciales-mod40"}
+    }
+
+Los patrones son de tipo glob (fnmatch) y no distinguen mayúsculas.
+"""
+
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+
+from actualizar_empleados import leer_maestro
+from escritores import escribir_atomico, reemplazar_empleados
+from firma_qr import firmador_desde_argv
+from generar_credenciales_html import REGISTRO, huella_empleado, renderizar_pagina
+from generar_qrs_imagenes import crear_png_qr, sanitize_filename
+from indice_busqueda import actualizar_indice
+from lectores import EXTENSIONES, iterar_empleados
+from revocaciones import actualizar_revocaciones
+
+
+def cargar_franquicias(franquicias_file):
+    """
+    Carga el archivo de franquicias.
+
+    Returns:
+        Lista de (clave, patrones, base_url) en el orden declarado
+    """
+    with open(franquicias_file, 'r', encoding='utf-8') as f:
+        declaradas = json.load(f)
+
+    franquicias = []
+    for clave, config in declaradas.items():
+        if sanitize_filename(clave) != clave or not clave:
+            raise ValueError(f"Clave de franquicia no válida: '{clave}' (usa letras, números y _)")
+        faltantes = {'gerencias', 'base_url'} - set(config)
+        if faltantes:
+            raise ValueError(f"A la franquicia '{clave}' le faltan: {', '.join(sorted(faltantes))}")
+        patrones = [patron.upper() for patron in config['gerencias']]
+        franquicias.append((clave, patrones, config['base_url'].rstrip('/')))
+
+    return franquicias
+
+
+def franquicia_para(gerencia, franquicias):
+    """Devuelve la clave de la primera franquicia cuyo patrón coincide con la gerencia."""
+    gerencia = (gerencia or '').strip().upper()
+    for clave, patrones, _ in franquicias:
+        if any(fnmatch(gerencia, patron) for patron in patrones):
+            return clave
+    return None
+
+
+def leer_empleados_maestro(maestro_file):
+    """
+    Empleados del maestro: JSON/NDJSON, o el Excel maestro (o CSV/Parquet).
+
+    Del Excel se omiten las filas sin UUID: sus ids cambiarían en cada
+    construcción (asignarlos con actualizar_empleados.py primero).
+    """
+    if Path(maestro_file).suffix.lower() not in EXTENSIONES:
+        yield from iterar_empleados(maestro_file)
+        return
+
+    empleados, sin_uuid, _ = leer_maestro(maestro_file)
+    if sin_uuid:
+        print(f"⚠️  {len(sin_uuid)} filas sin UUID omitidas (ejecuta actualizar_empleados.py primero)")
+    omitidos = set(sin_uuid)
+    for pos, emp in enumerate(empleados):
+        if pos not in omitidos:
+            yield emp
+
+
+def escribir_si_cambio(ruta, contenido):
+    """Escribe el archivo solo si su contenido cambió; True si se escribió."""
+    if ruta.exists() and ruta.stat().st_size == len(contenido) and ruta.read_bytes() == contenido:
+        return False
+    escribir_atomico(ruta, contenido)
+    return True
+
+
+def construir_credencial(tarea):
+    """
+    Genera el QR y la página de un empleado (se ejecuta en un proceso aparte).
+
+    Args:
+        tarea: Tupla (clave, empleado, url del QR, ruta del PNG, ruta de la página)
+
+    Returns:
+        Tupla (clave, id, cambió, huella) o (clave, id, None, None) si hubo un error
+    """
+    clave, emp, url, ruta_qr, ruta_pagina = tarea
+    try:
+        png = crear_png_qr(url)
+        cambio = escribir_si_cambio(Path(ruta_qr), png)
+        pagina = renderizar_pagina(emp, png).encode('utf-8')
+        cambio = escribir_si_cambio(Path(ruta_pagina), pagina) or cambio
+        return clave, emp['id'], cambio, huella_empleado(emp, png)
+    except Exception as e:
+        print(f"❌ Error en {clave}/{emp.get('nombre', emp.get('id'))}: {str(e)}")
+        return clave, emp['id'], None, None
+
+
+def construir_franquicias(maestro_file, franquicias_file, salida='franquicias', workers=None, firmador=None):
+    """
+    Construye los datos, QR y páginas de todas las franquicias en una pasada.
+
+    Args:
+        maestro_file: Maestro de empleados (JSON, NDJSON o Excel maestro)
+        franquicias_file: Archivo JSON de franquicias
+        salida: Carpeta de salida (una subcarpeta por franquicia)
+        workers: Procesos en paralelo (default: número de CPUs)
+        firmador: Firmador de firma_qr.py para QR firmados (opcional)
+
+    Returns:
+        True si la construcción terminó sin errores
+    """
+    try:
+        franquicias = cargar_franquicias(franquicias_file)
+        base_urls = {clave: base_url for clave, _, base_url in franquicias}
+        salida_path = Path(salida)
+
+        # Una sola pasada: repartir a cada empleado en su franquicia
+        print(f"📂 Leyendo maestro: {maestro_file}")
+        particiones = {clave: [] for clave, _, _ in franquicias}
+        sin_franquicia = {}
+        for emp in leer_empleados_maestro(maestro_file):
+            clave = franquicia_para(emp.get('gerencia'), franquicias)
+            if clave is None:
+                gerencia = emp.get('gerencia') or '(sin gerencia)'
+                sin_franquicia[gerencia] = sin_franquicia.get(gerencia, 0) + 1
+            else:
+                particiones[clave].append(emp)
+
+        # Tareas de QR y páginas de todas las franquicias
+        tareas = []
+        for clave, empleados in particiones.items():
+            destino = salida_path / clave
+            (destino / 'qr_codes').mkdir(parents=True, exist_ok=True)
+            (destino / 'c').mkdir(exist_ok=True)
+            for emp in empleados:
+                url = (firmador.url(base_urls[clave], emp) if firmador
+                       else f"{base_urls[clave]}?id={emp['id']}")
+                tareas.append((clave, emp, url,
+                               destino / 'qr_codes' / f"{sanitize_filename(emp['nombre'])}.png",
+                               destino / 'c' / f"{emp['id']}.html"))
+
+        print(f"🔨 {len(tareas)} credenciales en {len(franquicias)} franquicias...\n")
+
+        resumen = {clave: {'empleados': len(empleados), 'cambios': 0, 'errores': 0, 'revocados': 0}
+                   for clave, empleados in particiones.items()}
+        registros = {clave: {} for clave in particiones}
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map envía todas las tareas de inmediato: los procesos generan
+            # QR mientras aquí se escriben los JSON de cada franquicia
+            resultados = executor.map(construir_credencial, tareas, chunksize=32)
+
+            for clave, empleados in particiones.items():
+                json_file = salida_path / clave / 'empleados.json'
+                ids_anteriores = ([emp['id'] for emp in iterar_empleados(json_file)]
+                                  if json_file.exists() else [])
+                reemplazar_empleados(empleados, json_file)
+                actualizar_indice(empleados, json_file)
+                revocaciones = actualizar_revocaciones(ids_anteriores, empleados, json_file)
+                if revocaciones:
+                    resumen[clave]['revocados'] = revocaciones['total']
+
+            for clave, emp_id, cambio, huella in resultados:
+                if cambio is None:
+                    resumen[clave]['errores'] += 1
+                    continue
+                resumen[clave]['cambios'] += cambio
+                registros[clave][emp_id] = huella
+
+        # QR y páginas de empleados que ya no son de la franquicia
+        eliminados = 0
+        for clave, empleados in particiones.items():
+            destino = salida_path / clave
+            nombres = {sanitize_filename(emp['nombre']) for emp in empleados}
+            ids = {emp['id'] for emp in empleados}
+            huerfanos = [qr for qr in (destino / 'qr_codes').glob('*.png') if qr.stem not in nombres]
+            huerfanos += [pagina for pagina in (destino / 'c').glob('*.html') if pagina.stem not in ids]
+            for archivo in huerfanos:
+                archivo.unlink()
+            eliminados += len(huerfanos)
+
+            # Mismo registro que generar_credenciales_html.py: no rehace estas páginas
+            escribir_atomico(destino / 'c' / REGISTRO,
+                             json.dumps(registros[clave], indent=2, sort_keys=True).encode('utf-8'))
+
+        # Resumen
+        errores = sum(r['errores'] for r in resumen.values())
+        print(f"{'='*70}")
+        print(f"✅ Franquicias construidas en {salida_path}/")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        for clave, r in resumen.items():
+            linea = f"   • {clave:<16} {r['empleados']:>6} empleados, {r['cambios']:>6} con cambios"
+            if r['revocados']:
+                linea += f", {r['revocados']} revocados"
+            if r['errores']:
+                linea += f", ❌ {r['errores']} errores"
+            print(linea)
+        if eliminados:
+            print(f"   • Archivos eliminados:   {eliminados}")
+        if sin_franquicia:
+            print(f"   ⚠️  Sin franquicia:       {sum(sin_franquicia.values())} empleados")
+            for gerencia, total in sorted(sin_franquicia.items()):
+                print(f"      - {gerencia}: {total}")
+        print(f"{'='*70}\n")
+
+        return errores == 0
+
+    except FileNotFoundError as e:
+        print(f"❌ Error: No se encontró el archivo {e.filename}")
+        return False
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"❌ Error: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    firmador = firmador_desde_argv(args)
+    workers = None
+
+    if len(args) < 2 or args[0] in ['-h', '--help']:
+        print("Uso: python construir_franquicias.py <maestro> <franquicias.json> [salida] [--workers N]")
+        print("                                     [--firmar[=clave.pem]] [--vigencia=AAAA-MM-DD]")
+        print()
+        print("Parámetros:")
+        print("  maestro          : empleados.json (o .ndjson) o el Excel maestro")
+        print("  franquicias.json : Patrones de gerencia y base_url de cada franquicia")
+        print("  salida           : Carpeta de salida, una subcarpeta por franquicia (default: franquicias)")
+        print("  --workers N      : Procesos en paralelo (default: número de CPUs)")
+        print("  --firmar         : QR firmados (ver firma_qr.py)")
+        print()
+        print("Ejemplos:")
+        print("  python construir_franquicias.py empleados.json franquicias.json")
+        print("  python construir_franquicias.py empleados_maestro.xlsx franquicias.json sitios --workers 4")
+        sys.exit(0 if args else 1)
+
+    if '--workers' in args:
+        pos = args.index('--workers')
+        workers = int(args[pos + 1])
+        del args[pos:pos + 2]
+
+    maestro_file = args[0]
+    franquicias_file = args[1]
+    salida = args[2] if len(args) > 2 else 'franquicias'
+
+    for archivo in (maestro_file, franquicias_file):
+        if not Path(archivo).exists():
+            print(f"❌ Error: El archivo '{archivo}' no existe")
+            sys.exit(1)
+
+    print("=" * 70)
+    print("  CONSTRUCCIÓN POR FRANQUICIA - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = construir_franquicias(maestro_file, franquicias_file, salida, workers, firmador)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,20 +8,129 @@ Este script:
 2. Lee el Excel de gerentes nuevos
 3. Genera un Excel maestro con TODOS los empleados
 4. El Excel maestro incluye una columna UUID para preservar las URLs de QR
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
 """
 
-import json
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import column_index_from_string
 import sys
 import uuid
 from pathlib import Path
 
+from lectores import iterar_empleados, leer_filas
+from metricas import SIN_METRICAS, metricas_desde_argv
+
+
+# Layout del Excel de gerentes: B=gerencia, C=nombre, D=celular, datos desde fila 4
+LAYOUT_GERENTES = {
+    'fila_inicio': 4,
+    'gerencia': 'B',
+    'nombre': 'C',
+    'celular': 'D',
+    'puesto': 'Gerente',
+}
+
+
+def leer_gerentes(excel_file, layout=None):
+    """
+    Lee empleados de un Excel según un layout de columnas/filas.
+
+    Args:
+        excel_file: Ruta al archivo Excel (o CSV/Parquet)
+        layout: Diccionario con fila_inicio, columnas (letras) de gerencia,
+                nombre y celular, y el puesto a asignar (default: LAYOUT_GERENTES)
+
+    Returns:
+        Lista de empleados con UUID nuevo
+    """
+    layout = layout or LAYOUT_GERENTES
+    col_gerencia = column_index_from_string(layout['gerencia']) - 1
+    col_nombre = column_index_from_string(layout['nombre']) - 1
+    col_celular = column_index_from_string(layout['celular']) - 1
+    puesto = layout.get('puesto', 'Gerente')
+
+    empleados = []
+    for row in leer_filas(excel_file, min_row=layout['fila_inicio']):
+        gerencia = row[col_gerencia] if len(row) > col_gerencia and row[col_gerencia] else ""
+        nombre = row[col_nombre] if len(row) > col_nombre and row[col_nombre] else ""
+        celular = row[col_celular] if len(row) > col_celular and row[col_celular] else ""
+
+        # Saltar filas vacías
+        if not nombre or not gerencia:
+            continue
+
+        # Limpiar datos
+        empleados.append({
+            'id': str(uuid.uuid4()),  # Generar UUID nuevo
+            'nombre': str(nombre).strip().upper(),
+            'puesto': puesto,
+            'gerencia': str(gerencia).strip(),
+            'celular': str(celular).strip()
+        })
+
+    return empleados
+
+
+def escribir_excel_maestro(empleados, output_file):
+    """
+    Escribe el Excel maestro (UUID, NOMBRE, PUESTO, GERENCIA, CELULAR).
+
+    Args:
+        empleados: Lista de empleados a escribir, en orden
+        output_file: Nombre del archivo Excel de salida
+    """
+    # Crear nuevo workbook
+    wb_maestro = openpyxl.Workbook()
+    ws = wb_maestro.active
+    ws.title = "Empleados"
+
+    # Estilos para encabezado
+    header_fill = PatternFill(start_color="EF4444", end_color="EF4444", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=12)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    # Encabezados
+    headers = ["UUID", "NOMBRE", "PUESTO", "GERENCIA", "CELULAR"]
+    ws.append(headers)
+
+    # Aplicar estilos a encabezados
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col_num)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+
+    # Agregar empleados
+    for emp in empleados:
+        ws.append([
+            emp.get('id', ''),
+            emp.get('nombre', ''),
+            emp.get('puesto', ''),
+            emp.get('gerencia', ''),
+            emp.get('celular', '')
+        ])
+
+    # Ajustar ancho de columnas
+    ws.column_dimensions['A'].width = 38  # UUID
+    ws.column_dimensions['B'].width = 45  # NOMBRE
+    ws.column_dimensions['C'].width = 15  # PUESTO
+    ws.column_dimensions['D'].width = 25  # GERENCIA
+    ws.column_dimensions['E'].width = 18  # CELULAR
+
+    # Congelar primera fila (encabezados)
+    ws.freeze_panes = 'A2'
+
+    # Guardar archivo
+    wb_maestro.save(output_file)
+
 
 def crear_excel_maestro(
     json_file='empleados.json',
     excel_gerentes=None,
-    output_file='empleados_maestro.xlsx'
+    output_file='empleados_maestro.xlsx',
+    metricas=None
 ):
     """
     Crea un Excel maestro combinando empleados existentes + nuevos.
@@ -30,7 +139,9 @@ def crear_excel_maestro(
         json_file: Archivo JSON con empleados actuales (con UUIDs)
         excel_gerentes: Archivo Excel con gerentes nuevos (opcional)
         output_file: Nombre del archivo Excel de salida
+        metricas: Metricas para el reporte por fase (opcional)
     """
+    metricas = metricas or SIN_METRICAS
     try:
         print("=" * 70)
         print("  CREADOR DE EXCEL MAESTRO - THE MONEY CENTER")
@@ -39,8 +150,8 @@ def crear_excel_maestro(
 
         # 1. Leer empleados actuales del JSON
         print(f"📂 Leyendo empleados actuales de: {json_file}")
-        with open(json_file, 'r', encoding='utf-8') as f:
-            empleados_actuales = json.load(f)
+        with metricas.fase('parse'):
+            empleados_actuales = list(iterar_empleados(json_file))
 
         print(f"   ✓ {len(empleados_actuales)} empleados cargados")
 
@@ -48,93 +159,18 @@ def crear_excel_maestro(
         empleados_nuevos = []
         if excel_gerentes:
             print(f"\n📂 Leyendo gerentes nuevos de: {excel_gerentes}")
-            wb = openpyxl.load_workbook(excel_gerentes)
-            sheet = wb.active
-
-            for idx, row in enumerate(sheet.iter_rows(min_row=4, values_only=True), start=4):
-                # Columnas: B=gerencia (índice 1), C=nombre (índice 2), D=celular (índice 3)
-                gerencia = row[1] if len(row) > 1 and row[1] else ""
-                nombre = row[2] if len(row) > 2 and row[2] else ""
-                celular = row[3] if len(row) > 3 and row[3] else ""
-
-                # Saltar filas vacías
-                if not nombre or not gerencia:
-                    continue
-
-                # Limpiar datos
-                nombre = str(nombre).strip().upper()
-                gerencia = str(gerencia).strip()
-                celular = str(celular).strip()
-
-                empleados_nuevos.append({
-                    'id': str(uuid.uuid4()),  # Generar UUID nuevo
-                    'nombre': nombre,
-                    'puesto': 'Gerente',
-                    'gerencia': gerencia,
-                    'celular': celular
-                })
-
+            with metricas.fase('parse'):
+                empleados_nuevos = leer_gerentes(excel_gerentes)
             print(f"   ✓ {len(empleados_nuevos)} gerentes nuevos cargados")
 
         # 3. Crear Excel maestro
         print(f"\n📝 Creando Excel maestro...")
-
-        # Crear nuevo workbook
-        wb_maestro = openpyxl.Workbook()
-        ws = wb_maestro.active
-        ws.title = "Empleados"
-
-        # Estilos para encabezado
-        header_fill = PatternFill(start_color="EF4444", end_color="EF4444", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Encabezados
-        headers = ["UUID", "NOMBRE", "PUESTO", "GERENCIA", "CELULAR"]
-        ws.append(headers)
-
-        # Aplicar estilos a encabezados
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-
-        # Agregar empleados actuales
-        for emp in empleados_actuales:
-            ws.append([
-                emp.get('id', ''),
-                emp.get('nombre', ''),
-                emp.get('puesto', ''),
-                emp.get('gerencia', ''),
-                emp.get('celular', '')
-            ])
-
-        # Agregar empleados nuevos
-        for emp in empleados_nuevos:
-            ws.append([
-                emp.get('id', ''),
-                emp.get('nombre', ''),
-                emp.get('puesto', ''),
-                emp.get('gerencia', ''),
-                emp.get('celular', '')
-            ])
-
-        # Ajustar ancho de columnas
-        ws.column_dimensions['A'].width = 38  # UUID
-        ws.column_dimensions['B'].width = 45  # NOMBRE
-        ws.column_dimensions['C'].width = 15  # PUESTO
-        ws.column_dimensions['D'].width = 25  # GERENCIA
-        ws.column_dimensions['E'].width = 18  # CELULAR
-
-        # Congelar primera fila (encabezados)
-        ws.freeze_panes = 'A2'
-
-        # Guardar archivo
-        wb_maestro.save(output_file)
+        with metricas.fase('write'):
+            escribir_excel_maestro(empleados_actuales + empleados_nuevos, output_file)
 
         # Resumen
         total_empleados = len(empleados_actuales) + len(empleados_nuevos)
+        metricas.contar(total_empleados)
         print(f"\n✅ Excel maestro creado exitosamente!")
         print("=" * 70)
         print(f"📊 RESUMEN:")
@@ -170,11 +206,12 @@ def main():
     json_file = 'empleados.json'
     excel_gerentes = None
     output_file = 'empleados_maestro.xlsx'
+    metricas = metricas_desde_argv(sys.argv, 'crear_excel_maestro')
 
     # Procesar argumentos
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
-            print("Uso: python crear_excel_maestro.py [excel_gerentes] [output_file]")
+            print("Uso: python crear_excel_maestro.py [excel_gerentes] [output_file] [--metricas] [--perfil]")
             print()
             print("Parámetros:")
             print("  excel_gerentes : Archivo Excel con gerentes nuevos (opcional)")
@@ -202,7 +239,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar
-    success = crear_excel_maestro(json_file, excel_gerentes, output_file)
+    success = crear_excel_maestro(json_file, excel_gerentes, output_file, metricas)
+    metricas.guardar()
 
     sys.exit(0 if success else 1)
 
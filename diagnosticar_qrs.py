@@ -4,14 +4,22 @@ Script para diagnosticar QR codes con UUIDs incorrectos.
 The Money Center - Directorio de Empleados
 
 Encuentra QR codes que apuntan a UUIDs que no existen en empleados.json
+Lee empleados.json (o su variante NDJSON) de forma incremental.
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
+Con --silencioso / --log controla el reporte de progreso (ver progreso.py).
 """
 
-import json
-import qrcode
 from pathlib import Path
 from PIL import Image
 import re
 
+from escritores import escribir_atomico
+from generar_qrs_imagenes import crear_png_qr
+from lectores import iterar_empleados
+from metricas import SIN_METRICAS, metricas_desde_argv
+from progreso import Progreso, progreso_desde_argv
+
 
 def sanitize_filename(name):
     """Convierte nombre a nombre de archivo."""
@@ -48,32 +56,48 @@ def extract_uuid_from_qr(qr_path):
         return None
 
 
-def diagnosticar_qrs(json_file='empleados.json', qr_dir='public/qr_codes', base_url=None):
+def diagnosticar_qrs(json_file='empleados.json', qr_dir='public/qr_codes', base_url=None, metricas=None,
+                     opciones_progreso=None):
     """Diagnostica y corrige QR codes problemáticos."""
+    metricas = metricas or SIN_METRICAS
+    opciones_progreso = opciones_progreso or {}
     try:
         print("=" * 70)
         print("  DIAGNÓSTICO DE QR CODES - THE MONEY CENTER")
         print("=" * 70)
         print()
 
-        # Cargar empleados del JSON
-        print(f"📂 Leyendo {json_file}...")
-        with open(json_file, 'r', encoding='utf-8') as f:
-            empleados = json.load(f)
-
-        # Crear mapas de empleados
-        empleados_por_uuid = {emp['id']: emp for emp in empleados}
-        empleados_por_nombre = {emp['nombre']: emp for emp in empleados}
-
-        print(f"   ✓ {len(empleados)} empleados en JSON")
-
         # Verificar QR codes
         qr_path = Path(qr_dir)
         if not qr_path.exists():
             print(f"❌ Error: No existe el directorio {qr_dir}")
             return False
 
-        qr_files = list(qr_path.glob('*.png'))
+        # Un solo listado del directorio: nombre de archivo (sin extensión) → archivo
+        qr_files = {qr_file.stem: qr_file for qr_file in qr_path.glob('*.png')}
+
+        # Leer empleados de forma incremental (JSON o NDJSON). Solo se guardan
+        # los nombres normalizados y los empleados sin QR, no el archivo completo.
+        print(f"📂 Leyendo {json_file}...")
+        print(f"\n🔍 Buscando empleados sin QR code...\n")
+
+        nombres_archivo = set()
+        empleados_sin_qr = []
+        total_empleados = 0
+        revision = Progreso("Revisando empleados", **opciones_progreso)
+
+        for emp in metricas.iterar('parse', iterar_empleados(json_file)):
+            total_empleados += 1
+            metricas.contar()
+            revision.avanzar()
+            nombre_archivo = sanitize_filename(emp['nombre'])
+            nombres_archivo.add(nombre_archivo)
+            if nombre_archivo not in qr_files:
+                empleados_sin_qr.append(emp)
+                # Se regeneran más abajo: solo se registran en el log
+                revision.registrar('falta_qr', nombre=emp['nombre'], id=emp['id'])
+
+        print(f"\n   ✓ {total_empleados} empleados en JSON")
         print(f"   ✓ {len(qr_files)} QR codes encontrados")
         print()
 
@@ -82,34 +106,15 @@ def diagnosticar_qrs(json_file='empleados.json', qr_dir='public/qr_codes', base_
 
         qrs_correctos = []
         qrs_huerfanos = []
-        qrs_a_regenerar = []
-
-        for qr_file in qr_files:
-            nombre_archivo = qr_file.stem  # Nombre sin extensión
 
-            # Buscar empleado por nombre normalizado
-            empleado_encontrado = None
-            for nombre, emp in empleados_por_nombre.items():
-                if sanitize_filename(nombre) == nombre_archivo:
-                    empleado_encontrado = emp
-                    break
-
-            if empleado_encontrado:
-                qrs_correctos.append((qr_file.name, empleado_encontrado['nombre']))
+        for nombre_archivo, qr_file in sorted(qr_files.items()):
+            if nombre_archivo in nombres_archivo:
+                qrs_correctos.append(qr_file.name)
             else:
                 qrs_huerfanos.append(qr_file.name)
-                print(f"⚠️  QR huérfano (empleado no existe): {qr_file.name}")
-
-        # Buscar empleados sin QR code
-        print(f"\n🔍 Buscando empleados sin QR code...\n")
+                revision.aviso(f"QR huérfano (empleado no existe): {qr_file.name}", archivo=qr_file.name)
 
-        empleados_sin_qr = []
-        for emp in empleados:
-            nombre_archivo = sanitize_filename(emp['nombre']) + '.png'
-            qr_existe = (qr_path / nombre_archivo).exists()
-            if not qr_existe:
-                empleados_sin_qr.append(emp)
-                print(f"❌ Falta QR: {emp['nombre']} (UUID: {emp['id'][:8]}...)")
+        revision.terminar()
 
         # Resumen
         print("\n" + "=" * 70)
@@ -127,28 +132,22 @@ def diagnosticar_qrs(json_file='empleados.json', qr_dir='public/qr_codes', base_
             if not base_url:
                 base_url = "https://ramz0.github.io/credenciales-empleados"
 
-            for idx, emp in enumerate(empleados_sin_qr, 1):
+            progreso = Progreso("Generando QR faltantes", len(empleados_sin_qr), **opciones_progreso)
+            for emp in empleados_sin_qr:
                 try:
                     url = f"{base_url}?id={emp['id']}"
 
-                    qr = qrcode.QRCode(
-                        version=1,
-                        error_correction=qrcode.constants.ERROR_CORRECT_H,
-                        box_size=10,
-                        border=4,
-                    )
-                    qr.add_data(url)
-                    qr.make(fit=True)
-
-                    img = qr.make_image(fill_color="black", back_color="white")
+                    png = crear_png_qr(url, metricas)
                     filename = sanitize_filename(emp['nombre']) + '.png'
                     filepath = qr_path / filename
-                    img.save(filepath)
+                    with metricas.fase('write'):
+                        escribir_atomico(filepath, png)
 
-                    print(f"✅ [{idx}/{len(empleados_sin_qr)}] {emp['nombre']}")
+                    progreso.avanzar(nombre=emp['nombre'], archivo=filename)
 
                 except Exception as e:
-                    print(f"❌ Error generando QR para {emp['nombre']}: {e}")
+                    progreso.error(f"Error generando QR para {emp['nombre']}: {e}", nombre=emp['nombre'])
+            progreso.terminar()
 
             print("\n✅ QR codes regenerados exitosamente!")
 
@@ -160,8 +159,8 @@ def diagnosticar_qrs(json_file='empleados.json', qr_dir='public/qr_codes', base_
         print("\n📋 PRÓXIMOS PASOS:")
         if len(empleados_sin_qr) > 0:
             print(f"   1. Se regeneraron {len(empleados_sin_qr)} QR codes")
-            print(f"   2. Copia los QR actualizados:")
-            print(f"      cp -r {qr_dir}/* public/qr_codes/")
+            print(f"   2. Publica los QR actualizados:")
+            print(f"      python publicar.py {json_file} {qr_dir} public")
             print(f"   3. Build y deploy")
         else:
             print("   ✅ Todos los QR codes están correctos!")
@@ -183,10 +182,17 @@ def main():
     json_file = 'empleados.json'
     qr_dir = 'public/qr_codes'
     base_url = None
+    metricas = metricas_desde_argv(sys.argv, 'diagnosticar_qrs')
+    opciones_progreso = progreso_desde_argv(sys.argv, 'diagnosticar_qrs')
 
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
-            print("Uso: python diagnosticar_qrs.py [json_file] [qr_dir] [base_url]")
+            print("Uso: python diagnosticar_qrs.py [json_file] [qr_dir] [base_url] [opciones]")
+            print()
+            print("Opciones:")
+            print("  --metricas / --perfil : Reporte de tiempo por fase (ver metricas.py)")
+            print("  --silencioso          : Sin contador de progreso (solo avisos, errores y resumen)")
+            print("  --log                 : Registro JSONL (progreso_diagnosticar_qrs.jsonl)")
             print()
             print("Ejemplos:")
             print("  python diagnosticar_qrs.py")
@@ -200,7 +206,8 @@ def main():
     if len(sys.argv) > 3:
         base_url = sys.argv[3]
 
-    success = diagnosticar_qrs(json_file, qr_dir, base_url)
+    success = diagnosticar_qrs(json_file, qr_dir, base_url, metricas, opciones_progreso)
+    metricas.guardar()
     sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Escritores de la exportación de empleados (JSON o NDJSON).
+The Money Center - Directorio de Empleados
+
+El formato se elige por la extensión del archivo de salida:
+
+- .json:            arreglo JSON con sangría (el que usa la app web)
+- .ndjson / .jsonl: un empleado por línea; permite agregar empleados al
+                    final sin reescribir el archivo y leerlo línea por línea
+- .db / .sqlite:    almacén SQLite indexado (ver almacen_sqlite.py); solo
+                    se escriben las diferencias
+
+compactar_empleados.py reconstruye el arreglo JSON a partir del NDJSON.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from almacen_sqlite import abrir_almacen, agregar_empleados_db, es_sqlite, guardar_empleados
+from lectores import EXTENSIONES_NDJSON
+
+
+def es_ndjson(ruta):
+    """Indica si la ruta corresponde a una exportación NDJSON."""
+    return Path(ruta).suffix.lower() in EXTENSIONES_NDJSON
+
+
+def linea_ndjson(empleado):
+    """Serializa un empleado como una línea NDJSON (con salto de línea)."""
+    return json.dumps(empleado, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def escribir_empleados(empleados, ruta):
+    """
+    Escribe la exportación completa de empleados.
+
+    Args:
+        empleados: Iterable de empleados (se recorre una sola vez)
+        ruta: Archivo de salida (.json, .ndjson/.jsonl o .db/.sqlite)
+
+    Returns:
+        Número de empleados escritos
+    """
+    if es_sqlite(ruta):
+        conn = abrir_almacen(ruta)
+        try:
+            return guardar_empleados(conn, empleados)['total']
+        finally:
+            conn.close()
+
+    total = 0
+    with open(ruta, 'w', encoding='utf-8') as f:
+        if es_ndjson(ruta):
+            for empleado in empleados:
+                f.write(linea_ndjson(empleado))
+                total += 1
+        else:
+            empleados = list(empleados)
+            json.dump(empleados, f, ensure_ascii=False, indent=2)
+            total = len(empleados)
+    return total
+
+
+def fsync_archivo(ruta):
+    """Fuerza a disco el contenido de un archivo ya escrito."""
+    with open(ruta, 'rb') as f:
+        os.fsync(f.fileno())
+
+
+def fsync_directorio(ruta):
+    """Fuerza a disco las entradas de una carpeta (el renombrado); no aplica en Windows."""
+    if os.name == 'nt':
+        return
+    fd = os.open(ruta, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def escribir_atomico(ruta, contenido, forzar=False):
+    """
+    Escribe bytes en un temporal de la misma carpeta y lo renombra sobre la ruta.
+
+    Quien lea el archivo (o un enlace duro suyo en public/) ve siempre el
+    contenido anterior completo o el nuevo completo, nunca uno a medias.
+
+    Args:
+        ruta: Archivo de salida
+        contenido: Bytes a escribir
+        forzar: Forzar a disco el archivo y el renombrado (más lento)
+    """
+    ruta = Path(ruta)
+    fd, temporal = tempfile.mkstemp(dir=ruta.parent, prefix=f'.{ruta.stem}.', suffix=ruta.suffix)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contenido)
+            if forzar:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temporal, 0o644)  # mkstemp crea el archivo con permisos 0600
+        os.replace(temporal, ruta)
+        if forzar:
+            fsync_directorio(ruta.parent)
+    except BaseException:
+        Path(temporal).unlink(missing_ok=True)
+        raise
+
+
+def reemplazar_empleados(empleados, ruta):
+    """
+    Escribe la exportación completa sin dejar nunca un archivo a medio escribir.
+
+    Se escribe un archivo temporal en la misma carpeta, se fuerza a disco y
+    se renombra sobre la ruta final (os.replace es atómico), así quien lea
+    el archivo mientras tanto (o después de un corte de luz) ve la versión
+    anterior completa o la nueva completa.
+
+    Returns:
+        Número de empleados escritos
+    """
+    ruta = Path(ruta)
+    if es_sqlite(ruta):
+        return escribir_empleados(empleados, ruta)
+
+    fd, temporal = tempfile.mkstemp(dir=ruta.parent, prefix=f'.{ruta.stem}.', suffix=ruta.suffix)
+    os.close(fd)
+    try:
+        total = escribir_empleados(empleados, temporal)
+        fsync_archivo(temporal)
+        os.chmod(temporal, 0o644)  # mkstemp crea el archivo con permisos 0600
+        os.replace(temporal, ruta)
+        fsync_directorio(ruta.parent)
+    except BaseException:
+        Path(temporal).unlink(missing_ok=True)
+        raise
+    return total
+
+
+def agregar_empleados(empleados, ruta):
+    """
+    Agrega empleados al final de una exportación NDJSON o SQLite existente.
+
+    Args:
+        empleados: Iterable de empleados a agregar
+        ruta: Archivo NDJSON (.ndjson/.jsonl) o base SQLite (.db/.sqlite)
+
+    Returns:
+        Número de empleados agregados
+    """
+    if es_sqlite(ruta):
+        conn = abrir_almacen(ruta)
+        try:
+            return agregar_empleados_db(conn, empleados)
+        finally:
+            conn.close()
+
+    if not es_ndjson(ruta):
+        raise ValueError(f"Solo se puede agregar a archivos NDJSON o SQLite: {ruta}")
+
+    total = 0
+    with open(ruta, 'a', encoding='utf-8') as f:
+        for empleado in empleados:
+            f.write(linea_ndjson(empleado))
+            total += 1
+    return total
@@ -3,42 +3,49 @@
 Script para convertir archivo Excel de empleados a formato JSON.
 The Money Center - Directorio de Empleados
 
+Acepta también exportaciones CSV o Parquet con las mismas columnas
+(ver lectores.py).
+
 Estructura del Excel:
 - Columna D: GERENCIA
 - Columna E: NOMBRE DEL ASESOR
 - Columna F: NO DE CELULAR
 - Fila 1: encabezados
 - Datos desde fila 2
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
 """
 
-import json
-import openpyxl
 import sys
 import uuid
 from pathlib import Path
 
+from escritores import escribir_empleados
+from lectores import leer_filas
+from metricas import SIN_METRICAS, metricas_desde_argv
+
 
-def excel_to_json(excel_file, json_file='empleados.json'):
+def excel_to_json(excel_file, json_file='empleados.json', metricas=None):
     """
     Convierte un archivo Excel de empleados a formato JSON.
 
     Args:
-        excel_file: Ruta al archivo Excel
-        json_file: Ruta al archivo JSON de salida (default: empleados.json)
+        excel_file: Ruta al archivo Excel (o CSV/Parquet)
+        json_file: Ruta al archivo JSON de salida (default: empleados.json),
+                   o .ndjson para un empleado por línea
+        metricas: Metricas para el reporte por fase (opcional)
     """
+    metricas = metricas or SIN_METRICAS
     try:
-        print(f"📂 Abriendo archivo Excel: {excel_file}")
-
-        # Cargar el archivo Excel
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
+        print(f"📂 Abriendo archivo: {excel_file}")
 
         empleados = []
         filas_procesadas = 0
         filas_con_error = 0
 
         # Iterar desde la fila 3 (la fila 1 y 2 son encabezados)
-        for idx, row in enumerate(sheet.iter_rows(min_row=3, values_only=True), start=3):
+        filas = metricas.iterar('parse', leer_filas(excel_file, min_row=3), cuerpo='transform')
+        for idx, row in enumerate(filas, start=3):
             try:
                 # Columnas: D=3, E=4, F=5 (índice 0-based)
                 gerencia = row[3] if len(row) > 3 and row[3] else ""
@@ -68,6 +75,7 @@ def excel_to_json(excel_file, json_file='empleados.json'):
 
                 empleados.append(empleado)
                 filas_procesadas += 1
+                metricas.contar()
 
             except Exception as e:
                 filas_con_error += 1
@@ -77,8 +85,8 @@ def excel_to_json(excel_file, json_file='empleados.json'):
         # Guardar a JSON
         print(f"\n💾 Guardando {len(empleados)} empleados en {json_file}")
 
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(empleados, f, ensure_ascii=False, indent=2)
+        with metricas.fase('write'):
+            escribir_empleados(empleados, json_file)
 
         # Resumen
         print("\n✅ Conversión completada exitosamente!")
@@ -104,13 +112,18 @@ def main():
     print("=" * 60)
     print()
 
+    metricas = metricas_desde_argv(sys.argv, 'excel_to_json')
+
     # Verificar argumentos
     if len(sys.argv) < 2:
-        print("Uso: python excel_to_json.py <archivo_excel.xlsx> [archivo_salida.json]")
+        print("Uso: python excel_to_json.py <archivo_excel.xlsx|.csv|.parquet> [archivo_salida.json] [--metricas] [--perfil]")
         print()
         print("Ejemplo:")
         print("  python excel_to_json.py empleados.xlsx")
         print("  python excel_to_json.py empleados.xlsx empleados.json")
+        print("  python excel_to_json.py empleados.csv empleados.json")
+        print("  python excel_to_json.py empleados.xlsx empleados.ndjson")
+        print("  python excel_to_json.py empleados.xlsx empleados.json --perfil")
         sys.exit(1)
 
     excel_file = sys.argv[1]
@@ -122,7 +135,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar conversión
-    success = excel_to_json(excel_file, json_file)
+    success = excel_to_json(excel_file, json_file, metricas)
+    metricas.guardar()
 
     sys.exit(0 if success else 1)
 
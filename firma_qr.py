@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+QR firmados: verificación de una credencial sin conexión.
+The Money Center - Directorio de Empleados
+
+Un QR normal solo lleva `?id=<uuid>`; para saber si es válido hay que
+descargar el directorio y buscar al empleado. En modo firmado el QR lleva
+además un token `t` con los datos mínimos de la credencial firmados con
+Ed25519:
+
+    https://.../credenciales-empleados?id=<uuid>&t=<token>
+
+Token (base64url sin relleno) = datos + firma (64 bytes). Datos:
+
+    byte 0       versión (1)
+    bytes 1-16   UUID del empleado
+    bytes 17-24  sha256 del nombre normalizado (8 bytes)
+    bytes 25-26  válido desde (días desde 1970-01-01, big-endian)
+    bytes 27-28  válido hasta (ídem, inclusive)
+    bytes 29-    puesto (UTF-8)
+
+El nombre normalizado es el de indice_busqueda.normalizar con los espacios
+colapsados ("José  PÉREZ" → "jose perez"), igual que hashNombre en
+src/utils/firmaQr.ts. Verificar es decodificar el token y comprobar una
+firma: mismo costo para cualquier tamaño de directorio y sin red.
+
+La clave privada (firma_qr.pem) nunca se publica; la pública se publica
+en public/firma_qr.json para la web:
+
+    python firma_qr.py claves
+    python generar_qrs_imagenes.py public/empleados.json public/qr_codes --firmar
+    python firma_qr.py verificar "<url del QR o token>"
+
+Requiere el paquete cryptography (pip install cryptography), solo en
+este modo.
+"""
+
+import base64
+import hashlib
+import json
+import struct
+import sys
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from indice_busqueda import normalizar
+from revocaciones import NOMBRE_FILTRO, cargar_filtro, esta_revocado
+
+
+CLAVE_PRIVADA = 'firma_qr.pem'
+CLAVE_PUBLICA = 'public/firma_qr.json'
+
+VERSION_TOKEN = 1
+
+_CABECERA = struct.Struct('>B16s8sHH')
+LONGITUD_FIRMA = 64
+_EPOCA = date(1970, 1, 1)
+
+
+def _ed25519():
+    """Módulo ed25519 de cryptography, o None si no está instalado (dependencia opcional)."""
+    try:
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+    except ImportError:
+        return None
+    return ed25519
+
+
+def _requerir_ed25519():
+    ed25519 = _ed25519()
+    if ed25519 is None:
+        raise RuntimeError("El modo firmado requiere cryptography (pip install cryptography)")
+    return ed25519
+
+
+def _b64url(datos):
+    return base64.urlsafe_b64encode(datos).rstrip(b'=').decode('ascii')
+
+
+def _desde_b64url(texto):
+    return base64.urlsafe_b64decode(texto + '=' * (-len(texto) % 4))
+
+
+def _dias(fecha):
+    return (fecha - _EPOCA).days
+
+
+def hash_nombre(nombre):
+    """Primeros 8 bytes del sha256 del nombre normalizado."""
+    texto = ' '.join(normalizar(nombre).split())
+    return hashlib.sha256(texto.encode('utf-8')).digest()[:8]
+
+
+def vigencia_por_defecto(hoy=None):
+    """Del 1 de enero de este año al 31 de diciembre del siguiente (como "2026-2027")."""
+    hoy = hoy or date.today()
+    return date(hoy.year, 1, 1), date(hoy.year + 1, 12, 31)
+
+
+def generar_claves(privada_file=CLAVE_PRIVADA, publica_file=CLAVE_PUBLICA):
+    """
+    Crea un par de claves Ed25519.
+
+    Args:
+        privada_file: PEM de la clave privada (no publicar)
+        publica_file: JSON con la clave pública para la web
+
+    Returns:
+        True si se crearon, False si la clave privada ya existe
+    """
+    from cryptography.hazmat.primitives import serialization
+
+    ed25519 = _requerir_ed25519()
+    if Path(privada_file).exists():
+        print(f"⚠️  Ya existe {privada_file}; bórrala a mano si quieres otra clave")
+        print("   (los QR firmados con la clave anterior dejarán de ser válidos)")
+        return False
+
+    privada = ed25519.Ed25519PrivateKey.generate()
+    Path(privada_file).write_bytes(privada.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    Path(privada_file).chmod(0o600)
+
+    publica = privada.public_key().public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+    Path(publica_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(publica_file, 'w', encoding='utf-8') as f:
+        json.dump({'alg': 'Ed25519', 'clave': _b64url(publica)}, f, indent=2)
+        f.write('\n')
+
+    print(f"🔑 Clave privada: {privada_file} (no la subas al repositorio)")
+    print(f"📁 Clave pública: {publica_file}")
+    return True
+
+
+def cargar_clave_publica(publica_file=CLAVE_PUBLICA):
+    """Clave pública Ed25519 desde el JSON publicado."""
+    ed25519 = _requerir_ed25519()
+    with open(publica_file, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+    return ed25519.Ed25519PublicKey.from_public_bytes(_desde_b64url(datos['clave']))
+
+
+class Firmador:
+    """Firma los tokens de un lote de QR con la misma clave y vigencia."""
+
+    def __init__(self, privada_file=CLAVE_PRIVADA, desde=None, hasta=None):
+        from cryptography.hazmat.primitives import serialization
+
+        _requerir_ed25519()
+        self.clave = serialization.load_pem_private_key(Path(privada_file).read_bytes(), password=None)
+        inicio, fin = vigencia_por_defecto()
+        self.desde = desde or inicio
+        self.hasta = hasta or fin
+        if self.hasta < self.desde:
+            raise ValueError("La vigencia termina antes de empezar")
+
+    def token(self, empleado):
+        """Token firmado de un empleado (id, hash del nombre, puesto y vigencia)."""
+        datos = _CABECERA.pack(
+            VERSION_TOKEN,
+            uuid.UUID(empleado['id']).bytes,
+            hash_nombre(empleado.get('nombre', '')),
+            _dias(self.desde),
+            _dias(self.hasta),
+        ) + (empleado.get('puesto') or '').encode('utf-8')
+        return _b64url(datos + self.clave.sign(datos))
+
+    def url(self, base_url, empleado):
+        """URL del QR con el token firmado."""
+        return f"{base_url}?id={empleado['id']}&t={self.token(empleado)}"
+
+
+def firmador_desde_argv(argv):
+    """
+    Extrae --firmar[=clave.pem] y --vigencia=AAAA-MM-DD[:AAAA-MM-DD] de argv
+    (los quita de la lista).
+
+    Returns:
+        Firmador si se pidió --firmar, o None
+    """
+    privada_file = None
+    desde = hasta = None
+
+    for arg in list(argv):
+        nombre, _, valor = arg.partition('=')
+        if nombre == '--firmar':
+            privada_file = valor or CLAVE_PRIVADA
+            argv.remove(arg)
+        elif nombre == '--vigencia':
+            inicio, _, fin = valor.rpartition(':')
+            hasta = date.fromisoformat(fin)
+            desde = date.fromisoformat(inicio) if inicio else None
+            argv.remove(arg)
+
+    if privada_file is None:
+        return None
+    firmador = Firmador(privada_file, desde, hasta)
+    print(f"🔏 QR firmados: vigencia {firmador.desde.isoformat()} a {firmador.hasta.isoformat()}")
+    return firmador
+
+
+def token_de_url(texto):
+    """Token de una URL de QR (o el texto tal cual si ya es un token)."""
+    if '://' in texto or texto.startswith('?'):
+        return parse_qs(urlparse(texto).query).get('t', [''])[0]
+    return texto
+
+
+def verificar_token(token, clave_publica, hoy=None):
+    """
+    Verifica un token firmado sin consultar el directorio.
+
+    Args:
+        token: Token del parámetro `t` del QR
+        clave_publica: Ed25519PublicKey (cargar_clave_publica)
+        hoy: Fecha de referencia para la vigencia (default: hoy)
+
+    Returns:
+        Diccionario con 'valido', 'motivo' (None, 'formato', 'firma',
+        'no_vigente' o 'vencido') y, si el formato es correcto, 'id',
+        'hash_nombre', 'puesto', 'desde' y 'hasta'
+    """
+    from cryptography.exceptions import InvalidSignature
+
+    try:
+        crudo = _desde_b64url(token)
+    except (ValueError, TypeError):
+        return {'valido': False, 'motivo': 'formato'}
+    if len(crudo) < _CABECERA.size + LONGITUD_FIRMA:
+        return {'valido': False, 'motivo': 'formato'}
+
+    datos, firma = crudo[:-LONGITUD_FIRMA], crudo[-LONGITUD_FIRMA:]
+    version, id_bytes, nombre_hash, desde, hasta = _CABECERA.unpack_from(datos)
+    if version != VERSION_TOKEN:
+        return {'valido': False, 'motivo': 'formato'}
+
+    try:
+        clave_publica.verify(firma, datos)
+    except InvalidSignature:
+        return {'valido': False, 'motivo': 'firma'}
+
+    try:
+        puesto = datos[_CABECERA.size:].decode('utf-8')
+    except UnicodeDecodeError:
+        return {'valido': False, 'motivo': 'formato'}
+
+    resultado = {
+        'valido': True,
+        'motivo': None,
+        'id': str(uuid.UUID(bytes=id_bytes)),
+        'hash_nombre': nombre_hash.hex(),
+        'puesto': puesto,
+        'desde': _EPOCA + timedelta(days=desde),
+        'hasta': _EPOCA + timedelta(days=hasta),
+    }
+    hoy = hoy or date.today()
+    if hoy < resultado['desde']:
+        resultado.update(valido=False, motivo='no_vigente')
+    elif hoy > resultado['hasta']:
+        resultado.update(valido=False, motivo='vencido')
+    return resultado
+
+
+def coincide_nombre(resultado, nombre):
+    """True si el nombre corresponde al hash del token verificado."""
+    return resultado.get('hash_nombre') == hash_nombre(nombre).hex()
+
+
+MOTIVOS = {
+    'formato': 'el QR no contiene un token firmado válido',
+    'firma': 'la firma no corresponde (QR alterado o de otra clave)',
+    'no_vigente': 'la credencial todavía no es vigente',
+    'vencido': 'la credencial está vencida',
+}
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+
+    if not args or args[0] in ['-h', '--help']:
+        print("Uso:")
+        print("  python firma_qr.py claves [clave_privada] [clave_publica]")
+        print("  python firma_qr.py verificar <url_o_token> [clave_publica] [nombre]")
+        print()
+        print("Parámetros:")
+        print(f"  clave_privada : PEM para firmar (default: {CLAVE_PRIVADA}, no publicar)")
+        print(f"  clave_publica : JSON para verificar (default: {CLAVE_PUBLICA})")
+        print("  nombre        : Comprueba además que el token corresponda a este nombre")
+        print(f"  (si hay un {NOMBRE_FILTRO} junto a la clave pública, también se revisa)")
+        print()
+        print("Para generar QR firmados: --firmar[=clave.pem] [--vigencia=AAAA-MM-DD[:AAAA-MM-DD]]")
+        print("en generar_qrs_imagenes.py o generar_qrs_faltantes.py")
+        sys.exit(0)
+
+    if _ed25519() is None:
+        print("❌ Error: el modo firmado requiere cryptography (pip install cryptography)")
+        sys.exit(1)
+
+    comando = args[0]
+    if comando == 'claves':
+        privada_file = args[1] if len(args) > 1 else CLAVE_PRIVADA
+        publica_file = args[2] if len(args) > 2 else CLAVE_PUBLICA
+        sys.exit(0 if generar_claves(privada_file, publica_file) else 1)
+
+    if comando == 'verificar' and len(args) > 1:
+        publica_file = args[2] if len(args) > 2 else CLAVE_PUBLICA
+        resultado = verificar_token(token_de_url(args[1]), cargar_clave_publica(publica_file))
+
+        print("=" * 70)
+        if resultado['valido']:
+            print("✅ Firma válida")
+        else:
+            print(f"❌ No válido: {MOTIVOS[resultado['motivo']]}")
+        if 'id' in resultado:
+            print(f"   • ID:       {resultado['id']}")
+            print(f"   • Puesto:   {resultado['puesto']}")
+            print(f"   • Vigencia: {resultado['desde'].isoformat()} a {resultado['hasta'].isoformat()}")
+        if len(args) > 3 and 'id' in resultado:
+            if coincide_nombre(resultado, args[3]):
+                print(f"   • Nombre:   coincide con \"{args[3]}\"")
+            else:
+                print(f"   ⚠️  El nombre \"{args[3]}\" NO corresponde a este QR")
+                resultado['valido'] = False
+        filtro_file = Path(publica_file).with_name(NOMBRE_FILTRO)
+        if 'id' in resultado and filtro_file.exists() and esta_revocado(cargar_filtro(filtro_file), resultado['id']):
+            print(f"   ⚠️  Credencial REVOCADA ({filtro_file})")
+            resultado['valido'] = False
+        print("=" * 70)
+        sys.exit(0 if resultado['valido'] else 1)
+
+    print(f"❌ Comando no reconocido: {' '.join(args)}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
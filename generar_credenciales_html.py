@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Script para generar una página HTML estática por empleado.
+The Money Center - Directorio de Empleados
+
+Por cada empleado de empleados.json escribe public/c/<id>.html con los
+datos y el QR (PNG en base64) dentro del mismo archivo, y el CSS en línea.
+Al escanear un QR la credencial se muestra con una sola petición, sin
+descargar la aplicación React ni el JSON completo.
+
+- Solo se reescriben las páginas de empleados que cambiaron (hash de los
+  datos, del QR y de la plantilla en c/.credenciales.json)
+- Las páginas de empleados que ya no existen se eliminan
+- Las páginas se generan en paralelo (ProcessPoolExecutor)
+
+index.html redirige `?id=<id>` a `c/<id>.html` en producción, así los QR
+ya impresos también abren la página estática. Si la página no existe,
+public/404.html (y el service worker) abren la aplicación con
+`?id=<id>&spa=1`. El enlace "Ver en el
+directorio" de cada página abre la aplicación completa.
+"""
+
+import base64
+import hashlib
+import html
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from escritores import escribir_atomico
+from generar_qrs_imagenes import crear_png_qr, sanitize_filename
+from lectores import iterar_empleados
+
+
+REGISTRO = '.credenciales.json'
+
+# Cambiar al modificar PLANTILLA para que se regeneren todas las páginas
+VERSION_PLANTILLA = '2'
+
+PLANTILLA = """<!doctype html>
+<html lang="es">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0, viewport-fit=cover">
+<meta name="theme-color" content="#ef4444">
+<meta name="robots" content="noindex">
+<title>{nombre} - The Money Center</title>
+<style>
+*{{box-sizing:border-box;margin:0}}
+body{{min-height:100vh;display:flex;align-items:center;justify-content:center;padding:12px;
+font-family:system-ui,-apple-system,'Segoe UI',Roboto,sans-serif;background:linear-gradient(135deg,#ef4444,#b91c1c)}}
+.card{{background:#fff;border-radius:24px;box-shadow:0 25px 50px -12px rgba(0,0,0,.25);max-width:32rem;width:100%;padding:20px;text-align:center}}
+.logo{{width:96px;height:96px;border-radius:50%;margin:0 auto 16px;object-fit:contain;padding:4px;box-shadow:0 10px 15px -3px rgba(0,0,0,.1)}}
+.vigencia{{font-weight:700;color:#374151}}
+h1{{color:#1f2937;font-size:1.5rem;margin-top:4px}}
+.sub{{color:#4b5563;font-size:.875rem;margin-bottom:20px}}
+.qr{{width:160px;height:160px;border:2px solid #e5e7eb;border-radius:12px;padding:8px;margin-bottom:12px}}
+.nombre{{color:#ef4444;font-size:1.25rem;font-weight:700;margin-bottom:12px;line-height:1.25}}
+.info{{background:#f9fafb;border-radius:16px;padding:8px 12px}}
+.campo{{display:flex;flex-direction:column;padding:8px 0;border-bottom:1px solid #e5e7eb}}
+.campo:last-child{{border-bottom:0}}
+.etiqueta{{color:#4b5563;font-size:.75rem;font-weight:600;text-transform:uppercase;letter-spacing:.025em}}
+.valor{{color:#1f2937;font-size:.95rem;font-weight:500;word-break:break-word}}
+a{{color:#ef4444;text-decoration:none}}
+.estado{{border-top:2px solid #e5e7eb;margin-top:16px;padding-top:12px}}
+.estado p:first-child{{font-size:.75rem;text-transform:uppercase;letter-spacing:.025em;font-weight:700;color:#6b7280}}
+.reloj{{font-family:ui-monospace,monospace;font-weight:600;color:#1f2937}}
+.sello{{margin-top:8px;padding:8px 12px;border-radius:8px;background:#f0fdf4;color:#15803d;font-weight:600;font-size:.875rem}}
+.baja .estado p:first-child{{color:#dc2626}}
+.baja .sello{{background:#fef2f2;border:1px solid #fca5a5;color:#b91c1c}}
+.mas{{display:inline-block;margin-top:16px;font-size:.8rem}}
+</style>
+</head>
+<body>
+<main class="card{clase}">
+<img class="logo" src="../moneycenter.png" alt="The Money Center Logo" width="96" height="96">
+<p class="vigencia">2026-2027</p>
+<h1>The Money Center</h1>
+<p class="sub">Directorio de Empleados</p>
+<img class="qr" src="data:image/png;base64,{qr}" alt="QR de {nombre}" width="160" height="160">
+<div class="nombre">{nombre}</div>
+<div class="info">
+<div class="campo"><span class="etiqueta">Puesto</span><span class="valor">{puesto}</span></div>
+<div class="campo"><span class="etiqueta">Gerencia</span><span class="valor">{gerencia}</span></div>
+<div class="campo"><span class="etiqueta">Celular</span><a class="valor" href="tel:{celular}">{celular}</a></div>
+</div>
+<div class="estado">
+<p>{verificado}</p>
+<p class="reloj" id="reloj"></p>
+</div>
+<p class="sello">{sello}</p>
+<a class="mas" href="../?id={id}&amp;spa=1">Ver en el directorio</a>
+</main>
+<script>
+(function(){{var r=document.getElementById('reloj');function p(n){{return String(n).padStart(2,'0')}}
+function t(){{var d=new Date();r.textContent=p(d.getDate())+'/'+p(d.getMonth()+1)+'/'+d.getFullYear()+' - '+p(d.getHours())+':'+p(d.getMinutes())+':'+p(d.getSeconds())}}
+t();setInterval(t,1000)}})();
+if('serviceWorker' in navigator){{navigator.serviceWorker.register('../sw.js')}}
+</script>
+</body>
+</html>
+"""
+
+
+def huella_empleado(emp, qr_png):
+    """Hash de todo lo que aparece en la página (datos, QR y plantilla)."""
+    h = hashlib.sha256(VERSION_PLANTILLA.encode('utf-8'))
+    h.update(json.dumps(emp, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    h.update(qr_png or b'')
+    return h.hexdigest()
+
+
+def renderizar_pagina(emp, qr_png):
+    """Genera el HTML de la credencial de un empleado."""
+    baja = bool(emp.get('baja'))
+    return PLANTILLA.format(
+        id=html.escape(emp['id']),
+        nombre=html.escape(emp['nombre']),
+        puesto=html.escape(emp.get('puesto', '')),
+        gerencia=html.escape(emp.get('gerencia', '')),
+        celular=html.escape(emp.get('celular', '')),
+        qr=base64.b64encode(qr_png).decode('ascii'),
+        clase=' baja' if baja else '',
+        verificado='DADO DE BAJA' if baja else 'Verificado',
+        sello='✕ Perfil no válido · Estado: DADO DE BAJA' if baja else '✓ Perfil Válido · Estado: VERIFICADO',
+    )
+
+
+def escribir_pagina(tarea):
+    """
+    Escribe la página de un empleado (se ejecuta en un proceso aparte).
+
+    Args:
+        tarea: Tupla (empleado, bytes del QR o None, ruta de salida, base_url)
+
+    Returns:
+        Tupla (id, huella) o (id, None) si hubo un error
+    """
+    emp, qr_png, ruta, base_url = tarea
+    try:
+        huella = huella_empleado(emp, qr_png)
+        if qr_png is None:
+            qr_png = crear_png_qr(f"{base_url}?id={emp['id']}")
+        escribir_atomico(ruta, renderizar_pagina(emp, qr_png).encode('utf-8'))
+        return emp['id'], huella
+    except Exception as e:
+        print(f"❌ Error generando página para {emp.get('nombre', emp.get('id'))}: {str(e)}")
+        return emp['id'], None
+
+
+def generar_credenciales_html(json_file='public/empleados.json', output_dir='public/c',
+                              qr_dir='public/qr_codes', base_url=None, workers=None):
+    """
+    Genera (o actualiza) las páginas estáticas de credencial.
+
+    Args:
+        json_file: JSON de empleados
+        output_dir: Carpeta de salida (una página <id>.html por empleado)
+        qr_dir: Carpeta de QR existentes (si falta uno, se genera)
+        base_url: URL base de los QR que se generen
+        workers: Procesos en paralelo (default: número de CPUs)
+    """
+    if not base_url:
+        base_url = "https://ramz0.github.io/credenciales-empleados"
+
+    try:
+        salida = Path(output_dir)
+        salida.mkdir(parents=True, exist_ok=True)
+        qr_path = Path(qr_dir)
+
+        print(f"📂 Leyendo: {json_file}")
+        print(f"📁 Salida:  {salida}/")
+
+        registro_file = salida / REGISTRO
+        registro = {}
+        if registro_file.exists():
+            with open(registro_file, 'r', encoding='utf-8') as f:
+                registro = json.load(f)
+
+        # Solo las páginas cuyo contenido cambió
+        total = 0
+        pendientes = []
+        nuevo_registro = {}
+        for emp in iterar_empleados(json_file):
+            total += 1
+            archivo_qr = qr_path / f"{sanitize_filename(emp['nombre'])}.png"
+            qr_png = archivo_qr.read_bytes() if archivo_qr.exists() else None
+            ruta = salida / f"{emp['id']}.html"
+            huella = huella_empleado(emp, qr_png)
+            if registro.get(emp['id']) == huella and ruta.exists():
+                nuevo_registro[emp['id']] = huella
+            else:
+                pendientes.append((emp, qr_png, ruta, base_url))
+
+        print(f"\n🔨 Generando {len(pendientes)} de {total} páginas "
+              f"({total - len(pendientes)} sin cambios)...\n")
+
+        errores = 0
+        if pendientes:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for emp_id, huella in executor.map(escribir_pagina, pendientes, chunksize=32):
+                    if huella is None:
+                        errores += 1
+                    else:
+                        nuevo_registro[emp_id] = huella
+
+        # Páginas de empleados que ya no existen
+        eliminadas = 0
+        for pagina in salida.glob('*.html'):
+            if pagina.stem not in nuevo_registro:
+                pagina.unlink()
+                eliminadas += 1
+
+        escribir_atomico(registro_file, json.dumps(nuevo_registro, indent=2, sort_keys=True).encode('utf-8'))
+
+        # Resumen
+        print(f"{'='*70}")
+        print(f"✅ Páginas de credencial generadas!")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        print(f"   • Generadas:             {len(pendientes) - errores}")
+        print(f"   • Sin cambios:           {total - len(pendientes)}")
+        if eliminadas:
+            print(f"   • Eliminadas:            {eliminadas}")
+        if errores:
+            print(f"   • Errores:               {errores}")
+        print(f"{'='*70}\n")
+
+        return errores == 0
+
+    except FileNotFoundError:
+        print(f"❌ Error: No se encontró el archivo {json_file}")
+        return False
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: El archivo JSON no es válido: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    workers = None
+
+    if args and args[0] in ['-h', '--help']:
+        print("Uso: python generar_credenciales_html.py [json_file] [output_dir] [qr_dir] [base_url] [--workers N]")
+        print()
+        print("Parámetros:")
+        print("  json_file   : JSON de empleados (default: public/empleados.json)")
+        print("  output_dir  : Carpeta de salida (default: public/c)")
+        print("  qr_dir      : Carpeta de QR existentes (default: public/qr_codes)")
+        print("  base_url    : URL base de los QR que falten")
+        print("  --workers N : Procesos en paralelo (default: número de CPUs)")
+        print()
+        print("Ejemplos:")
+        print("  python generar_credenciales_html.py")
+        print("  python generar_credenciales_html.py public/empleados.json public/c public/qr_codes")
+        sys.exit(0)
+
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+
+    json_file = args[0] if len(args) > 0 else 'public/empleados.json'
+    output_dir = args[1] if len(args) > 1 else 'public/c'
+    qr_dir = args[2] if len(args) > 2 else 'public/qr_codes'
+    base_url = args[3] if len(args) > 3 else None
+
+    print("=" * 70)
+    print("  CREDENCIALES ESTÁTICAS - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = generar_credenciales_html(json_file, output_dir, qr_dir, base_url, workers)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
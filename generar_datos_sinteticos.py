@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Script para generar datos sintéticos de empleados (benchmarks y pruebas).
+The Money Center - Directorio de Empleados
+
+Genera archivos con el mismo formato que los reales, con nombres en
+español con acentos y una distribución de gerencias como la actual:
+
+- maestro.xlsx:   Excel maestro (UUID, NOMBRE, PUESTO, GERENCIA, CELULAR);
+                  ~5% de filas con UUID vacío (empleados nuevos)
+- asesores.xlsx:  layout de excel_to_json.py (D/E/F desde la fila 3)
+- gerentes.xlsx:  layout de crear_excel_maestro.py (B/C/D desde la fila 4)
+- empleados.json: exportación para la app web
+
+Los datos son deterministas para una misma semilla.
+"""
+
+import json
+import random
+import sys
+import uuid
+from pathlib import Path
+
+import openpyxl
+
+
+NOMBRES = [
+    'JOSÉ', 'MARÍA', 'JUAN', 'GUADALUPE', 'FRANCISCO', 'VERÓNICA', 'JESÚS',
+    'ANA', 'ÁNGEL', 'SOFÍA', 'RAÚL', 'MÓNICA', 'RAMÓN', 'LUCÍA', 'MARTÍN',
+    'BEATRIZ', 'ANDRÉS', 'PATRICIA', 'HÉCTOR', 'ROCÍO', 'IVÁN', 'NOEMÍ',
+    'JOAQUÍN', 'INÉS', 'CÉSAR', 'ELOÍSA', 'RUBÉN', 'DAFNE', 'EFRAÍN',
+    'ALEJANDRA', 'EDUARDO', 'CLAUDIA', 'ARTURO', 'FERNANDA', 'GERARDO',
+    'KARLA', 'DAVID', 'DIANA', 'CARLOS', 'BRENDA', 'LUIS', 'XIMENA',
+]
+
+APELLIDOS = [
+    'GARCÍA', 'HERNÁNDEZ', 'MARTÍNEZ', 'LÓPEZ', 'GONZÁLEZ', 'PÉREZ',
+    'RODRÍGUEZ', 'SÁNCHEZ', 'RAMÍREZ', 'CRUZ', 'FLORES', 'GÓMEZ', 'DÍAZ',
+    'MORALES', 'VÁZQUEZ', 'JIMÉNEZ', 'REYES', 'TORRES', 'GUTIÉRREZ', 'RUIZ',
+    'MUÑOZ', 'ÁLVAREZ', 'MENDOZA', 'CASTILLO', 'ORTÍZ', 'MORÁN', 'NÚÑEZ',
+    'DE LA CRUZ', 'DE ANDA', 'PEÑA', 'IBÁÑEZ', 'BERMEO', 'GALICIA', 'MARÍN',
+]
+
+# Distribución de gerencias de empleados.json (cantidad de empleados)
+DISTRIBUCION_GERENCIAS = {
+    'THE MONEY CENTER 2': 27,
+    'THE MONEY CENTER 3': 25,
+    'THE MONEY CENTER TLV': 18,
+    'THE MONEY CENTER 10': 18,
+    'THE MONEY CENTER 1': 17,
+    'THE MONEY CENTER 9': 13,
+    'THE MONEY CENTER 7': 12,
+    'THE MONEY CENTER 8': 12,
+    'THE MONEY CENTER MNS': 12,
+    'THE MONEY CENTER 11': 11,
+    'THE MONEY CENTER 5': 10,
+    'THE MONEY CENTER 6': 9,
+    'THE MONEY CENTER 4': 8,
+    'THE MONEY CENTER MNS2': 3,
+    'THE MONEY CENTER MSN': 2,
+    'THE MONEY CENTER MTY': 2,
+    'THE MONEY CENTER MTY 1': 1,
+    'THE MONEY CENTER MTY2-1': 1,
+    'THE MONEY CENTER MSN2': 1,
+    'THE MONEY CENTER CA': 1,
+    'THE MONEY CENTER MOD 40': 1,
+}
+
+# Distribución de puestos (~89% asesores, ~8% gerentes)
+DISTRIBUCION_PUESTOS = {
+    'Asesor': 184,
+    'Gerente': 16,
+    'Director': 3,
+    'Consultor': 1,
+    'Asistente de Préstamos': 1,
+    'Asistente de Dirección': 1,
+}
+
+
+def generar_empleados(cantidad, semilla=42):
+    """
+    Genera empleados sintéticos.
+
+    Args:
+        cantidad: Número de empleados
+        semilla: Semilla del generador (mismos datos para la misma semilla)
+    """
+    rng = random.Random(semilla)
+    gerencias = list(DISTRIBUCION_GERENCIAS)
+    pesos_gerencias = list(DISTRIBUCION_GERENCIAS.values())
+    puestos = list(DISTRIBUCION_PUESTOS)
+    pesos_puestos = list(DISTRIBUCION_PUESTOS.values())
+
+    for _ in range(cantidad):
+        nombres = rng.sample(NOMBRES, rng.choice((1, 1, 2)))
+        apellidos = rng.choices(APELLIDOS, k=2)
+        # ~8% sin celular, como en los datos reales
+        celular = '' if rng.random() < 0.08 else '55 ' + ' '.join(
+            f"{rng.randrange(100):02d}" for _ in range(4)
+        )
+        yield {
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'nombre': ' '.join(nombres + apellidos),
+            'puesto': rng.choices(puestos, pesos_puestos)[0],
+            'gerencia': rng.choices(gerencias, pesos_gerencias)[0],
+            'celular': celular,
+        }
+
+
+def _escribir_filas(ruta, filas_encabezado, filas):
+    """Escribe un Excel en modo write_only (streaming, memoria constante)."""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Empleados')
+    for fila in filas_encabezado:
+        ws.append(fila)
+    for fila in filas:
+        ws.append(fila)
+    wb.save(ruta)
+
+
+def escribir_maestro(empleados, ruta, proporcion_nuevos=0.05, semilla=42):
+    """Excel maestro con columna UUID (algunas vacías = empleados nuevos)."""
+    rng = random.Random(semilla)
+    _escribir_filas(
+        ruta,
+        [["UUID", "NOMBRE", "PUESTO", "GERENCIA", "CELULAR"]],
+        (
+            ['' if rng.random() < proporcion_nuevos else e['id'],
+             e['nombre'], e['puesto'], e['gerencia'], e['celular']]
+            for e in empleados
+        )
+    )
+
+
+def escribir_asesores(empleados, ruta):
+    """Excel con el layout de excel_to_json.py: D=gerencia, E=nombre, F=celular."""
+    _escribir_filas(
+        ruta,
+        [["DIRECTORIO DE ASESORES"], [None, None, None, "GERENCIA", "NOMBRE DEL ASESOR", "NO DE CELULAR"]],
+        ([None, None, None, e['gerencia'], e['nombre'], e['celular']] for e in empleados)
+    )
+
+
+def escribir_gerentes(empleados, ruta):
+    """Excel con el layout de crear_excel_maestro.py: B=gerencia, C=nombre, D=celular."""
+    _escribir_filas(
+        ruta,
+        [["GERENCIAS Y DR"], [], [None, "GERENCIA", "NOMBRE DEL GERENTE", "NO DE CELULAR"]],
+        ([None, e['gerencia'], e['nombre'], e['celular']] for e in empleados)
+    )
+
+
+def generar_datos(cantidad, output_dir, semilla=42):
+    """
+    Genera el juego completo de archivos sintéticos en output_dir.
+
+    Returns:
+        Diccionario nombre → ruta de los archivos generados
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    empleados = list(generar_empleados(cantidad, semilla))
+    gerentes = list(generar_empleados(max(1, cantidad // 10), semilla + 1))
+
+    archivos = {
+        'maestro': output_path / 'maestro.xlsx',
+        'asesores': output_path / 'asesores.xlsx',
+        'gerentes': output_path / 'gerentes.xlsx',
+        'json': output_path / 'empleados.json',
+    }
+
+    escribir_maestro(empleados, archivos['maestro'], semilla=semilla)
+    escribir_asesores(empleados, archivos['asesores'])
+    escribir_gerentes(gerentes, archivos['gerentes'])
+    with open(archivos['json'], 'w', encoding='utf-8') as f:
+        json.dump(empleados, f, ensure_ascii=False, indent=2)
+
+    return archivos
+
+
+def main():
+    """Función principal del script."""
+    cantidad = 1000
+    output_dir = 'datos_sinteticos'
+
+    if len(sys.argv) > 1:
+        if sys.argv[1] in ['-h', '--help']:
+            print("Uso: python generar_datos_sinteticos.py [cantidad] [output_dir]")
+            print()
+            print("Parámetros:")
+            print("  cantidad   : Número de empleados (default: 1000)")
+            print("  output_dir : Carpeta de salida (default: datos_sinteticos)")
+            print()
+            print("Ejemplos:")
+            print("  python generar_datos_sinteticos.py")
+            print("  python generar_datos_sinteticos.py 100000 /tmp/datos_100k")
+            sys.exit(0)
+        cantidad = int(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        output_dir = sys.argv[2]
+
+    print(f"🔨 Generando {cantidad} empleados sintéticos en {output_dir}/ ...")
+    archivos = generar_datos(cantidad, output_dir)
+
+    print("\n✅ Datos generados:")
+    for nombre, ruta in archivos.items():
+        print(f"   📁 {nombre:9} {ruta}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Script para generar hojas de credenciales listas para imprimir.
+The Money Center - Directorio de Empleados
+
+Acomoda las credenciales (mismo diseño que el componente Credencial: logo,
+nombre, puesto, gerencia, QR y vigencia) varias por hoja, en un PDF o en
+imágenes PNG, a 300 dpi y del tamaño de una tarjeta CR80 (54 × 85.6 mm).
+
+- El logo y las fuentes se cargan una sola vez por proceso
+- Las hojas se componen en paralelo (ProcessPoolExecutor)
+- El PDF se escribe hoja por hoja conforme se terminan (cada hoja es una
+  imagen JPEG), sin tener el documento completo en memoria
+- Los empleados dados de baja no se imprimen
+- Si falta el QR de un empleado en qr_dir, se genera
+
+Uso:
+    python generar_hojas_credenciales.py public/empleados.json credenciales.pdf
+    python generar_hojas_credenciales.py public/empleados.json hojas/ --papel a4
+"""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from io import BytesIO
+from itertools import islice
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from generar_qrs_imagenes import crear_png_qr, sanitize_filename
+from lectores import iterar_empleados
+from progreso import Progreso, progreso_desde_argv
+
+
+DPI = 300
+
+# Tamaño de hoja en pulgadas
+PAPELES = {
+    'carta': (8.5, 11.0),
+    'a4': (8.27, 11.69),
+}
+
+# Tarjeta CR80 vertical (54 × 85.6 mm) a 300 dpi y separación entre tarjetas
+TARJETA = (638, 1011)
+SEPARACION = 30
+RADIO = 28
+
+ROJO = (227, 30, 36)            # #E31E24
+NEGRO = (0, 0, 0)
+GRIS_PUESTO = (55, 65, 81)      # gray-700
+GRIS_GERENCIA = (107, 114, 128)  # gray-500
+GRIS_VIGENCIA = (156, 163, 175)  # #9CA3AF
+GRIS_LINEA = (209, 213, 219)    # #D1D5DB
+GRIS_CORTE = (229, 231, 235)    # gray-200
+
+FUENTES = {
+    'normal': ['DejaVuSans.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+               'C:/Windows/Fonts/arial.ttf', '/Library/Fonts/Arial.ttf',
+               '/System/Library/Fonts/Supplemental/Arial.ttf'],
+    'negrita': ['DejaVuSans-Bold.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+                'C:/Windows/Fonts/arialbd.ttf', '/Library/Fonts/Arial Bold.ttf',
+                '/System/Library/Fonts/Supplemental/Arial Bold.ttf'],
+}
+
+# Recursos de cada proceso (se cargan una vez en _iniciar_proceso)
+_recursos = {}
+
+
+def _cargar_fuente(estilo, tamano):
+    """Primera fuente disponible del estilo, o la de Pillow si no hay ninguna."""
+    for candidata in FUENTES[estilo]:
+        try:
+            return ImageFont.truetype(candidata, tamano)
+        except OSError:
+            continue
+    return ImageFont.load_default(tamano)
+
+
+def _iniciar_proceso(logo_file, nombre_empresa, vigencia, qr_dir, base_url):
+    """Carga el logo (ya recortado en círculo) y las fuentes una sola vez por proceso."""
+    diametro = 220
+    logo = None
+    if logo_file and Path(logo_file).exists():
+        with Image.open(logo_file) as original:
+            logo = original.convert('RGBA').resize((diametro, diametro), Image.LANCZOS)
+        mascara = Image.new('L', (diametro, diametro), 0)
+        ImageDraw.Draw(mascara).ellipse((0, 0, diametro - 1, diametro - 1), fill=255)
+        mascara.paste(0, (0, 0), Image.eval(logo.getchannel('A'), lambda a: 255 - a))
+        logo.putalpha(mascara)
+
+    _recursos.update(
+        logo=logo,
+        nombre_empresa=nombre_empresa,
+        vigencia=vigencia,
+        qr_dir=Path(qr_dir),
+        base_url=base_url,
+        empresa=_cargar_fuente('negrita', 34),
+        nombres=[_cargar_fuente('negrita', tamano) for tamano in (42, 38, 34, 30)],
+        puesto=_cargar_fuente('normal', 30),
+        gerencia=_cargar_fuente('normal', 24),
+        pie=_cargar_fuente('normal', 24),
+    )
+
+
+def _partir_lineas(texto, fuente, ancho):
+    """Divide el texto en líneas que caben en el ancho (por palabras)."""
+    lineas, actual = [], ''
+    for palabra in texto.split():
+        propuesta = f"{actual} {palabra}".strip()
+        if actual and fuente.getlength(propuesta) > ancho:
+            lineas.append(actual)
+            actual = palabra
+        else:
+            actual = propuesta
+    if actual:
+        lineas.append(actual)
+    return lineas
+
+
+def _texto_centrado(dibujo, y, lineas, fuente, color, ancho_tarjeta, interlineado=1.2):
+    """Dibuja líneas centradas desde y; devuelve la y siguiente."""
+    alto = round(fuente.size * interlineado)
+    for linea in lineas:
+        dibujo.text((ancho_tarjeta / 2, y), linea, font=fuente, fill=color, anchor='mt')
+        y += alto
+    return y
+
+
+def _qr_empleado(emp):
+    """Imagen del QR del empleado (de qr_dir, o generada si falta)."""
+    archivo = _recursos['qr_dir'] / f"{sanitize_filename(emp['nombre'])}.png"
+    if archivo.exists():
+        datos = archivo.read_bytes()
+    else:
+        datos = crear_png_qr(f"{_recursos['base_url']}?id={emp['id']}")
+    with Image.open(BytesIO(datos)) as qr:
+        return qr.convert('RGB')
+
+
+def dibujar_credencial(emp):
+    """
+    Dibuja la credencial de un empleado (requiere _iniciar_proceso).
+
+    Returns:
+        Imagen RGB del tamaño de TARJETA
+    """
+    ancho, alto = TARJETA
+    margen = 40
+    tarjeta = Image.new('RGB', TARJETA, 'white')
+    dibujo = ImageDraw.Draw(tarjeta)
+
+    # Encabezado con el nombre de la empresa
+    dibujo.rounded_rectangle((0, 0, ancho - 1, 90), radius=RADIO, fill=ROJO, corners=(True, True, False, False))
+    dibujo.text((ancho / 2, 45), _recursos['nombre_empresa'], font=_recursos['empresa'], fill='white', anchor='mm')
+
+    # Logo circular
+    y = 115
+    if _recursos['logo'] is not None:
+        logo = _recursos['logo']
+        tarjeta.paste(logo, ((ancho - logo.width) // 2, y), logo)
+        y += logo.height
+    y += 25
+
+    # Nombre: la fuente más grande con la que cabe en dos líneas
+    for fuente in _recursos['nombres']:
+        lineas = _partir_lineas(emp['nombre'], fuente, ancho - 2 * margen)
+        if len(lineas) <= 2:
+            break
+    y = _texto_centrado(dibujo, y, lineas[:3], fuente, NEGRO, ancho, 1.15) + 8
+
+    # Puesto y gerencia
+    y = _texto_centrado(dibujo, y, _partir_lineas(emp.get('puesto', ''), _recursos['puesto'], ancho - 2 * margen)[:2],
+                        _recursos['puesto'], GRIS_PUESTO, ancho)
+    y = _texto_centrado(dibujo, y, _partir_lineas(emp.get('gerencia', ''), _recursos['gerencia'], ancho - 2 * margen)[:2],
+                        _recursos['gerencia'], GRIS_GERENCIA, ancho) + 10
+
+    # QR en el espacio que queda antes del pie
+    pie_y = alto - 95
+    lado = max(160, min(300, pie_y - y - 10))
+    qr = _qr_empleado(emp).resize((lado, lado), Image.NEAREST)
+    tarjeta.paste(qr, ((ancho - lado) // 2, y))
+
+    # Vigencia y línea decorativa
+    dibujo.text((ancho / 2, pie_y), f"Vigencia: {_recursos['vigencia']}", font=_recursos['pie'],
+                fill=GRIS_VIGENCIA, anchor='mt')
+    dibujo.rounded_rectangle((ancho * 0.2, alto - 30, ancho * 0.8, alto - 22), radius=4, fill=GRIS_LINEA)
+
+    # Contorno de corte
+    dibujo.rounded_rectangle((0, 0, ancho - 1, alto - 1), radius=RADIO, outline=GRIS_CORTE, width=2)
+    return tarjeta
+
+
+def acomodo(papel):
+    """
+    Tamaño de la hoja en píxeles y posiciones de las tarjetas (centradas).
+
+    Returns:
+        Tupla ((ancho, alto), [(x, y), ...])
+    """
+    ancho = round(PAPELES[papel][0] * DPI)
+    alto = round(PAPELES[papel][1] * DPI)
+    columnas = (ancho + SEPARACION) // (TARJETA[0] + SEPARACION)
+    filas = (alto + SEPARACION) // (TARJETA[1] + SEPARACION)
+    x0 = (ancho - columnas * TARJETA[0] - (columnas - 1) * SEPARACION) // 2
+    y0 = (alto - filas * TARJETA[1] - (filas - 1) * SEPARACION) // 2
+    posiciones = [(x0 + c * (TARJETA[0] + SEPARACION), y0 + f * (TARJETA[1] + SEPARACION))
+                  for f in range(filas) for c in range(columnas)]
+    return (ancho, alto), posiciones
+
+
+def componer_hoja(tarea):
+    """
+    Compone una hoja (se ejecuta en un proceso aparte).
+
+    Args:
+        tarea: Tupla (número de hoja, empleados, papel, salida PNG o None)
+
+    Returns:
+        Tupla (número de hoja, JPEG de la hoja para el PDF o ruta del PNG escrito)
+    """
+    numero, empleados, papel, png_file = tarea
+    tamano, posiciones = acomodo(papel)
+    hoja = Image.new('RGB', tamano, 'white')
+    for emp, posicion in zip(empleados, posiciones):
+        hoja.paste(dibujar_credencial(emp), posicion)
+
+    if png_file:
+        hoja.save(png_file, dpi=(DPI, DPI), optimize=False)
+        return numero, png_file
+
+    buffer = BytesIO()
+    hoja.save(buffer, 'JPEG', quality=92, dpi=(DPI, DPI))
+    return numero, buffer.getvalue()
+
+
+class EscritorPdf:
+    """
+    PDF escrito página por página: cada página es una imagen JPEG a hoja
+    completa. Solo guarda en memoria la posición de cada objeto.
+    """
+
+    def __init__(self, ruta, papel):
+        self.ruta = Path(ruta)
+        self.puntos = (PAPELES[papel][0] * 72, PAPELES[papel][1] * 72)
+        self.offsets = {}
+        self.paginas = []
+        fd, self.temporal = tempfile.mkstemp(dir=self.ruta.parent, prefix=f'.{self.ruta.stem}.', suffix='.pdf')
+        self.archivo = os.fdopen(fd, 'wb')
+        self.archivo.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self.siguiente = 3  # 1 = catálogo, 2 = árbol de páginas (se escriben al final)
+
+    def _objeto(self, numero, contenido, flujo=None):
+        self.offsets[numero] = self.archivo.tell()
+        self.archivo.write(f"{numero} 0 obj\n".encode('ascii') + contenido)
+        if flujo is not None:
+            self.archivo.write(b'\nstream\n' + flujo + b'\nendstream')
+        self.archivo.write(b'\nendobj\n')
+
+    def agregar_pagina(self, jpeg):
+        """Escribe una página con la imagen JPEG a hoja completa."""
+        with Image.open(BytesIO(jpeg)) as imagen:
+            ancho_px, alto_px = imagen.size
+        imagen_id, contenido_id, pagina_id = self.siguiente, self.siguiente + 1, self.siguiente + 2
+        self.siguiente += 3
+        ancho, alto = self.puntos
+
+        self._objeto(imagen_id, (
+            f"<< /Type /XObject /Subtype /Image /Width {ancho_px} /Height {alto_px} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode /Length {len(jpeg)} >>"
+        ).encode('ascii'), jpeg)
+        dibujo = f"q {ancho:.2f} 0 0 {alto:.2f} 0 0 cm /Hoja Do Q".encode('ascii')
+        self._objeto(contenido_id, f"<< /Length {len(dibujo)} >>".encode('ascii'), dibujo)
+        self._objeto(pagina_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {ancho:.2f} {alto:.2f}] "
+            f"/Resources << /XObject << /Hoja {imagen_id} 0 R >> >> /Contents {contenido_id} 0 R >>"
+        ).encode('ascii'))
+        self.paginas.append(pagina_id)
+
+    def cerrar(self):
+        """Escribe el árbol de páginas y la tabla xref, y publica el archivo."""
+        try:
+            self._objeto(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+            kids = ' '.join(f"{pagina} 0 R" for pagina in self.paginas)
+            self._objeto(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.paginas)} >>".encode('ascii'))
+
+            inicio_xref = self.archivo.tell()
+            total = self.siguiente
+            self.archivo.write(f"xref\n0 {total}\n0000000000 65535 f \n".encode('ascii'))
+            for numero in range(1, total):
+                self.archivo.write(f"{self.offsets[numero]:010d} 00000 n \n".encode('ascii'))
+            self.archivo.write(f"trailer\n<< /Size {total} /Root 1 0 R >>\nstartxref\n{inicio_xref}\n%%EOF\n"
+                               .encode('ascii'))
+            self.archivo.close()
+            os.chmod(self.temporal, 0o644)
+            os.replace(self.temporal, self.ruta)
+        except BaseException:
+            self.descartar()
+            raise
+
+    def descartar(self):
+        """Borra el archivo temporal (si hubo un error)."""
+        self.archivo.close()
+        Path(self.temporal).unlink(missing_ok=True)
+
+
+def generar_hojas(json_file='public/empleados.json', salida='credenciales.pdf', qr_dir='public/qr_codes',
+                  papel='carta', vigencia=None, logo_file='public/moneycenter.png', base_url=None,
+                  workers=None, opciones_progreso=None):
+    """
+    Genera las hojas de credenciales.
+
+    Args:
+        json_file: JSON de empleados
+        salida: Archivo .pdf, o carpeta para una imagen PNG por hoja
+        qr_dir: Carpeta de QR existentes (si falta uno, se genera)
+        papel: 'carta' o 'a4'
+        vigencia: Texto de vigencia (default: "<año>-<año siguiente>")
+        logo_file: Logo de la empresa
+        base_url: URL base de los QR que se generen
+        workers: Procesos en paralelo (default: número de CPUs)
+        opciones_progreso: Opciones de Progreso (silencioso, log_file)
+    """
+    opciones_progreso = opciones_progreso or {}
+    if not base_url:
+        base_url = "https://ramz0.github.io/credenciales-empleados"
+    if not vigencia:
+        vigencia = f"{date.today().year}-{date.today().year + 1}"
+
+    es_pdf = str(salida).lower().endswith('.pdf')
+    escritor = None
+    try:
+        print(f"📂 Leyendo: {json_file}")
+        empleados = [emp for emp in iterar_empleados(json_file) if not emp.get('baja')]
+        por_hoja = len(acomodo(papel)[1])
+        total_hojas = -(-len(empleados) // por_hoja)
+
+        if not empleados:
+            print("⚠️  No hay empleados para imprimir")
+            return False
+
+        if es_pdf:
+            Path(salida).parent.mkdir(parents=True, exist_ok=True)
+            escritor = EscritorPdf(salida, papel)
+        else:
+            Path(salida).mkdir(parents=True, exist_ok=True)
+
+        print(f"📄 {len(empleados)} credenciales, {por_hoja} por hoja ({papel}): {total_hojas} hojas")
+        print(f"📁 Salida: {salida}\n")
+
+        def tareas():
+            it = iter(empleados)
+            for numero in range(1, total_hojas + 1):
+                png_file = None if es_pdf else str(Path(salida) / f"hoja_{numero:04d}.png")
+                yield numero, list(islice(it, por_hoja)), papel, png_file
+
+        progreso = Progreso("Componiendo hojas", total_hojas, **opciones_progreso)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_proceso,
+                                 initargs=(logo_file, 'THE MONEY CENTER', vigencia, qr_dir, base_url)) as executor:
+            # En orden: cada hoja se escribe en cuanto están listas las anteriores
+            for numero, resultado in executor.map(componer_hoja, tareas()):
+                if escritor:
+                    escritor.agregar_pagina(resultado)
+                progreso.avanzar(hoja=numero)
+
+        if escritor:
+            escritor.cerrar()
+            escritor = None
+        progreso.terminar()
+
+        # Resumen
+        print(f"\n{'='*70}")
+        print(f"✅ Hojas de credenciales generadas!")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        print(f"   • Credenciales:          {len(empleados)}")
+        print(f"   • Hojas:                 {total_hojas} ({papel}, {por_hoja} por hoja, {DPI} dpi)")
+        print(f"📁 Ubicación: {Path(salida).absolute()}")
+        print(f"{'='*70}\n")
+        return True
+
+    except FileNotFoundError as e:
+        print(f"❌ Error: No se encontró el archivo {e.filename or json_file}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if escritor:
+            escritor.descartar()
+
+
+def main():
+    """Función principal del script."""
+    opciones_progreso = progreso_desde_argv(sys.argv, 'generar_hojas_credenciales')
+    args = sys.argv[1:]
+    opciones = {'--qr': 'public/qr_codes', '--papel': 'carta', '--vigencia': None,
+                '--logo': 'public/moneycenter.png', '--workers': None}
+
+    if args and args[0] in ['-h', '--help']:
+        print("Uso: python generar_hojas_credenciales.py [json_file] [salida] [opciones]")
+        print()
+        print("Parámetros:")
+        print("  json_file     : JSON de empleados (default: public/empleados.json)")
+        print("  salida        : Archivo .pdf o carpeta para PNG por hoja (default: credenciales.pdf)")
+        print("  --qr DIR      : Carpeta de QR (default: public/qr_codes; los que falten se generan)")
+        print("  --papel P     : carta o a4 (default: carta)")
+        print("  --vigencia V  : Texto de vigencia (default: año actual y siguiente, ej: 2026-2027)")
+        print("  --logo F      : Logo (default: public/moneycenter.png)")
+        print("  --workers N   : Procesos en paralelo (default: número de CPUs)")
+        print("  --silencioso  : Sin contador de progreso")
+        print()
+        print("Ejemplos:")
+        print("  python generar_hojas_credenciales.py")
+        print("  python generar_hojas_credenciales.py public/empleados.json credenciales.pdf --papel a4")
+        print("  python generar_hojas_credenciales.py public/empleados.json hojas/")
+        sys.exit(0)
+
+    for opcion in opciones:
+        if opcion in args:
+            i = args.index(opcion)
+            opciones[opcion] = args[i + 1]
+            del args[i:i + 2]
+
+    if opciones['--papel'] not in PAPELES:
+        print(f"❌ Error: papel no soportado: {opciones['--papel']} (carta o a4)")
+        sys.exit(1)
+
+    json_file = args[0] if len(args) > 0 else 'public/empleados.json'
+    salida = args[1] if len(args) > 1 else 'credenciales.pdf'
+    workers = int(opciones['--workers']) if opciones['--workers'] else None
+
+    print("=" * 70)
+    print("  HOJAS DE CREDENCIALES - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = generar_hojas(json_file, salida, opciones['--qr'], opciones['--papel'], opciones['--vigencia'],
+                            opciones['--logo'], workers=workers, opciones_progreso=opciones_progreso)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
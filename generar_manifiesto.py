@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Script para publicar los datos con nombres por contenido (hash) y un manifiesto.
+The Money Center - Directorio de Empleados
+
+Después de `npm run build`, en dist/:
+1. Copia cada QR como qr_codes/<NOMBRE>.<hash>.png
+2. Escribe empleados.<hash>.json: los empleados de empleados.json, cada
+   uno con la ruta de su QR con hash ("qr"), y copia el índice de
+   búsqueda (indice_busqueda.json, si existe) como indice_busqueda.<hash>.json
+3. Escribe manifiesto.json (al final, cuando todo existe) con las rutas
+   de los datos y la lista de archivos de la aplicación (assets/ de
+   Vite), que el service worker (public/sw.js) guarda para funcionar sin
+   conexión. Las rutas de los QR no van en el manifiesto: crecería con
+   cada empleado y es lo primero que se descarga
+
+La web carga primero manifiesto.json (el único archivo que cambia de
+contenido sin cambiar de nombre) y después los archivos con hash, que
+nunca cambian: un servidor o CDN puede servirlos con
+`Cache-Control: public, max-age=31536000, immutable`. Los archivos sin
+hash se conservan para versiones anteriores de la web.
+
+Formato del manifiesto:
+
+    {
+      "version": "3f2a9c1b7e",
+      "empleados": "empleados.8d1e0a44c2.json",
+      "indice": "indice_busqueda.51c0e7f9a2.json",
+      "app": ["assets/index-B1x9aQ2c.js", ...]
+    }
+
+Y cada empleado de empleados.<hash>.json:
+
+    {"id": "...", "nombre": "JUAN PÉREZ GARCÍA", ...,
+     "qr": "qr_codes/JUAN_PEREZ_GARCIA.b71c09de3a.png"}
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+from escritores import escribir_atomico
+from generar_qrs_imagenes import sanitize_filename
+from indice_busqueda import NOMBRE_INDICE
+from lectores import iterar_empleados
+
+
+MANIFIESTO = 'manifiesto.json'
+
+# Caracteres hexadecimales del hash en el nombre de archivo
+LONGITUD_HASH = 10
+
+
+def huella(contenido):
+    """Hash corto del contenido (bytes) para el nombre de archivo."""
+    return hashlib.sha256(contenido).hexdigest()[:LONGITUD_HASH]
+
+
+def publicar_con_hash(ruta):
+    """
+    Copia el archivo como <nombre>.<hash><extensión> (si no existe ya).
+
+    Returns:
+        Tupla (hash, ruta de la copia)
+    """
+    ruta = Path(ruta)
+    h = huella(ruta.read_bytes())
+    destino = ruta.with_name(f"{ruta.stem}.{h}{ruta.suffix}")
+    if not destino.exists():
+        shutil.copyfile(ruta, destino)
+    return h, destino
+
+
+def publicar_empleados_con_hash(ruta, qr):
+    """
+    Escribe empleados.<hash>.json con la ruta del QR con hash de cada empleado.
+
+    Args:
+        ruta: JSON de empleados (empleados.json)
+        qr: Diccionario nombre de archivo del QR → ruta con hash
+
+    Returns:
+        Ruta del archivo escrito
+    """
+    ruta = Path(ruta)
+    empleados = []
+    for emp in iterar_empleados(ruta):
+        ruta_qr = qr.get(sanitize_filename(emp.get('nombre', '')))
+        empleados.append({**emp, 'qr': ruta_qr} if ruta_qr else emp)
+    contenido = json.dumps(empleados, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    destino = ruta.with_name(f"{ruta.stem}.{huella(contenido)}{ruta.suffix}")
+    if not destino.exists():
+        escribir_atomico(destino, contenido)
+    return destino
+
+
+def generar_manifiesto(directorio='dist', json_name='empleados.json', qr_dir='qr_codes'):
+    """
+    Publica los datos con hash y escribe el manifiesto.
+
+    Args:
+        directorio: Carpeta publicada (default: dist)
+        json_name: Nombre del JSON de empleados dentro de la carpeta
+        qr_dir: Carpeta de QR dentro de la carpeta
+    """
+    try:
+        raiz = Path(directorio)
+        json_path = raiz / json_name
+        qr_path = raiz / qr_dir
+
+        if not json_path.exists():
+            print(f"❌ Error: No existe {json_path}")
+            print("   Primero ejecuta: npm run build")
+            return False
+
+        print(f"📂 Directorio: {raiz}/")
+
+        vigentes = set()
+
+        # 1. QR codes (los que ya tienen hash en el nombre se omiten)
+        qr = {}
+        if qr_path.exists():
+            for png in sorted(qr_path.glob('*.png')):
+                if '.' in png.stem:
+                    continue
+                _, destino = publicar_con_hash(png)
+                qr[png.stem] = destino.relative_to(raiz).as_posix()
+                vigentes.add(destino)
+        print(f"   ✓ {len(qr)} QR codes con hash")
+
+        # 2. JSON de empleados (con la ruta de cada QR) e índice de búsqueda
+        destino = publicar_empleados_con_hash(json_path, qr)
+        datos = {'empleados': destino.name}
+        vigentes.add(destino)
+        print(f"   ✓ {json_path.name} → {destino.name}")
+        if (raiz / NOMBRE_INDICE).exists():
+            _, destino = publicar_con_hash(raiz / NOMBRE_INDICE)
+            datos['indice'] = destino.name
+            vigentes.add(destino)
+            print(f"   ✓ {NOMBRE_INDICE} → {destino.name}")
+
+        # Copias con hash de versiones anteriores
+        anteriores = [
+            ruta for ruta in list(raiz.glob(f"{json_path.stem}.*{json_path.suffix}"))
+            + list(raiz.glob(f"{Path(NOMBRE_INDICE).stem}.*.json"))
+            + list(qr_path.glob('*.*.png'))
+            if ruta not in vigentes
+        ]
+        for ruta in anteriores:
+            ruta.unlink()
+
+        # 3. Manifiesto: se escribe al final y de forma atómica, así nunca
+        # apunta a un archivo que todavía no existe
+        # Archivos de la aplicación (Vite ya les pone hash en el nombre)
+        app = sorted(
+            ruta.relative_to(raiz).as_posix() for ruta in (raiz / 'assets').rglob('*')
+            if ruta.is_file() and ruta.suffix not in ('.gz', '.br')
+        ) if (raiz / 'assets').is_dir() else []
+
+        manifiesto = {**datos, 'app': app}
+        contenido = json.dumps(manifiesto, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        manifiesto = {'version': huella(contenido.encode('utf-8')), **manifiesto}
+
+        escribir_atomico(raiz / MANIFIESTO,
+                         json.dumps(manifiesto, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+        # Resumen
+        print(f"\n✅ Manifiesto generado!")
+        print("=" * 70)
+        print(f"📊 RESUMEN:")
+        print(f"   • Versión:              {manifiesto['version']}")
+        print(f"   • Empleados:            {manifiesto['empleados']}")
+        print(f"   • QR codes:             {len(qr)}")
+        if anteriores:
+            print(f"   • Copias anteriores eliminadas: {len(anteriores)}")
+        print(f"\n📁 Archivo generado: {raiz / MANIFIESTO}")
+        print("=" * 70)
+        print()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    directorio = 'dist'
+
+    if len(sys.argv) > 1:
+        if sys.argv[1] in ['-h', '--help']:
+            print("Uso: python generar_manifiesto.py [directorio]")
+            print()
+            print("Parámetros:")
+            print("  directorio : Carpeta publicada (default: dist)")
+            print()
+            print("Ejemplos:")
+            print("  npm run build && python generar_manifiesto.py dist")
+            sys.exit(0)
+        directorio = sys.argv[1]
+
+    if not Path(directorio).is_dir():
+        print(f"❌ Error: No existe el directorio '{directorio}'")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("  MANIFIESTO DE ARCHIVOS - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = generar_manifiesto(directorio)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
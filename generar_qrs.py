@@ -3,16 +3,21 @@
 Script para generar URLs de códigos QR para empleados.
 The Money Center - Directorio de Empleados
 
-Lee empleados.json y genera un archivo de texto con las URLs
+Lee empleados.json (o su variante NDJSON) y genera un archivo de texto con las URLs
 para generar códigos QR en servicios externos como:
 - https://www.qr-code-generator.com/
 - https://www.qrcode-monkey.com/
 """
 
 import json
+import shutil
 import sys
+import tempfile
+from itertools import chain
 from pathlib import Path
 
+from lectores import iterar_empleados
+
 
 def generar_urls_qr(json_file='empleados.json', output_file='urls_qr.txt', base_url=None):
     """
@@ -26,11 +31,11 @@ def generar_urls_qr(json_file='empleados.json', output_file='urls_qr.txt', base_
     try:
         print(f"📂 Leyendo archivo: {json_file}")
 
-        # Leer el archivo JSON
-        with open(json_file, 'r', encoding='utf-8') as f:
-            empleados = json.load(f)
+        # Leer empleados de forma incremental (JSON o NDJSON)
+        empleados = iterar_empleados(json_file)
+        primero = next(empleados, None)
 
-        if not empleados:
+        if primero is None:
             print("⚠️  El archivo JSON está vacío")
             return False
 
@@ -40,45 +45,43 @@ def generar_urls_qr(json_file='empleados.json', output_file='urls_qr.txt', base_
             print(f"⚠️  No se especificó URL base, usando: {base_url}")
             print("   Recuerda reemplazar 'USUARIO' con tu usuario de GitHub")
 
-        print(f"\n🔗 Generando URLs para {len(empleados)} empleados...")
-
-        # Generar URLs
-        urls = []
-        for empleado in empleados:
-            empleado_id = empleado.get('id', '')
-            nombre = empleado.get('nombre', '')
-            url = f"{base_url}?id={empleado_id}"
-            urls.append({
-                'id': empleado_id,
-                'nombre': nombre,
-                'url': url
-            })
-
-        # Guardar en archivo de texto
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 70 + "\n")
-            f.write("URLS PARA CÓDIGOS QR - THE MONEY CENTER\n")
-            f.write("=" * 70 + "\n\n")
-            f.write(f"Base URL: {base_url}\n")
-            f.write(f"Total de empleados: {len(empleados)}\n")
-            f.write(f"Fecha de generación: {Path(output_file).stat().st_mtime if Path(output_file).exists() else 'N/A'}\n")
-            f.write("\n" + "=" * 70 + "\n\n")
-
-            for item in urls:
-                f.write(f"ID: {item['id']}\n")
-                f.write(f"Nombre: {item['nombre']}\n")
-                f.write(f"URL: {item['url']}\n")
-                f.write("-" * 70 + "\n\n")
-
-        # También generar un archivo con solo las URLs (útil para procesamiento en lote)
+        print(f"\n🔗 Generando URLs...")
+
+        # Escribir cada URL en cuanto se lee el empleado: el detalle va a un
+        # temporal (el total del encabezado se conoce al final) y las URLs
+        # directo al archivo de solo URLs (útil para procesamiento en lote)
         urls_only_file = output_file.replace('.txt', '_solo_urls.txt')
-        with open(urls_only_file, 'w', encoding='utf-8') as f:
-            for item in urls:
-                f.write(f"{item['url']}\n")
+        total = 0
+
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as cuerpo, \
+                open(urls_only_file, 'w', encoding='utf-8') as f_urls:
+            for empleado in chain([primero], empleados):
+                empleado_id = empleado.get('id', '')
+                nombre = empleado.get('nombre', '')
+                url = f"{base_url}?id={empleado_id}"
+
+                cuerpo.write(f"ID: {empleado_id}\n")
+                cuerpo.write(f"Nombre: {nombre}\n")
+                cuerpo.write(f"URL: {url}\n")
+                cuerpo.write("-" * 70 + "\n\n")
+                f_urls.write(f"{url}\n")
+                total += 1
+
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write("=" * 70 + "\n")
+                f.write("URLS PARA CÓDIGOS QR - THE MONEY CENTER\n")
+                f.write("=" * 70 + "\n\n")
+                f.write(f"Base URL: {base_url}\n")
+                f.write(f"Total de empleados: {total}\n")
+                f.write(f"Fecha de generación: {Path(output_file).stat().st_mtime if Path(output_file).exists() else 'N/A'}\n")
+                f.write("\n" + "=" * 70 + "\n\n")
+                cuerpo.seek(0)
+                shutil.copyfileobj(cuerpo, f)
 
         print(f"\n✅ Archivos generados exitosamente!")
         print(f"   📁 Archivo con detalles: {output_file}")
         print(f"   📁 Archivo solo URLs: {urls_only_file}")
+        print(f"   📊 Total de empleados: {total}")
         print(f"\n📋 Próximos pasos:")
         print(f"   1. Abre {output_file} para ver todas las URLs")
         print(f"   2. Usa un generador de códigos QR en lote:")
@@ -4,17 +4,29 @@ Script para generar códigos QR solo para empleados nuevos.
 The Money Center - Directorio de Empleados
 
 Este script:
-1. Lee empleados.json
+1. Lee empleados.json (o su variante NDJSON) de forma incremental
 2. Verifica qué QR codes ya existen
-3. Genera solo los QR codes faltantes
+3. Genera solo los QR codes faltantes, a medida que los encuentra
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
+Con --silencioso / --log controla el reporte de progreso (ver progreso.py).
+Con --firmar / --vigencia el QR lleva además un token firmado que se
+verifica sin conexión (ver firma_qr.py).
 """
 
 import json
-import qrcode
 import sys
+from itertools import chain
 from pathlib import Path
 import re
 
+from escritores import escribir_atomico
+from generar_qrs_imagenes import crear_png_qr
+from firma_qr import firmador_desde_argv
+from lectores import contar_empleados, iterar_empleados
+from metricas import SIN_METRICAS, metricas_desde_argv
+from progreso import Progreso, progreso_desde_argv
+
 
 def sanitize_filename(name):
     """
@@ -41,7 +53,8 @@ def sanitize_filename(name):
     return name
 
 
-def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir='qr_codes'):
+def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir='qr_codes', metricas=None,
+                          opciones_progreso=None, firmador=None):
     """
     Genera códigos QR solo para empleados que no tienen QR code.
 
@@ -49,7 +62,12 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
         json_file: Ruta al archivo JSON de empleados
         base_url: URL base (ej: https://usuario.github.io/credenciales-empleados)
         output_dir: Directorio donde guardar las imágenes
+        metricas: Metricas para el reporte por fase (opcional)
+        opciones_progreso: Opciones de Progreso (silencioso, log_file)
+        firmador: Firmador de firma_qr.py para QR firmados (opcional)
     """
+    metricas = metricas or SIN_METRICAS
+    opciones_progreso = opciones_progreso or {}
     try:
         print("=" * 70)
         print("  GENERADOR INCREMENTAL DE CÓDIGOS QR - THE MONEY CENTER")
@@ -57,11 +75,11 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
         print()
         print(f"📂 Leyendo archivo: {json_file}")
 
-        # Leer el archivo JSON
-        with open(json_file, 'r', encoding='utf-8') as f:
-            empleados = json.load(f)
+        # Leer empleados de forma incremental (JSON o NDJSON)
+        empleados = metricas.iterar('parse', iterar_empleados(json_file))
+        primero = next(empleados, None)
 
-        if not empleados:
+        if primero is None:
             print("⚠️  El archivo JSON está vacío")
             return False
 
@@ -75,13 +93,23 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
         output_path.mkdir(exist_ok=True)
 
         print(f"📁 Directorio de salida: {output_dir}/")
-        print(f"\n🔍 Verificando QR codes existentes...\n")
+        print(f"\n🔍 Verificando QR codes existentes y generando los faltantes...\n")
 
-        # Verificar qué QR codes ya existen
-        empleados_faltantes = []
-        empleados_existentes = []
+        # Contar antes (solo NDJSON/SQLite, sin decodificar) para estimar el tiempo restante
+        total = None if opciones_progreso.get('silencioso') else contar_empleados(json_file)
+        progreso = Progreso("Verificando QR", total, **opciones_progreso)
+
+        # Una sola pasada: cada empleado se verifica y, si le falta el QR,
+        # se genera en ese momento
+        total_empleados = 0
+        existentes = 0
+        exitos = 0
+        errores = 0
 
-        for empleado in empleados:
+        for empleado in chain([primero], empleados):
+            total_empleados += 1
+            metricas.contar()
+            progreso.avanzar()
             nombre = empleado.get('nombre', '')
             if not nombre:
                 continue
@@ -90,64 +118,49 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
             filepath = output_path / f"{filename}.png"
 
             if filepath.exists():
-                empleados_existentes.append(nombre)
-            else:
-                empleados_faltantes.append(empleado)
-
-        # Resumen de verificación
-        print(f"📊 ESTADO ACTUAL:")
-        print(f"   • Total empleados:     {len(empleados)}")
-        print(f"   • QR existentes:       {len(empleados_existentes)}")
-        print(f"   • QR faltantes:        {len(empleados_faltantes)}")
-        print()
-
-        if len(empleados_faltantes) == 0:
-            print("✅ Todos los QR codes ya están generados")
-            print(f"   No hay nada que hacer")
-            return True
-
-        # Generar QR codes faltantes
-        print(f"🔨 Generando {len(empleados_faltantes)} códigos QR nuevos...\n")
-
-        exitos = 0
-        errores = 0
+                existentes += 1
+                continue
 
-        for idx, empleado in enumerate(empleados_faltantes, 1):
+            idx = exitos + errores + 1
             try:
                 empleado_id = empleado.get('id', '')
-                nombre = empleado.get('nombre', f'empleado_{idx}')
 
-                # Construir URL
-                url = f"{base_url}?id={empleado_id}"
+                # Construir URL (con token firmado si se pidió --firmar)
+                if firmador:
+                    url = firmador.url(base_url, empleado)
+                else:
+                    url = f"{base_url}?id={empleado_id}"
 
                 # Crear código QR
-                qr = qrcode.QRCode(
-                    version=1,  # Tamaño del QR (1 es el más pequeño)
-                    error_correction=qrcode.constants.ERROR_CORRECT_H,  # Alta corrección de errores
-                    box_size=10,  # Tamaño de cada "cuadrito"
-                    border=4,  # Borde blanco alrededor
-                )
-                qr.add_data(url)
-                qr.make(fit=True)
-
-                # Crear imagen
-                img = qr.make_image(fill_color="black", back_color="white")
-
-                # Nombre del archivo
-                filename = sanitize_filename(nombre)
-                filepath = output_path / f"{filename}.png"
+                png = crear_png_qr(url, metricas)
 
                 # Guardar imagen
-                img.save(filepath)
+                with metricas.fase('write'):
+                    escribir_atomico(filepath, png)
 
                 exitos += 1
-                print(f"✅ [{idx}/{len(empleados_faltantes)}] {nombre}")
+                progreso.registrar('ok', nombre=nombre, archivo=filepath.name)
 
             except Exception as e:
                 errores += 1
-                print(f"❌ [{idx}/{len(empleados_faltantes)}] Error con {nombre}: {str(e)}")
+                progreso.error(f"[{idx}] Error con {nombre}: {str(e)}", nombre=nombre)
                 continue
 
+        progreso.terminar()
+
+        # Resumen de verificación
+        print()
+        print(f"📊 ESTADO:")
+        print(f"   • Total empleados:     {total_empleados}")
+        print(f"   • QR existentes:       {existentes}")
+        print(f"   • QR faltantes:        {exitos + errores}")
+        print()
+
+        if exitos + errores == 0:
+            print("✅ Todos los QR codes ya están generados")
+            print(f"   No hay nada que hacer")
+            return True
+
         # Resumen final
         print(f"\n{'='*70}")
         print(f"✅ Generación completada!")
@@ -156,7 +169,7 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
         print(f"   • QR codes nuevos generados: {exitos}")
         if errores > 0:
             print(f"   ⚠️  Errores: {errores}")
-        print(f"   • Total QR codes ahora: {len(empleados_existentes) + exitos}")
+        print(f"   • Total QR codes ahora: {existentes + exitos}")
         print(f"📁 Ubicación: {output_path.absolute()}/")
         print(f"{'='*70}\n")
 
@@ -164,11 +177,9 @@ def generar_qrs_faltantes(json_file='empleados.json', base_url=None, output_dir=
         if exitos > 0:
             print("📋 PRÓXIMOS PASOS:")
             print(f"   1. Verifica los {exitos} QR codes nuevos en: {output_dir}/")
-            print(f"   2. Copia los QR al proyecto web:")
-            print(f"      cp -r {output_dir}/* public/qr_codes/")
-            print(f"   3. Actualiza el JSON en el proyecto:")
-            print(f"      cp {json_file} public/empleados.json")
-            print(f"   4. Build y deploy:")
+            print(f"   2. Publica los QR y el JSON en el proyecto web:")
+            print(f"      python publicar.py {json_file} {output_dir} public")
+            print(f"   3. Build y deploy:")
             print(f"      npm run build")
             print(f"      npm run deploy")
 
@@ -193,16 +204,29 @@ def main():
     json_file = 'empleados.json'
     output_dir = 'qr_codes'
     base_url = None
+    metricas = metricas_desde_argv(sys.argv, 'generar_qrs_faltantes')
+    opciones_progreso = progreso_desde_argv(sys.argv, 'generar_qrs_faltantes')
+    try:
+        firmador = firmador_desde_argv(sys.argv)
+    except Exception as e:
+        print(f"❌ Error: no se pudo preparar la firma: {str(e)}")
+        sys.exit(1)
 
     # Procesar argumentos de línea de comandos
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
-            print("Uso: python generar_qrs_faltantes.py [archivo_json] [output_dir] [base_url]")
+            print("Uso: python generar_qrs_faltantes.py [archivo_json] [output_dir] [base_url] [opciones]")
             print()
             print("Parámetros:")
             print("  archivo_json : Archivo JSON con empleados (default: empleados.json)")
             print("  output_dir   : Carpeta para guardar QR (default: qr_codes)")
             print("  base_url     : URL base de GitHub Pages")
+            print("  --metricas   : Reporte de tiempo por fase (metricas_generar_qrs_faltantes.json)")
+            print("  --perfil     : Además guarda el perfil cProfile de la fase más lenta")
+            print("  --silencioso : Sin contador de progreso (solo errores y resumen)")
+            print("  --log        : Registro JSONL de QR generados (progreso_generar_qrs_faltantes.jsonl)")
+            print("  --firmar     : QR con token firmado (clave: firma_qr.pem; --firmar=otra.pem)")
+            print("  --vigencia   : Vigencia del token: AAAA-MM-DD o AAAA-MM-DD:AAAA-MM-DD")
             print()
             print("Ejemplos:")
             print("  python generar_qrs_faltantes.py")
@@ -230,7 +254,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar generación
-    success = generar_qrs_faltantes(json_file, base_url, output_dir)
+    success = generar_qrs_faltantes(json_file, base_url, output_dir, metricas, opciones_progreso, firmador)
+    metricas.guardar()
 
     sys.exit(0 if success else 1)
 
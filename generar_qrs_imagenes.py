@@ -4,14 +4,28 @@ Script para generar códigos QR como imágenes PNG.
 The Money Center - Directorio de Empleados
 
 Genera una imagen QR por cada empleado con su URL única.
+Lee empleados.json (o su variante NDJSON) de forma incremental.
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
+Con --silencioso / --log controla el reporte de progreso (ver progreso.py).
+Con --firmar / --vigencia el QR lleva además un token firmado que se
+verifica sin conexión (ver firma_qr.py).
 """
 
 import json
 import qrcode
 import sys
+from io import BytesIO
+from itertools import chain
 from pathlib import Path
 import re
 
+from escritores import escribir_atomico
+from firma_qr import firmador_desde_argv
+from lectores import contar_empleados, iterar_empleados
+from metricas import SIN_METRICAS, metricas_desde_argv
+from progreso import Progreso, progreso_desde_argv
+
 
 def sanitize_filename(name):
     """
@@ -38,7 +52,41 @@ def sanitize_filename(name):
     return name
 
 
-def generar_qrs(json_file='empleados.json', base_url=None, output_dir='qr_codes'):
+def crear_png_qr(url, metricas=None):
+    """
+    Genera el código QR de una URL y lo codifica como PNG.
+
+    Args:
+        url: URL a codificar
+        metricas: Metricas donde medir las fases transform y encode (opcional)
+
+    Returns:
+        Contenido del PNG (bytes), listo para escribir a disco
+    """
+    metricas = metricas or SIN_METRICAS
+
+    with metricas.fase('transform'):
+        # Crear código QR
+        qr = qrcode.QRCode(
+            version=1,  # Tamaño del QR (1 es el más pequeño)
+            error_correction=qrcode.constants.ERROR_CORRECT_H,  # Alta corrección de errores
+            box_size=10,  # Tamaño de cada "cuadrito"
+            border=4,  # Borde blanco alrededor
+        )
+        qr.add_data(url)
+        qr.make(fit=True)
+
+    with metricas.fase('encode'):
+        # Crear imagen
+        img = qr.make_image(fill_color="black", back_color="white")
+        buffer = BytesIO()
+        img.save(buffer)
+
+    return buffer.getvalue()
+
+
+def generar_qrs(json_file='empleados.json', base_url=None, output_dir='qr_codes', metricas=None,
+                opciones_progreso=None, firmador=None):
     """
     Genera códigos QR como imágenes PNG para cada empleado.
 
@@ -46,15 +94,21 @@ def generar_qrs(json_file='empleados.json', base_url=None, output_dir='qr_codes'
         json_file: Ruta al archivo JSON de empleados
         base_url: URL base (ej: https://usuario.github.io/credenciales-empleados)
         output_dir: Directorio donde guardar las imágenes
+        metricas: Metricas para el reporte por fase (opcional)
+        opciones_progreso: Opciones de Progreso (silencioso, log_file)
+        firmador: Firmador de firma_qr.py para QR firmados (opcional)
     """
+    metricas = metricas or SIN_METRICAS
+    opciones_progreso = opciones_progreso or {}
     try:
         print(f"📂 Leyendo archivo: {json_file}")
 
-        # Leer el archivo JSON
-        with open(json_file, 'r', encoding='utf-8') as f:
-            empleados = json.load(f)
+        # Leer empleados de forma incremental (JSON o NDJSON): el primer QR
+        # se genera sin esperar a que se lea el archivo completo
+        empleados = metricas.iterar('parse', iterar_empleados(json_file))
+        primero = next(empleados, None)
 
-        if not empleados:
+        if primero is None:
             print("⚠️  El archivo JSON está vacío")
             return False
 
@@ -68,48 +122,50 @@ def generar_qrs(json_file='empleados.json', base_url=None, output_dir='qr_codes'
         output_path.mkdir(exist_ok=True)
         print(f"📁 Creando directorio: {output_dir}/")
 
-        print(f"\n🔨 Generando {len(empleados)} códigos QR...\n")
+        print(f"\n🔨 Generando códigos QR...\n")
+
+        # Contar antes (solo NDJSON/SQLite, sin decodificar) para estimar el tiempo restante
+        total = None if opciones_progreso.get('silencioso') else contar_empleados(json_file)
+        progreso = Progreso("Generando QR", total, **opciones_progreso)
 
         # Generar QR para cada empleado
         exitos = 0
         errores = 0
 
-        for idx, empleado in enumerate(empleados, 1):
+        for idx, empleado in enumerate(chain([primero], empleados), 1):
             try:
                 empleado_id = empleado.get('id', '')
                 nombre = empleado.get('nombre', f'empleado_{idx}')
 
-                # Construir URL
-                url = f"{base_url}?id={empleado_id}"
+                # Construir URL (con token firmado si se pidió --firmar)
+                if firmador:
+                    url = firmador.url(base_url, empleado)
+                else:
+                    url = f"{base_url}?id={empleado_id}"
 
                 # Crear código QR
-                qr = qrcode.QRCode(
-                    version=1,  # Tamaño del QR (1 es el más pequeño)
-                    error_correction=qrcode.constants.ERROR_CORRECT_H,  # Alta corrección de errores
-                    box_size=10,  # Tamaño de cada "cuadrito"
-                    border=4,  # Borde blanco alrededor
-                )
-                qr.add_data(url)
-                qr.make(fit=True)
-
-                # Crear imagen
-                img = qr.make_image(fill_color="black", back_color="white")
+                png = crear_png_qr(url, metricas)
 
                 # Nombre del archivo
                 filename = sanitize_filename(nombre)
                 filepath = output_path / f"{filename}.png"
 
                 # Guardar imagen
-                img.save(filepath)
+                with metricas.fase('write'):
+                    # Temporal + renombrado: nunca queda un PNG a medio escribir
+                    escribir_atomico(filepath, png)
 
+                metricas.contar()
                 exitos += 1
-                print(f"✅ [{idx}/{len(empleados)}] {nombre}")
+                progreso.avanzar(nombre=nombre, archivo=filepath.name)
 
             except Exception as e:
                 errores += 1
-                print(f"❌ [{idx}/{len(empleados)}] Error con {nombre}: {str(e)}")
+                progreso.error(f"[{idx}] Error con {nombre}: {str(e)}", nombre=nombre)
                 continue
 
+        progreso.terminar()
+
         # Resumen
         print(f"\n{'='*70}")
         print(f"✅ Generación completada!")
@@ -151,16 +207,29 @@ def main():
     json_file = 'empleados.json'
     output_dir = 'qr_codes'
     base_url = None
+    metricas = metricas_desde_argv(sys.argv, 'generar_qrs_imagenes')
+    opciones_progreso = progreso_desde_argv(sys.argv, 'generar_qrs_imagenes')
+    try:
+        firmador = firmador_desde_argv(sys.argv)
+    except Exception as e:
+        print(f"❌ Error: no se pudo preparar la firma: {str(e)}")
+        sys.exit(1)
 
     # Procesar argumentos de línea de comandos
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
-            print("Uso: python generar_qrs_imagenes.py [archivo_json] [output_dir] [base_url]")
+            print("Uso: python generar_qrs_imagenes.py [archivo_json] [output_dir] [base_url] [opciones]")
             print()
             print("Parámetros:")
             print("  archivo_json : Archivo JSON con empleados (default: empleados.json)")
             print("  output_dir   : Carpeta para guardar QR (default: qr_codes)")
             print("  base_url     : URL base de GitHub Pages")
+            print("  --metricas   : Reporte de tiempo por fase (metricas_generar_qrs_imagenes.json)")
+            print("  --perfil     : Además guarda el perfil cProfile de la fase más lenta")
+            print("  --silencioso : Sin contador de progreso (solo errores y resumen)")
+            print("  --log        : Registro JSONL por empleado (progreso_generar_qrs_imagenes.jsonl)")
+            print("  --firmar     : QR con token firmado (clave: firma_qr.pem; --firmar=otra.pem)")
+            print("  --vigencia   : Vigencia del token: AAAA-MM-DD o AAAA-MM-DD:AAAA-MM-DD")
             print()
             print("Ejemplos:")
             print("  python generar_qrs_imagenes.py")
@@ -184,7 +253,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar generación
-    success = generar_qrs(json_file, base_url, output_dir)
+    success = generar_qrs(json_file, base_url, output_dir, metricas, opciones_progreso, firmador)
+    metricas.guardar()
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Índice de búsqueda del directorio (indice_busqueda.json).
+The Money Center - Directorio de Empleados
+
+La lista de empleados de la web resuelve las búsquedas con este índice en
+lugar de recorrer a todos los empleados en cada tecla. Los textos se
+normalizan sin acentos y en minúsculas ("PÉREZ" → "perez"), igual que
+foldText en src/utils/busqueda.ts.
+
+Formato (los ordinales son posiciones en empleados.json y cada lista se
+guarda con diferencias: [3, 7, 8] → [3, 4, 1]):
+
+    {
+      "version": 1,
+      "total": 208,
+      "primero": "<id del primer empleado>",
+      "ultimo": "<id del último empleado>",
+      "tokens": ["adan", "adolfo", ...],          // ordenados
+      "postings": [[0], [1, 17], ...],            // empleados de cada token
+      "trigramas": {"ada": [0, 52], ...},         // trigramas de los nombres
+      "gerencias": [{"nombre": "...", "total": 12, "ordinales": [...]}]
+    }
+
+Tokens: palabras del nombre. Los prefijos se resuelven con búsqueda
+binaria en "tokens"; las búsquedas de 3 o más caracteres dentro de una
+palabra, con "trigramas". El UUID y el celular no se indexan (duplicarían
+el tamaño del JSON): las palabras con dígitos se comparan directamente.
+
+Se genera junto a empleados.json al exportar (actualizar_empleados.py,
+vigilar_maestro.py) o a mano:
+
+    python indice_busqueda.py public/empleados.json
+"""
+
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from escritores import escribir_atomico
+from lectores import iterar_empleados
+
+
+NOMBRE_INDICE = 'indice_busqueda.json'
+
+VERSION_INDICE = 1
+
+_DIACRITICOS = re.compile('[\u0300-\u036f]')
+_SEPARADORES = re.compile('[^a-z0-9]+')
+
+
+def normalizar(texto):
+    """Texto sin acentos y en minúsculas. Ejemplo: "PÉREZ Núñez" -> "perez nunez" """
+    return _DIACRITICOS.sub('', unicodedata.normalize('NFD', texto or '')).lower()
+
+
+def tokens_nombre(nombre):
+    """Palabras normalizadas del nombre."""
+    return [t for t in _SEPARADORES.split(normalizar(nombre)) if t]
+
+
+def trigramas(token):
+    """Trigramas de una palabra. Ejemplo: "perez" -> {"per", "ere", "rez"}"""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def codificar_deltas(ordinales):
+    """Lista ordenada de ordinales como diferencias sucesivas."""
+    anterior = 0
+    deltas = []
+    for ordinal in ordinales:
+        deltas.append(ordinal - anterior)
+        anterior = ordinal
+    return deltas
+
+
+def construir_indice(empleados):
+    """
+    Construye el índice de búsqueda.
+
+    Args:
+        empleados: Iterable de empleados en el orden de empleados.json
+
+    Returns:
+        Diccionario con el formato de indice_busqueda.json
+    """
+    por_token = {}
+    por_trigrama = {}
+    por_gerencia = {}
+    total = 0
+    primero = ultimo = None
+
+    for ordinal, emp in enumerate(empleados):
+        total += 1
+        if primero is None:
+            primero = emp.get('id')
+        ultimo = emp.get('id')
+
+        tokens = set(tokens_nombre(emp.get('nombre', '')))
+        for token in tokens:
+            por_token.setdefault(token, []).append(ordinal)
+
+        for trigrama in set().union(*(trigramas(t) for t in tokens)):
+            por_trigrama.setdefault(trigrama, []).append(ordinal)
+
+        por_gerencia.setdefault(emp.get('gerencia', ''), []).append(ordinal)
+
+    tokens = sorted(por_token)
+    return {
+        'version': VERSION_INDICE,
+        'total': total,
+        'primero': primero,
+        'ultimo': ultimo,
+        'tokens': tokens,
+        'postings': [codificar_deltas(por_token[t]) for t in tokens],
+        'trigramas': {t: codificar_deltas(por_trigrama[t]) for t in sorted(por_trigrama)},
+        'gerencias': [
+            {'nombre': g, 'total': len(por_gerencia[g]), 'ordinales': codificar_deltas(por_gerencia[g])}
+            for g in sorted(por_gerencia)
+        ],
+    }
+
+
+def ruta_indice(json_file):
+    """Ruta del índice junto al JSON de empleados."""
+    return Path(json_file).with_name(NOMBRE_INDICE)
+
+
+def escribir_indice(empleados, ruta):
+    """
+    Escribe el índice de búsqueda (de forma atómica: temporal + renombrado).
+
+    Returns:
+        Diccionario del índice escrito
+    """
+    indice = construir_indice(empleados)
+    escribir_atomico(ruta, json.dumps(indice, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return indice
+
+
+def actualizar_indice(empleados, json_file):
+    """
+    Reescribe el índice junto a un JSON de la web (los .ndjson y .db no
+    llevan índice).
+
+    Returns:
+        Ruta del índice escrito, o None
+    """
+    if Path(json_file).suffix.lower() != '.json':
+        return None
+    ruta = ruta_indice(json_file)
+    escribir_indice(empleados, ruta)
+    return ruta
+
+
+def main():
+    """Función principal del script."""
+    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
+        print("Uso: python indice_busqueda.py [json_file] [indice_file]")
+        print()
+        print("Parámetros:")
+        print("  json_file   : JSON de empleados (default: public/empleados.json)")
+        print(f"  indice_file : Índice de salida (default: {NOMBRE_INDICE} junto al JSON)")
+        sys.exit(0)
+
+    json_file = sys.argv[1] if len(sys.argv) > 1 else 'public/empleados.json'
+    indice_file = sys.argv[2] if len(sys.argv) > 2 else ruta_indice(json_file)
+
+    if not Path(json_file).exists():
+        print(f"❌ Error: No se encontró el archivo {json_file}")
+        sys.exit(1)
+
+    print(f"📂 Leyendo: {json_file}")
+    indice = escribir_indice(iterar_empleados(json_file), indice_file)
+    print(f"✅ Índice de búsqueda: {indice['total']:,} empleados, {len(indice['tokens']):,} tokens, "
+          f"{len(indice['trigramas']):,} trigramas, {len(indice['gerencias']):,} gerencias")
+    print(f"📁 Archivo generado: {indice_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Script para consolidar los Excel de varias sucursales en un Excel maestro.
+The Money Center - Directorio de Empleados
+
+Este script:
+1. Busca los Excel (o CSV/Parquet) de sucursales en un directorio o patrón glob
+2. Asigna a cada archivo un layout de columnas/filas (archivo de layouts)
+3. Lee todos los Excel en paralelo (un proceso por archivo)
+4. Combina empleados actuales + sucursales en orden determinista
+5. Genera el Excel maestro (mismo formato que crear_excel_maestro.py)
+
+Archivo de layouts (JSON): patrón de nombre de archivo → layout.
+Se usa el primer patrón que coincide, en el orden declarado:
+
+    {
+      "*MTY*.xlsx": {"fila_inicio": 4, "gerencia": "B", "nombre": "C",
+                     "celular": "D", "puesto": "Gerente"},
+      "*": "asesores"
+    }
+
+Un layout puede ser un diccionario o el nombre de un layout predefinido
+("gerentes" o "asesores").
+"""
+
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+
+from crear_excel_maestro import LAYOUT_GERENTES, escribir_excel_maestro, leer_gerentes
+from lectores import EXTENSIONES, iterar_empleados
+
+
+# Layout de excel_to_json.py: D=gerencia, E=nombre, F=celular, datos desde fila 3
+LAYOUT_ASESORES = {
+    'fila_inicio': 3,
+    'gerencia': 'D',
+    'nombre': 'E',
+    'celular': 'F',
+    'puesto': 'Asesor',
+}
+
+LAYOUTS_PREDEFINIDOS = {
+    'gerentes': LAYOUT_GERENTES,
+    'asesores': LAYOUT_ASESORES,
+}
+
+
+def buscar_workbooks(entrada):
+    """
+    Devuelve la lista ordenada de Excel a procesar.
+
+    Args:
+        entrada: Directorio (se toman todos los xlsx/csv/parquet) o patrón glob
+    """
+    ruta = Path(entrada)
+    if ruta.is_dir():
+        archivos = (p for p in ruta.iterdir() if p.suffix.lower() in EXTENSIONES)
+    else:
+        archivos = (Path(p) for p in glob.glob(entrada))
+
+    # Ignorar archivos de bloqueo de Excel/LibreOffice (~$archivo.xlsx, .~lock...)
+    return sorted(
+        p for p in archivos
+        if p.is_file() and not p.name.startswith(('~$', '.~lock'))
+    )
+
+
+def cargar_layouts(layouts_file=None):
+    """
+    Carga el archivo de layouts y resuelve los nombres predefinidos.
+
+    Returns:
+        Lista de (patrón, layout) en el orden declarado
+    """
+    if not layouts_file:
+        return [('*', LAYOUT_GERENTES)]
+
+    with open(layouts_file, 'r', encoding='utf-8') as f:
+        declarados = json.load(f)
+
+    layouts = []
+    for patron, layout in declarados.items():
+        if isinstance(layout, str):
+            if layout not in LAYOUTS_PREDEFINIDOS:
+                raise ValueError(f"Layout desconocido '{layout}' para el patrón '{patron}'")
+            layout = LAYOUTS_PREDEFINIDOS[layout]
+
+        faltantes = {'fila_inicio', 'gerencia', 'nombre', 'celular'} - set(layout)
+        if faltantes:
+            raise ValueError(f"Al layout de '{patron}' le faltan: {', '.join(sorted(faltantes))}")
+
+        layouts.append((patron, layout))
+
+    return layouts
+
+
+def layout_para(archivo, layouts):
+    """Devuelve el primer layout cuyo patrón coincide con el nombre del archivo."""
+    for patron, layout in layouts:
+        if fnmatch(archivo.name, patron):
+            return layout
+    return None
+
+
+def ingestar_sucursales(
+    entrada,
+    layouts_file=None,
+    output_file='empleados_maestro.xlsx',
+    json_file='empleados.json',
+    workers=None
+):
+    """
+    Consolida los Excel de sucursales en un Excel maestro.
+
+    Args:
+        entrada: Directorio o patrón glob con los Excel de sucursales
+        layouts_file: Archivo JSON con los layouts por patrón (opcional)
+        output_file: Nombre del archivo Excel de salida
+        json_file: Archivo JSON con empleados actuales (con UUIDs), si existe
+        workers: Número de procesos (default: uno por CPU)
+    """
+    try:
+        print("=" * 70)
+        print("  INGESTA DE SUCURSALES - THE MONEY CENTER")
+        print("=" * 70)
+        print()
+
+        layouts = cargar_layouts(layouts_file)
+        archivos = buscar_workbooks(entrada)
+
+        if not archivos:
+            print(f"❌ Error: No se encontraron Excel en '{entrada}'")
+            return False
+
+        # Asignar layout a cada archivo
+        trabajos = []
+        for archivo in archivos:
+            layout = layout_para(archivo, layouts)
+            if layout is None:
+                print(f"⚠️  Sin layout para {archivo.name}, se omite")
+                continue
+            trabajos.append((archivo, layout))
+
+        # 1. Leer empleados actuales del JSON (preservan su UUID)
+        empleados_actuales = []
+        if json_file and Path(json_file).exists():
+            print(f"📂 Leyendo empleados actuales de: {json_file}")
+            empleados_actuales = list(iterar_empleados(json_file))
+            print(f"   ✓ {len(empleados_actuales)} empleados cargados")
+
+        # 2. Leer todas las sucursales en paralelo.
+        # executor.map conserva el orden de entrada (archivos ordenados por
+        # nombre), así el maestro sale igual sin importar qué proceso termine primero.
+        workers = workers or min(len(trabajos), os.cpu_count() or 1) or 1
+        print(f"\n📂 Leyendo {len(trabajos)} Excel de sucursales ({workers} procesos)...")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = list(executor.map(
+                leer_gerentes,
+                [str(archivo) for archivo, _ in trabajos],
+                [layout for _, layout in trabajos],
+            ))
+
+        # 3. Combinar sin duplicar (mismo nombre y gerencia)
+        vistos = {
+            (emp.get('nombre', ''), emp.get('gerencia', ''))
+            for emp in empleados_actuales
+        }
+        empleados_nuevos = []
+        duplicados = 0
+
+        for (archivo, _), empleados in zip(trabajos, resultados):
+            agregados = 0
+            for emp in empleados:
+                clave = (emp['nombre'], emp['gerencia'])
+                if clave in vistos:
+                    duplicados += 1
+                    continue
+                vistos.add(clave)
+                empleados_nuevos.append(emp)
+                agregados += 1
+            print(f"   ✓ {archivo.name}: {agregados} empleados")
+
+        # 4. Crear Excel maestro
+        print(f"\n📝 Creando Excel maestro...")
+        escribir_excel_maestro(empleados_actuales + empleados_nuevos, output_file)
+
+        # Resumen
+        print(f"\n✅ Excel maestro creado exitosamente!")
+        print("=" * 70)
+        print(f"📊 RESUMEN:")
+        print(f"   • Sucursales procesadas: {len(trabajos)}")
+        print(f"   • Empleados actuales:    {len(empleados_actuales)}")
+        print(f"   • Empleados nuevos:      {len(empleados_nuevos)}")
+        if duplicados > 0:
+            print(f"   • Duplicados omitidos:   {duplicados}")
+        print(f"   • TOTAL:                 {len(empleados_actuales) + len(empleados_nuevos)}")
+        print(f"\n📁 Archivo generado: {output_file}")
+        print("=" * 70)
+        print()
+        print("📋 PRÓXIMOS PASOS:")
+        print("   1. Abre el Excel y verifica los datos")
+        print(f"   2. Ejecuta: python actualizar_empleados.py {output_file}")
+        print()
+
+        return True
+
+    except FileNotFoundError as e:
+        print(f"❌ Error: No se encontró el archivo: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    # Parámetros
+    layouts_file = None
+    output_file = 'empleados_maestro.xlsx'
+
+    # Procesar argumentos
+    if len(sys.argv) < 2 or sys.argv[1] in ['-h', '--help']:
+        print("Uso: python ingesta_sucursales.py <directorio|glob> [layouts.json] [output_file]")
+        print()
+        print("Parámetros:")
+        print("  directorio|glob : Carpeta con los Excel de sucursales o patrón (entre comillas)")
+        print("  layouts.json    : Layout de columnas/filas por archivo (default: layout de gerentes)")
+        print("  output_file     : Nombre del archivo de salida (default: empleados_maestro.xlsx)")
+        print()
+        print("Ejemplos:")
+        print("  python ingesta_sucursales.py ~/Descargas/sucursales")
+        print('  python ingesta_sucursales.py "~/Descargas/sucursales/*.xlsx" layouts.json')
+        print('  python ingesta_sucursales.py ~/Descargas/sucursales layouts.json maestro.xlsx')
+        sys.exit(0 if len(sys.argv) > 1 else 1)
+
+    entrada = os.path.expanduser(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        layouts_file = sys.argv[2]
+
+    if len(sys.argv) > 3:
+        output_file = sys.argv[3]
+
+    # Verificar que el archivo de layouts existe (si se proporcionó)
+    if layouts_file and not Path(layouts_file).exists():
+        print(f"❌ Error: El archivo '{layouts_file}' no existe")
+        sys.exit(1)
+
+    # Ejecutar
+    success = ingestar_sucursales(entrada, layouts_file, output_file)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
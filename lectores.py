@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Lectores de archivos de empleados.
+The Money Center - Directorio de Empleados
+
+Archivos tabulares (xlsx, csv, parquet) → leer_filas()
+Exportaciones JSON/NDJSON/SQLite (empleados.json) → iterar_empleados()
+
+Todos los lectores entregan las filas como tuplas de valores, igual que
+openpyxl con iter_rows(values_only=True), para que los scripts procesen
+cualquier formato con el mismo código:
+
+- xlsx:    openpyxl en modo read_only (streaming sobre el XML)
+- csv:     csv.reader línea por línea, sin cargar el archivo completo
+- parquet: pyarrow, leyendo columnas por lotes (sin XML)
+
+En xlsx y csv las filas conservan la numeración de la hoja (min_row cuenta
+los encabezados). En parquet los encabezados son el esquema del archivo,
+así que solo se entregan filas de datos y min_row no aplica.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+
+
+EXTENSIONES_NDJSON = {'.ndjson', '.jsonl'}
+
+EXTENSIONES = {
+    '.xlsx': 'xlsx',
+    '.xlsm': 'xlsx',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+}
+
+
+def detectar_formato(ruta):
+    """
+    Detecta el formato de un archivo por extensión o, si no se reconoce,
+    por sus primeros bytes.
+
+    Returns:
+        'xlsx', 'csv' o 'parquet'
+    """
+    formato = EXTENSIONES.get(Path(ruta).suffix.lower())
+    if formato:
+        return formato
+
+    with open(ruta, 'rb') as f:
+        inicio = f.read(4)
+
+    if inicio.startswith(b'PK'):
+        return 'xlsx'  # Los xlsx son archivos zip
+    if inicio == b'PAR1':
+        return 'parquet'
+    return 'csv'
+
+
+def leer_filas(ruta, min_row=1):
+    """
+    Itera las filas de un archivo de empleados como tuplas de valores.
+
+    Args:
+        ruta: Ruta al archivo (xlsx, csv o parquet)
+        min_row: Primera fila a entregar, contando encabezados (1-based)
+    """
+    formato = detectar_formato(ruta)
+    if formato == 'xlsx':
+        return _leer_xlsx(ruta, min_row)
+    if formato == 'parquet':
+        return _leer_parquet(ruta)
+    return _leer_csv(ruta, min_row)
+
+
+def _leer_xlsx(ruta, min_row):
+    """Filas de la hoja activa de un Excel."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(min_row=min_row, values_only=True)
+    finally:
+        workbook.close()
+
+
+def _leer_csv(ruta, min_row):
+    """Filas de un CSV (detecta el separador: coma, punto y coma o tabulador)."""
+    # utf-8-sig: Excel agrega BOM al exportar CSV UTF-8
+    with open(ruta, 'r', encoding='utf-8-sig', newline='') as f:
+        muestra = f.read(4096)
+        f.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=',;\t')
+        except csv.Error:
+            dialecto = csv.excel
+
+        for idx, row in enumerate(csv.reader(f, dialecto), start=1):
+            if idx >= min_row:
+                yield tuple(row)
+
+
+def _leer_parquet(ruta, tamano_lote=65536):
+    """Filas de un Parquet, leyendo las columnas por lotes."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Para leer archivos Parquet instala pyarrow: pip install pyarrow"
+        ) from None
+
+    archivo = pq.ParquetFile(ruta)
+    for lote in archivo.iter_batches(batch_size=tamano_lote):
+        columnas = [columna.to_pylist() for columna in lote.columns]
+        yield from zip(*columnas)
+
+
+def iterar_empleados(ruta, tamano_bloque=65536):
+    """
+    Itera los empleados de una exportación sin cargarla completa en memoria.
+
+    Acepta el arreglo JSON de siempre (empleados.json), que se decodifica
+    objeto por objeto a medida que se lee, NDJSON (.ndjson/.jsonl) con un
+    empleado por línea, o una base SQLite (.db/.sqlite, ver almacen_sqlite.py).
+
+    Args:
+        ruta: Ruta al archivo JSON, NDJSON o SQLite
+        tamano_bloque: Caracteres a leer por bloque del arreglo JSON
+    """
+    from almacen_sqlite import es_sqlite, iterar_empleados_db
+
+    if es_sqlite(ruta):
+        return iterar_empleados_db(ruta)
+    if Path(ruta).suffix.lower() in EXTENSIONES_NDJSON:
+        return _iterar_ndjson(ruta)
+    return _iterar_json_array(ruta, tamano_bloque)
+
+
+def firma_archivo(ruta):
+    """
+    Fecha de modificación y tamaño del archivo, o None si no existe.
+    Sirve para detectar que un archivo cambió sin leerlo.
+    """
+    try:
+        st = os.stat(ruta)
+    except FileNotFoundError:
+        return None  # Excel puede reemplazar el archivo al guardar
+    return (st.st_mtime_ns, st.st_size)
+
+
+def contar_empleados(ruta, tamano_bloque=1 << 20):
+    """
+    Cuenta los empleados de una exportación solo si es barato, para estimar
+    el tiempo restante antes de procesarlos.
+
+    En SQLite es un COUNT(*) y en NDJSON se cuentan saltos de línea por
+    bloques de bytes, sin decodificar JSON. Un arreglo JSON habría que
+    decodificarlo completo (tanto como procesarlo), así que no se cuenta.
+
+    Returns:
+        Número de empleados, o None si contarlos costaría una pasada completa
+    """
+    from almacen_sqlite import contar_empleados_db, es_sqlite
+
+    if es_sqlite(ruta):
+        return contar_empleados_db(ruta)
+    if Path(ruta).suffix.lower() not in EXTENSIONES_NDJSON:
+        return None
+
+    total = 0
+    ultimo = b'\n'
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tamano_bloque), b''):
+            total += bloque.count(b'\n')
+            ultimo = bloque[-1:]
+    # Última línea sin salto final (las líneas vacías cuentan de más; es una estimación)
+    return total + (ultimo != b'\n')
+
+
+def _iterar_ndjson(ruta):
+    """Empleados de un NDJSON (se ignoran líneas vacías)."""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def _iterar_json_array(ruta, tamano_bloque):
+    """Empleados de un arreglo JSON, decodificados de forma incremental."""
+    decoder = json.JSONDecoder()
+
+    with open(ruta, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        fin_archivo = False
+
+        def siguiente_caracter():
+            """Salta espacios (leyendo más si hace falta) y devuelve el siguiente carácter."""
+            nonlocal buffer, pos, fin_archivo
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer) or fin_archivo:
+                    return buffer[pos] if pos < len(buffer) else ''
+                bloque = f.read(tamano_bloque)
+                fin_archivo = not bloque
+                buffer = buffer[pos:] + bloque
+                pos = 0
+
+        if siguiente_caracter() != '[':
+            raise json.JSONDecodeError("Se esperaba un arreglo JSON", buffer, pos)
+        pos += 1
+
+        if siguiente_caracter() == ']':
+            return
+
+        while True:
+            siguiente_caracter()
+            try:
+                empleado, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # El objeto quedó cortado al final del bloque: leer más y reintentar
+                if fin_archivo:
+                    raise
+                bloque = f.read(tamano_bloque)
+                fin_archivo = not bloque
+                buffer = buffer[pos:] + bloque
+                pos = 0
+                continue
+
+            yield empleado
+
+            separador = siguiente_caracter()
+            pos += 1
+            if separador == ']':
+                return
+            if separador != ',':
+                raise json.JSONDecodeError("Se esperaba ',' o ']'", buffer, pos - 1)
@@ -7,6 +7,9 @@ Este script:
 1. Elimina filas con encabezados como registros
 2. Corrige los puestos según la clasificación correcta
 3. Ajusta gerencias para casos especiales
+
+Con --metricas / --perfil reporta el tiempo por fase (ver metricas.py).
+Con --silencioso / --log controla el reporte de progreso (ver progreso.py).
 """
 
 import openpyxl
@@ -14,15 +17,23 @@ from openpyxl.styles import Font, PatternFill, Alignment
 import sys
 from pathlib import Path
 
+from metricas import SIN_METRICAS, metricas_desde_argv
+from progreso import Progreso, progreso_desde_argv
+
 
-def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empleados_maestro_limpio.xlsx'):
+def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empleados_maestro_limpio.xlsx', metricas=None,
+                          opciones_progreso=None):
     """
     Limpia y corrige el Excel maestro.
 
     Args:
         input_file: Excel maestro original
         output_file: Excel maestro corregido
+        metricas: Metricas para el reporte por fase (opcional)
+        opciones_progreso: Opciones de Progreso (silencioso, log_file)
     """
+    metricas = metricas or SIN_METRICAS
+    opciones_progreso = opciones_progreso or {}
     try:
         print("=" * 70)
         print("  LIMPIEZA DE EXCEL MAESTRO - THE MONEY CENTER")
@@ -31,8 +42,9 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
         print(f"📂 Leyendo: {input_file}")
 
         # Cargar Excel
-        wb = openpyxl.load_workbook(input_file)
-        ws = wb.active
+        with metricas.fase('parse'):
+            wb = openpyxl.load_workbook(input_file)
+            ws = wb.active
 
         # Listas para tracking
         filas_eliminadas = []
@@ -87,10 +99,13 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
         }
 
         print("\n🔍 Procesando empleados...")
+        progreso = Progreso("Procesando filas", max(0, ws.max_row - 1), **opciones_progreso)
 
         # Iterar filas (desde fila 2, saltando encabezado)
         fila_nueva = 2
-        for idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+        filas = metricas.iterar('parse', ws.iter_rows(min_row=2, values_only=True), cuerpo='transform')
+        for idx, row in enumerate(filas, start=2):
+            progreso.avanzar()
             uuid_val = row[0] if len(row) > 0 else ""
             nombre = row[1] if len(row) > 1 else ""
             puesto = row[2] if len(row) > 2 else ""
@@ -106,13 +121,13 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
             # Eliminar filas con encabezados como nombres
             if nombre_limpio in nombres_invalidos:
                 filas_eliminadas.append(f"Fila {idx}: {nombre_limpio}")
-                print(f"  ❌ Eliminando encabezado: {nombre_limpio}")
+                progreso.registrar('eliminada', fila=idx, nombre=nombre_limpio)
                 continue
 
             # Eliminar si gerencia es "DIRECCION" o "PUESTO" (encabezados)
             if str(gerencia).strip().upper() in ['DIRECCION', 'PUESTO', 'GERENCIA']:
                 filas_eliminadas.append(f"Fila {idx}: {nombre_limpio} (gerencia={gerencia})")
-                print(f"  ❌ Eliminando encabezado: {nombre_limpio}")
+                progreso.registrar('eliminada', fila=idx, nombre=nombre_limpio, gerencia=str(gerencia))
                 continue
 
             # Corregir puestos según clasificación
@@ -123,25 +138,25 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
             if nombre_limpio in directores:
                 puesto_corregido, gerencia_corregida = directores[nombre_limpio]
                 filas_corregidas.append(f"{nombre_limpio}: {puesto} → {puesto_corregido}")
-                print(f"  ✏️  Corrigiendo: {nombre_limpio} → Director")
+                progreso.registrar('corregida', fila=idx, nombre=nombre_limpio, puesto=puesto_corregido)
 
             # Asistentes
             elif nombre_limpio in asistentes_especiales:
                 puesto_corregido, gerencia_corregida = asistentes_especiales[nombre_limpio]
                 filas_corregidas.append(f"{nombre_limpio}: {puesto} → {puesto_corregido}")
-                print(f"  ✏️  Corrigiendo: {nombre_limpio} → {puesto_corregido}")
+                progreso.registrar('corregida', fila=idx, nombre=nombre_limpio, puesto=puesto_corregido)
 
             # Consultores
             elif nombre_limpio in consultores:
                 puesto_corregido, gerencia_corregida = consultores[nombre_limpio]
                 filas_corregidas.append(f"{nombre_limpio}: {puesto} → {puesto_corregido}")
-                print(f"  ✏️  Corrigiendo: {nombre_limpio} → Consultor")
+                progreso.registrar('corregida', fila=idx, nombre=nombre_limpio, puesto=puesto_corregido)
 
             # Gerentes especiales
             elif nombre_limpio in gerentes_especiales:
                 puesto_corregido, gerencia_corregida = gerentes_especiales[nombre_limpio]
                 filas_corregidas.append(f"{nombre_limpio}: gerencia → {gerencia_corregida}")
-                print(f"  ✏️  Corrigiendo gerencia: {nombre_limpio}")
+                progreso.registrar('corregida', fila=idx, nombre=nombre_limpio, gerencia=gerencia_corregida)
 
             # Gerentes de Money Centers (los que tienen gerencia tipo "THE MONEY CENTER X")
             elif puesto == "Gerente" and str(gerencia).startswith("THE MONEY CENTER"):
@@ -162,6 +177,9 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
             ])
 
             fila_nueva += 1
+            metricas.contar()
+
+        progreso.terminar()
 
         # Ajustar ancho de columnas
         ws_nuevo.column_dimensions['A'].width = 38  # UUID
@@ -174,7 +192,8 @@ def limpiar_excel_maestro(input_file='empleados_maestro.xlsx', output_file='empl
         ws_nuevo.freeze_panes = 'A2'
 
         # Guardar
-        wb_nuevo.save(output_file)
+        with metricas.fase('write'):
+            wb_nuevo.save(output_file)
 
         # Resumen
         total_final = fila_nueva - 2  # Restar encabezado y empezar desde 0
@@ -219,10 +238,17 @@ def main():
     """Función principal."""
     input_file = 'empleados_maestro.xlsx'
     output_file = 'empleados_maestro_limpio.xlsx'
+    metricas = metricas_desde_argv(sys.argv, 'limpiar_excel_maestro')
+    opciones_progreso = progreso_desde_argv(sys.argv, 'limpiar_excel_maestro')
 
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
-            print("Uso: python limpiar_excel_maestro.py [input_file] [output_file]")
+            print("Uso: python limpiar_excel_maestro.py [input_file] [output_file] [opciones]")
+            print()
+            print("Opciones:")
+            print("  --metricas / --perfil : Reporte de tiempo por fase (ver metricas.py)")
+            print("  --silencioso          : Sin contador de progreso")
+            print("  --log                 : Registro JSONL de filas eliminadas/corregidas")
             print()
             print("Ejemplos:")
             print("  python limpiar_excel_maestro.py")
@@ -239,7 +265,8 @@ def main():
         sys.exit(1)
 
     # Ejecutar
-    success = limpiar_excel_maestro(input_file, output_file)
+    success = limpiar_excel_maestro(input_file, output_file, metricas, opciones_progreso)
+    metricas.guardar()
     sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Métricas de ejecución por fase para los scripts del pipeline.
+The Money Center - Directorio de Empleados
+
+Los scripts las activan con banderas en la línea de comandos:
+
+    --metricas[=reporte.json]  Reporte JSON con tiempo total, empleados por
+                               segundo, pico de memoria (RSS) y desglose por
+                               fase (default: metricas_<script>.json)
+    --perfil[=perfil.prof]     Además perfila cada fase con cProfile y guarda
+                               el perfil de la fase más lenta
+                               (default: perfil_<script>.prof)
+
+Fases usadas por los scripts:
+    parse      leer Excel/CSV/JSON
+    transform  limpiar datos, armar la matriz QR (make(fit=True))
+    encode     generar la imagen QR y codificar el PNG
+    write      escribir archivos a disco
+
+Sin banderas las métricas quedan desactivadas y no agregan costo.
+"""
+
+import cProfile
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def pico_rss_mb():
+    """Pico de memoria residente del proceso actual, en MB (None en Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB, macOS reporta bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+class Metricas:
+    """Acumula tiempo por fase y empleados procesados de un script."""
+
+    def __init__(self, script, activa=True, reporte_file=None, perfil_file=None):
+        self.script = script
+        self.activa = activa
+        self.reporte_file = reporte_file or f"metricas_{script}.json"
+        self.perfil_file = perfil_file
+        self.filas = 0
+        self.fases = {}
+        self.perfiles = {}
+        self.inicio = time.perf_counter()
+
+    @contextmanager
+    def fase(self, nombre):
+        """Mide el bloque como parte de la fase indicada (acumulativo)."""
+        if not self.activa:
+            yield
+            return
+
+        perfil = None
+        if self.perfil_file:
+            perfil = self.perfiles.setdefault(nombre, cProfile.Profile())
+            perfil.enable()
+
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            if perfil:
+                perfil.disable()
+            datos = self.fases.setdefault(nombre, {'segundos': 0.0, 'llamadas': 0})
+            datos['segundos'] += duracion
+            datos['llamadas'] += 1
+
+    def iterar(self, nombre, iterable, cuerpo=None):
+        """
+        Itera el iterable contando el tiempo de cada next() en la fase indicada.
+
+        Con cuerpo, el tiempo del bloque del for (entre un elemento y el
+        siguiente) se cuenta en esa otra fase. Solo para bloques que no
+        miden fases propias (las fases no se anidan).
+        """
+        if not self.activa:
+            yield from iterable
+            return
+
+        iterador = iter(iterable)
+        while True:
+            with self.fase(nombre):
+                try:
+                    elemento = next(iterador)
+                except StopIteration:
+                    return
+            if cuerpo:
+                with self.fase(cuerpo):
+                    yield elemento
+            else:
+                yield elemento
+
+    def contar(self, cantidad=1):
+        """Suma empleados procesados."""
+        self.filas += cantidad
+
+    def reporte(self):
+        """Devuelve el reporte como diccionario."""
+        total = time.perf_counter() - self.inicio
+        return {
+            'script': self.script,
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'segundos': round(total, 4),
+            'filas': self.filas,
+            'filas_por_segundo': round(self.filas / total, 1) if total > 0 else None,
+            'pico_rss_mb': round(pico_rss_mb() or 0, 1),
+            'fases': {
+                nombre: {
+                    'segundos': round(datos['segundos'], 4),
+                    'llamadas': datos['llamadas'],
+                    'porcentaje': round(100 * datos['segundos'] / total, 1) if total > 0 else None,
+                }
+                for nombre, datos in sorted(self.fases.items(), key=lambda x: -x[1]['segundos'])
+            },
+        }
+
+    def guardar(self):
+        """Escribe el reporte JSON y el perfil de la fase más lenta (si están activos)."""
+        if not self.activa:
+            return
+
+        reporte = self.reporte()
+
+        if self.perfil_file and self.fases:
+            mas_lenta = next(iter(reporte['fases']))
+            self.perfiles[mas_lenta].dump_stats(self.perfil_file)
+            reporte['perfil'] = {'fase': mas_lenta, 'archivo': self.perfil_file}
+
+        with open(self.reporte_file, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, ensure_ascii=False, indent=2)
+
+        print(f"\n⏱️  Métricas: {reporte['segundos']:.2f} s, "
+              f"{reporte['filas_por_segundo'] or 0:,.0f} empleados/s, "
+              f"pico {reporte['pico_rss_mb']:.1f} MB")
+        for nombre, datos in reporte['fases'].items():
+            print(f"   • {nombre:10} {datos['segundos']:9.3f} s ({datos['porcentaje']}%)")
+        print(f"   📁 Reporte: {self.reporte_file}")
+        if 'perfil' in reporte:
+            print(f"   📁 Perfil de '{reporte['perfil']['fase']}': {self.perfil_file}")
+            print(f"      (ver con: python -m pstats {self.perfil_file})")
+
+
+# Métricas desactivadas: default de las funciones que reciben metricas=None
+SIN_METRICAS = Metricas('sin_metricas', activa=False)
+
+
+def metricas_desde_argv(argv, script):
+    """
+    Extrae --metricas y --perfil de argv (los quita de la lista).
+
+    Returns:
+        Metricas activa si se pidió alguna bandera, o desactivada
+    """
+    reporte_file = None
+    perfil_file = None
+    activa = False
+
+    for arg in list(argv):
+        nombre, _, valor = arg.partition('=')
+        if nombre == '--metricas':
+            activa = True
+            reporte_file = valor or None
+            argv.remove(arg)
+        elif nombre == '--perfil':
+            activa = True
+            perfil_file = valor or f"perfil_{script}.prof"
+            argv.remove(arg)
+
+    return Metricas(script, activa, reporte_file, perfil_file)
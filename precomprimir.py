@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Script para precomprimir los archivos que se publican (gzip y brotli).
+The Money Center - Directorio de Empleados
+
+Por cada archivo publicable (JSON, JS, CSS, HTML, SVG, PNG, ...) escribe
+junto a él una variante .gz (nivel 9) y, si está instalado el paquete
+brotli (pip install brotli), una variante .br (calidad 11). Así el
+servidor o CDN entrega los bytes ya comprimidos en lugar de comprimir en
+cada petición.
+
+- Solo se guarda una variante si ahorra al menos 5% (un PNG casi no se
+  comprime con gzip; en ese caso no tiene caso publicarla)
+- Los archivos cuyo contenido no cambió (hash SHA-256 en
+  .precomprimir.json) no se vuelven a comprimir
+- Las variantes de archivos que ya no existen se eliminan
+
+Uso típico antes de publicar (Vite copia public/ a dist/, incluidas las
+variantes y el registro de hashes, así en dist/ solo se comprimen los
+archivos nuevos del build):
+
+    python precomprimir.py public
+    npm run build
+    python precomprimir.py dist
+"""
+
+import gzip
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+EXTENSIONES = {
+    '.json', '.ndjson', '.js', '.mjs', '.css', '.html', '.svg', '.png',
+    '.txt', '.xml', '.webmanifest', '.ico', '.map',
+}
+
+REGISTRO = '.precomprimir.json'
+
+# Ahorro mínimo para guardar una variante (fracción del tamaño original)
+AHORRO_MINIMO = 0.05
+
+
+def _brotli():
+    """Módulo brotli, o None si no está instalado (dependencia opcional)."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _escribir_variante(destino, original, comprimido):
+    """Guarda la variante si ahorra lo suficiente; si no, elimina la anterior."""
+    if len(comprimido) <= len(original) * (1 - AHORRO_MINIMO):
+        destino.write_bytes(comprimido)
+        return len(comprimido)
+    destino.unlink(missing_ok=True)
+    return None
+
+
+def comprimir_archivo(ruta):
+    """
+    Escribe las variantes .gz y .br de un archivo.
+
+    Returns:
+        Diccionario con el hash y el tamaño de cada variante
+        (None = no se guardó; para br, 'no_disponible' si falta brotli)
+    """
+    ruta = Path(ruta)
+    contenido = ruta.read_bytes()
+    resultado = {
+        'sha256': hashlib.sha256(contenido).hexdigest(),
+        'original': len(contenido),
+        # mtime=0: misma entrada, mismos bytes (no cambia en cada publicación)
+        'gz': _escribir_variante(ruta.with_name(ruta.name + '.gz'), contenido,
+                                 gzip.compress(contenido, compresslevel=9, mtime=0)),
+    }
+
+    brotli = _brotli()
+    if brotli is None:
+        resultado['br'] = 'no_disponible'
+    else:
+        resultado['br'] = _escribir_variante(ruta.with_name(ruta.name + '.br'), contenido,
+                                             brotli.compress(contenido, quality=11))
+    return resultado
+
+
+def _vigente(registro, ruta, contenido_hash):
+    """Indica si las variantes registradas de un archivo siguen siendo válidas."""
+    if not registro or registro.get('sha256') != contenido_hash:
+        return False
+    if registro.get('br') == 'no_disponible' and _brotli() is not None:
+        return False
+    for extension in ('gz', 'br'):
+        if isinstance(registro.get(extension), int):
+            if not ruta.with_name(f"{ruta.name}.{extension}").exists():
+                return False
+    return True
+
+
+def precomprimir(directorio='public', workers=None):
+    """
+    Precomprime los archivos publicables de un directorio (recursivo).
+
+    Args:
+        directorio: Carpeta a procesar (public/ o dist/)
+        workers: Procesos en paralelo (default: número de CPUs)
+    """
+    try:
+        raiz = Path(directorio)
+        print(f"📂 Directorio: {raiz}/")
+
+        registro_file = raiz / REGISTRO
+        registro = {}
+        if registro_file.exists():
+            with open(registro_file, 'r', encoding='utf-8') as f:
+                registro = json.load(f)
+
+        if _brotli() is None:
+            print("ℹ️  brotli no está instalado: solo se generan variantes .gz")
+            print("   (pip install brotli)")
+
+        archivos = sorted(
+            ruta for ruta in raiz.rglob('*')
+            if ruta.is_file() and ruta.suffix.lower() in EXTENSIONES and ruta.name != REGISTRO
+        )
+
+        # Solo comprimir los archivos cuyo contenido cambió
+        pendientes = []
+        nuevo_registro = {}
+        for ruta in archivos:
+            relativa = ruta.relative_to(raiz).as_posix()
+            contenido_hash = hashlib.sha256(ruta.read_bytes()).hexdigest()
+            if _vigente(registro.get(relativa), ruta, contenido_hash):
+                nuevo_registro[relativa] = registro[relativa]
+            else:
+                pendientes.append(ruta)
+
+        print(f"\n🔨 Comprimiendo {len(pendientes)} de {len(archivos)} archivos "
+              f"({len(archivos) - len(pendientes)} sin cambios)...\n")
+
+        original = 0
+        comprimido_gz = 0
+        comprimido_br = 0
+        if pendientes:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                resultados = executor.map(comprimir_archivo, pendientes, chunksize=32)
+                for ruta, resultado in zip(pendientes, resultados):
+                    nuevo_registro[ruta.relative_to(raiz).as_posix()] = resultado
+                    original += resultado['original']
+                    comprimido_gz += resultado['gz'] or resultado['original']
+                    if isinstance(resultado['br'], int):
+                        comprimido_br += resultado['br']
+                    else:
+                        comprimido_br += resultado['original']
+
+        # Variantes huérfanas (el archivo original ya no existe)
+        eliminadas = 0
+        for variante in list(raiz.rglob('*.gz')) + list(raiz.rglob('*.br')):
+            base = variante.with_suffix('')
+            if base.suffix.lower() in EXTENSIONES and not base.exists():
+                variante.unlink()
+                eliminadas += 1
+
+        with open(registro_file, 'w', encoding='utf-8') as f:
+            json.dump(nuevo_registro, f, indent=2, sort_keys=True)
+
+        # Resumen
+        print(f"{'='*70}")
+        print(f"✅ Precompresión completada!")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        print(f"   • Archivos comprimidos:  {len(pendientes)}")
+        print(f"   • Sin cambios:           {len(archivos) - len(pendientes)}")
+        if original:
+            print(f"   • gzip:                  {original:,} → {comprimido_gz:,} bytes")
+            if _brotli() is not None:
+                print(f"   • brotli:                {original:,} → {comprimido_br:,} bytes")
+        if eliminadas:
+            print(f"   • Variantes eliminadas:  {eliminadas}")
+        print(f"{'='*70}\n")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    workers = None
+    uso = "Uso: python precomprimir.py [directorio] [--workers N]"
+
+    if args and args[0] in ['-h', '--help']:
+        print(uso)
+        print()
+        print("Parámetros:")
+        print("  directorio  : Carpeta a precomprimir (default: public)")
+        print("  --workers N : Procesos en paralelo (default: número de CPUs)")
+        print()
+        print("Ejemplos:")
+        print("  python precomprimir.py")
+        print("  python precomprimir.py dist")
+        sys.exit(0)
+
+    if '--workers' in args:
+        i = args.index('--workers')
+        try:
+            workers = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("❌ Error: --workers requiere un número de procesos")
+            print(uso)
+            sys.exit(1)
+        del args[i:i + 2]
+
+    directorio = args[0] if args else 'public'
+
+    if not Path(directorio).is_dir():
+        print(f"❌ Error: No existe el directorio '{directorio}'")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("  PRECOMPRESIÓN DE ARCHIVOS - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = precomprimir(directorio, workers)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Reporte de progreso para los scripts que procesan un empleado a la vez.
+The Money Center - Directorio de Empleados
+
+En lugar de imprimir una línea por empleado, los scripts muestran un
+contador que se actualiza como máximo cada medio segundo (cada 10 segundos
+si la salida no es una terminal, por ejemplo en CI), con empleados por
+segundo y tiempo restante estimado. Solo los errores se imprimen por fila.
+
+Banderas en la línea de comandos:
+
+    --silencioso           Sin contador (los errores y el resumen se muestran)
+    --log[=archivo.jsonl]  Registro estructurado: una línea JSON por evento
+                           (default: progreso_<script>.jsonl)
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+
+
+# Segundos mínimos entre actualizaciones del contador
+INTERVALO_TERMINAL = 0.5
+INTERVALO_LOG = 10.0
+
+
+def formatear_duracion(segundos):
+    """Convierte segundos a texto corto. Ejemplo: 3725 -> "1:02:05" """
+    segundos = int(segundos)
+    horas, resto = divmod(segundos, 3600)
+    minutos, segundos = divmod(resto, 60)
+    if horas:
+        return f"{horas}:{minutos:02d}:{segundos:02d}"
+    return f"{minutos}:{segundos:02d}"
+
+
+class Progreso:
+    """Contador de progreso con ETA, modo silencioso y registro JSONL."""
+
+    def __init__(self, descripcion, total=None, silencioso=False, log_file=None, script=None):
+        self.descripcion = descripcion
+        self.total = total
+        self.silencioso = silencioso
+        self.script = script
+        self.hechos = 0
+        self.errores = 0
+        self.inicio = time.monotonic()
+        self.ultimo = self.inicio
+        self.terminal = sys.stdout.isatty()
+        self.intervalo = INTERVALO_TERMINAL if self.terminal else INTERVALO_LOG
+        self.linea_activa = False
+        self.log = open(log_file, 'a', encoding='utf-8') if log_file else None
+        self.registrar('inicio', descripcion=descripcion, total=total)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.terminar()
+
+    def avanzar(self, cantidad=1, **datos):
+        """Suma empleados procesados; con datos, además los registra en el log."""
+        self.hechos += cantidad
+        if datos:
+            self.registrar('ok', **datos)
+
+        if not self.silencioso:
+            ahora = time.monotonic()
+            if ahora - self.ultimo >= self.intervalo:
+                self.ultimo = ahora
+                self._mostrar(self._texto(ahora))
+
+    def error(self, mensaje, **datos):
+        """Imprime y registra un error de una fila."""
+        self.errores += 1
+        self._limpiar_linea()
+        print(f"❌ {mensaje}")
+        self.registrar('error', mensaje=mensaje, **datos)
+
+    def aviso(self, mensaje, **datos):
+        """Imprime y registra un aviso (no cuenta como error)."""
+        self._limpiar_linea()
+        print(f"⚠️  {mensaje}")
+        self.registrar('aviso', mensaje=mensaje, **datos)
+
+    def registrar(self, evento, **datos):
+        """Escribe un evento en el log estructurado (si está activo)."""
+        if self.log:
+            registro = {
+                'fecha': datetime.now().isoformat(timespec='milliseconds'),
+                'script': self.script,
+                'evento': evento,
+                **datos,
+            }
+            self.log.write(json.dumps(registro, ensure_ascii=False) + '\n')
+
+    def terminar(self):
+        """Muestra la línea final y cierra el log."""
+        segundos = time.monotonic() - self.inicio
+        if not self.silencioso:
+            self._limpiar_linea()
+            texto = f"✅ {self.descripcion}: {self.hechos:,} en {formatear_duracion(segundos)}"
+            if self.errores:
+                texto += f" ({self.errores:,} errores)"
+            print(texto)
+        self.registrar('fin', hechos=self.hechos, errores=self.errores, segundos=round(segundos, 3))
+        if self.log:
+            self.log.close()
+            self.log = None
+
+    def _texto(self, ahora):
+        """Línea del contador: hechos/total, ritmo y tiempo restante."""
+        transcurrido = ahora - self.inicio
+        ritmo = self.hechos / transcurrido if transcurrido > 0 else 0
+
+        texto = f"🔨 {self.descripcion}: {self.hechos:,}"
+        if self.total:
+            texto += f"/{self.total:,} ({self.hechos / self.total:.0%})"
+        texto += f" · {ritmo:,.0f}/s"
+        if self.total and ritmo > 0:
+            texto += f" · ETA {formatear_duracion(max(0, self.total - self.hechos) / ritmo)}"
+        return texto
+
+    def _mostrar(self, texto):
+        if self.terminal:
+            # Reescribir la misma línea
+            sys.stdout.write('\r\033[K' + texto)
+            sys.stdout.flush()
+            self.linea_activa = True
+        else:
+            print(texto, flush=True)
+
+    def _limpiar_linea(self):
+        if self.linea_activa:
+            sys.stdout.write('\r\033[K')
+            self.linea_activa = False
+
+
+def progreso_desde_argv(argv, script):
+    """
+    Extrae --silencioso y --log de argv (los quita de la lista).
+
+    Returns:
+        Diccionario de opciones para Progreso (silencioso, log_file, script)
+    """
+    opciones = {'silencioso': False, 'log_file': None, 'script': script}
+
+    for arg in list(argv):
+        nombre, _, valor = arg.partition('=')
+        if nombre == '--silencioso':
+            opciones['silencioso'] = True
+            argv.remove(arg)
+        elif nombre == '--log':
+            opciones['log_file'] = valor or f"progreso_{script}.jsonl"
+            argv.remove(arg)
+
+    return opciones
@@ -0,0 +1,214 @@
+// Service worker: credenciales sin conexión
+//
+// - Al instalarse guarda la aplicación (index.html y los archivos de
+//   assets/ que lista manifiesto.json), el logo y la versión actual de los
+//   datos (empleados.<hash>.json, indice_busqueda.<hash>.json)
+// - Los archivos con hash en el nombre nunca cambian: se sirven del caché
+// - La página se sirve del caché de inmediato y se actualiza en segundo
+//   plano (stale-while-revalidate)
+// - Las credenciales estáticas (c/<id>.html) y manifiesto.json se piden
+//   primero a la red y solo sin conexión se usa el caché: una credencial
+//   eliminada (404) se borra del caché y se abre la aplicación, que
+//   indica que el empleado no existe o que la credencial fue revocada.
+//   Cuando el manifiesto trae otra versión se descargan los datos nuevos y
+//   se borran los anteriores
+// - La clave pública de los QR firmados (firma_qr.json) y el filtro de
+//   revocados (revocados.bin) también se guardan, y se vuelven a descargar
+//   con cada versión nueva del manifiesto: un QR se verifica y una
+//   credencial revocada se rechaza aunque no haya conexión ni directorio
+//
+// Así un QR que ya se escaneó abre al instante y sin conexión.
+
+const VERSION = 'v3';
+const CACHE_APP = `credenciales-app-${VERSION}`;
+const CACHE_DATOS = 'credenciales-datos';
+
+// Archivos con el hash del contenido en el nombre (generar_manifiesto.py)
+const CON_HASH = /\.[0-9a-f]{10}\.(json|png)$/;
+
+const base = new URL(self.registration.scope);
+const url = (ruta) => new URL(ruta, base).href;
+
+// Rutas de los datos de una versión del manifiesto; las de los QR vienen
+// en cada empleado (campo qr de empleados.<hash>.json)
+const rutasDatos = async (manifiesto, cache) => {
+  const rutas = [manifiesto.empleados, manifiesto.indice].filter(Boolean).map(url);
+  const empleados = manifiesto.empleados ? await cache.match(url(manifiesto.empleados)) : null;
+  for (const empleado of empleados ? await empleados.json() : []) {
+    if (empleado.qr) rutas.push(url(empleado.qr));
+  }
+  return rutas;
+};
+
+// Guardar los datos de una versión y borrar los de versiones anteriores
+// (los QR no se descargan por adelantado, solo se conservan los vigentes)
+const actualizarDatos = async (manifiesto) => {
+  const cache = await caches.open(CACHE_DATOS);
+  await cache.addAll([manifiesto.empleados, manifiesto.indice].filter(Boolean).map(url));
+  const vigentes = new Set(await rutasDatos(manifiesto, cache));
+  for (const solicitud of await cache.keys()) {
+    if (CON_HASH.test(new URL(solicitud.url).pathname) && !vigentes.has(solicitud.url)) {
+      await cache.delete(solicitud);
+    }
+  }
+};
+
+// Guardar o borrar del caché según la respuesta: lo que ya no existe en el
+// servidor (404/410) no debe seguir sirviéndose
+const guardarRespuesta = async (cache, clave, respuesta) => {
+  if (respuesta.ok) {
+    await cache.put(clave, respuesta.clone());
+  } else if (respuesta.status === 404 || respuesta.status === 410) {
+    await cache.delete(clave);
+  }
+};
+
+// Clave pública de los QR firmados (firma_qr.py) y filtro de revocados
+// (revocaciones.py): no llevan hash, se descargan de nuevo sin caché HTTP
+const actualizarVerificacion = async () => {
+  const datos = await caches.open(CACHE_DATOS);
+  await Promise.all(['firma_qr.json', 'revocados.bin'].map(async (ruta) => {
+    const respuesta = await fetch(url(ruta), { cache: 'no-cache' }).catch(() => null);
+    if (respuesta) await guardarRespuesta(datos, url(ruta), respuesta);
+  }));
+};
+
+const precachear = async () => {
+  const app = await caches.open(CACHE_APP);
+  await app.addAll([url('./'), url('moneycenter.png')]);
+  await actualizarVerificacion();
+
+  const respuesta = await fetch(url('manifiesto.json'), { cache: 'no-cache' }).catch(() => null);
+  if (!respuesta || !respuesta.ok) {
+    return; // sin manifiesto (npm run dev): solo la página
+  }
+  const manifiesto = await respuesta.clone().json();
+  await app.addAll((manifiesto.app || []).map(url));
+  await (await caches.open(CACHE_DATOS)).put(url('manifiesto.json'), respuesta);
+  await actualizarDatos(manifiesto);
+};
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(precachear().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((nombres) => Promise.all(
+        nombres
+          .filter((nombre) => nombre.startsWith('credenciales-') && nombre !== CACHE_APP && nombre !== CACHE_DATOS)
+          .map((nombre) => caches.delete(nombre))
+      ))
+      .then(() => self.clients.claim())
+  );
+});
+
+// Del caché; si no está, de la red (y se guarda)
+const primeroCache = async (request, nombreCache) => {
+  const cache = await caches.open(nombreCache);
+  const guardada = await cache.match(request);
+  if (guardada) return guardada;
+  const respuesta = await fetch(request);
+  if (respuesta.ok) await cache.put(request, respuesta.clone());
+  return respuesta;
+};
+
+// Del caché de inmediato y se actualiza en segundo plano
+const staleWhileRevalidate = (event, nombreCache, opciones = {}) => {
+  const { request } = event;
+  const actualizada = caches.open(nombreCache).then(async (cache) => {
+    const respuesta = await fetch(request);
+    await guardarRespuesta(cache, opciones.clave || request, respuesta);
+    return respuesta;
+  });
+  event.waitUntil(actualizada.catch(() => null));
+
+  return caches.open(nombreCache)
+    .then((cache) => cache.match(opciones.clave || request, { ignoreSearch: !!opciones.ignorarConsulta }))
+    .then((guardada) => guardada || actualizada)
+    .catch(() => opciones.sinConexion ? opciones.sinConexion() : Response.error());
+};
+
+// De la red; del caché solo si no hay conexión
+const primeroRed = async (event, nombreCache, opciones = {}) => {
+  const { request } = event;
+  const clave = opciones.clave || request;
+  const cache = await caches.open(nombreCache);
+  let respuesta;
+  try {
+    respuesta = await fetch(request);
+  } catch {
+    const guardada = await cache.match(clave);
+    if (guardada) return guardada;
+    return opciones.sinConexion ? opciones.sinConexion() : Response.error();
+  }
+  if ((respuesta.status === 404 || respuesta.status === 410) && opciones.noEncontrada) {
+    await guardarRespuesta(cache, clave, respuesta);
+    return opciones.noEncontrada();
+  }
+  if (respuesta.ok && opciones.alActualizar) {
+    // Se compara con la copia anterior y se guarda la nueva solo cuando la
+    // actualización terminó: si falla, la próxima petición lo reintenta
+    const anterior = await cache.match(clave);
+    const copia = respuesta.clone();
+    event.waitUntil(
+      opciones.alActualizar(respuesta.clone(), anterior)
+        .then(() => cache.put(clave, copia))
+        .catch(() => null)
+    );
+    return respuesta;
+  }
+  await guardarRespuesta(cache, clave, respuesta);
+  return respuesta;
+};
+
+// Si el manifiesto cambió de versión, descargar los datos nuevos y la
+// clave pública y el filtro de revocados vigentes
+const alActualizarManifiesto = async (respuesta, anterior) => {
+  const nuevo = await respuesta.json();
+  const version = anterior ? (await anterior.json()).version : null;
+  if (nuevo.version !== version) {
+    await actualizarDatos(nuevo);
+    await actualizarVerificacion();
+    await (await caches.open(CACHE_APP)).addAll((nuevo.app || []).map(url));
+  }
+};
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  const direccion = new URL(request.url);
+  if (request.method !== 'GET' || direccion.origin !== base.origin || !direccion.pathname.startsWith(base.pathname)) {
+    return;
+  }
+  const ruta = direccion.pathname.slice(base.pathname.length);
+
+  if (ruta === 'manifiesto.json') {
+    event.respondWith(primeroRed(event, CACHE_DATOS, {
+      clave: url('manifiesto.json'),
+      alActualizar: alActualizarManifiesto,
+    }));
+  } else if (ruta.startsWith('assets/')) {
+    event.respondWith(primeroCache(request, CACHE_APP));
+  } else if (CON_HASH.test(ruta)) {
+    event.respondWith(primeroCache(request, CACHE_DATOS));
+  } else if (/^c\/[0-9A-Za-z-]+\.html$/.test(ruta)) {
+    // Credencial estática sin caché ni conexión, o que ya no existe
+    // (baja o id mal escrito): abrir la aplicación, que lo explica
+    const abrirAplicacion = () => Response.redirect(url(`./?id=${ruta.slice(2, -5)}&spa=1`), 302);
+    event.respondWith(primeroRed(event, CACHE_APP, {
+      clave: url(ruta),
+      sinConexion: abrirAplicacion,
+      noEncontrada: abrirAplicacion,
+    }));
+  } else if (request.mode === 'navigate') {
+    event.respondWith(staleWhileRevalidate(event, CACHE_APP, {
+      // index.html es el mismo para cualquier ?id=
+      clave: ruta === '' ? url('./') : request,
+      ignorarConsulta: ruta === '',
+    }));
+  } else {
+    // Logo, empleados.json y QR sin hash (sin manifiesto)
+    event.respondWith(staleWhileRevalidate(event, CACHE_DATOS));
+  }
+});
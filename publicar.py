@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Script para publicar empleados.json y los QR en public/.
+The Money Center - Directorio de Empleados
+
+Reemplaza a `cp empleados.json public/empleados.json` y
+`cp -r qr_codes/* public/qr_codes/`:
+
+1. Compara cada archivo por tamaño y sha256 y solo transfiere los que
+   cambiaron
+2. Los QR se publican con una copia reflink (Btrfs, XFS: comparte los
+   bloques sin copiar bytes) y, si no se puede, con una copia normal. Con
+   --enlaces se prueba antes un enlace duro; los generadores escriben cada
+   PNG a un temporal y lo renombran, así un enlace nunca ve un QR a medias
+3. El JSON (y su índice de búsqueda y filtro de revocados) se copia a un
+   temporal, se fuerza a disco y se renombra: quien sirva public/ nunca ve
+   un JSON a medio escribir. No se enlaza: actualizar_empleados.py
+   reescribe el JSON de la raíz en su lugar y un enlace lo vería a medias
+4. Elimina de public/qr_codes los QR huérfanos (que no corresponden a
+   ningún empleado del JSON publicado, igual que diagnosticar_qrs.py)
+
+Con --simulacion solo muestra lo que haría.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from escritores import fsync_directorio
+from generar_qrs_imagenes import sanitize_filename
+from indice_busqueda import NOMBRE_INDICE
+from lectores import iterar_empleados
+from revocaciones import NOMBRE_FILTRO
+
+
+# ioctl FICLONE de Linux (copia reflink)
+FICLONE = 0x40049409
+
+# Variantes que escribe precomprimir.py junto a cada archivo
+VARIANTES = ('.gz', '.br')
+
+
+def huella_archivo(ruta):
+    """sha256 del contenido de un archivo."""
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def sin_cambios(origen, destino):
+    """True si destino ya tiene el mismo contenido que origen."""
+    if not destino.exists():
+        return False
+    if os.path.samefile(origen, destino):
+        # Enlace duro de una publicación anterior (--enlaces): los
+        # generadores reemplazan el PNG con un renombrado, que rompe el
+        # enlace, así que sigue siendo el contenido publicado
+        return True
+    if origen.stat().st_size != destino.stat().st_size:
+        return False
+    return huella_archivo(origen) == huella_archivo(destino)
+
+
+def _reflink(origen, destino):
+    """Copia reflink (comparte bloques hasta que uno cambie); False si no se puede."""
+    try:
+        import fcntl
+    except ImportError:
+        return False  # Windows
+    try:
+        with open(origen, 'rb') as fo, open(destino, 'wb') as fd:
+            fcntl.ioctl(fd.fileno(), FICLONE, fo.fileno())
+        return True
+    except OSError:
+        Path(destino).unlink(missing_ok=True)
+        return False
+
+
+def transferir(origen, destino, enlazar=False):
+    """
+    Publica un archivo reemplazando el destino de forma atómica.
+
+    Args:
+        origen: Archivo fuente
+        destino: Archivo publicado
+        enlazar: Probar primero un enlace duro (comparten el archivo)
+
+    Returns:
+        'enlace', 'reflink' o 'copia'
+    """
+    temporal = destino.with_name(f'.{destino.name}.{os.getpid()}.tmp')
+    temporal.unlink(missing_ok=True)
+    try:
+        modo = None
+        if enlazar:
+            try:
+                os.link(origen, temporal)
+                modo = 'enlace'
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+                    raise
+        if modo is None and _reflink(origen, temporal):
+            modo = 'reflink'
+        if modo is None:
+            shutil.copyfile(origen, temporal)
+            modo = 'copia'
+        if modo != 'enlace':
+            shutil.copystat(origen, temporal)
+        os.replace(temporal, destino)
+        return modo
+    except BaseException:
+        temporal.unlink(missing_ok=True)
+        raise
+
+
+def copiar_atomico(origen, destino):
+    """Copia a un temporal, lo fuerza a disco y lo renombra sobre el destino."""
+    fd, temporal = tempfile.mkstemp(dir=destino.parent, prefix=f'.{destino.stem}.', suffix=destino.suffix)
+    try:
+        with os.fdopen(fd, 'wb') as f, open(origen, 'rb') as fuente:
+            shutil.copyfileobj(fuente, f, 1 << 20)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temporal, 0o644)
+        os.replace(temporal, destino)
+        fsync_directorio(destino.parent)
+    except BaseException:
+        Path(temporal).unlink(missing_ok=True)
+        raise
+
+
+def _eliminar(ruta, simulacion):
+    """Elimina un archivo y sus variantes .gz/.br."""
+    for archivo in [ruta] + [ruta.with_name(ruta.name + v) for v in VARIANTES]:
+        if archivo.exists() and not simulacion:
+            archivo.unlink()
+
+
+def _variantes_vencidas(ruta, simulacion):
+    """Elimina las variantes .gz/.br más antiguas que el archivo (de un contenido anterior)."""
+    modificado = ruta.stat().st_mtime
+    for archivo in [ruta.with_name(ruta.name + v) for v in VARIANTES]:
+        if archivo.exists() and archivo.stat().st_mtime < modificado:
+            print(f"   🗑️  Variante vencida: {archivo.name}")
+            if not simulacion:
+                archivo.unlink()
+
+
+def publicar(json_file='empleados.json', qr_dir='qr_codes', destino='public', enlazar=False, simulacion=False):
+    """
+    Sincroniza el JSON y los QR con la carpeta publicada.
+
+    Args:
+        json_file: JSON de empleados generado (ej: empleados.json)
+        qr_dir: Carpeta de QR generados (ej: qr_codes)
+        destino: Carpeta publicada (ej: public)
+        enlazar: Publicar los QR con enlaces duros cuando se pueda
+        simulacion: Solo mostrar lo que se haría
+
+    Returns:
+        True si la publicación terminó sin errores
+    """
+    try:
+        origen_json = Path(json_file)
+        destino_path = Path(destino)
+        destino_qr = destino_path / 'qr_codes'
+        if not simulacion:
+            destino_qr.mkdir(parents=True, exist_ok=True)
+
+        conteo = {'enlace': 0, 'reflink': 0, 'copia': 0}
+        sin_cambio = 0
+        errores = 0
+
+        # JSON y archivos derivados: copia atómica y forzada a disco
+        print(f"📂 Publicando {origen_json} en {destino_path}/")
+        datos = [origen_json, origen_json.with_name(NOMBRE_INDICE), origen_json.with_name(NOMBRE_FILTRO)]
+        for origen in datos:
+            if not origen.exists():
+                continue
+            publicado = destino_path / (origen.name if origen != origen_json else 'empleados.json')
+            if sin_cambios(origen, publicado):
+                sin_cambio += 1
+                continue
+            print(f"   💾 {publicado}")
+            if not simulacion:
+                copiar_atomico(origen, publicado)
+                for variante in VARIANTES:
+                    publicado.with_name(publicado.name + variante).unlink(missing_ok=True)
+            conteo['copia'] += 1
+
+        # QR de los empleados del JSON publicado
+        nombres = {sanitize_filename(emp['nombre']) for emp in iterar_empleados(origen_json)}
+        origen_qr = Path(qr_dir)
+        print(f"📂 Sincronizando {origen_qr}/ → {destino_qr}/")
+
+        if origen_qr.exists() and not origen_qr.resolve() == destino_qr.resolve():
+            for origen in sorted(origen_qr.glob('*.png')):
+                if origen.stem not in nombres:
+                    continue  # huérfano en la carpeta de origen: no se publica
+                publicado = destino_qr / origen.name
+                try:
+                    if sin_cambios(origen, publicado):
+                        sin_cambio += 1
+                        _variantes_vencidas(publicado, simulacion)
+                        continue
+                    if simulacion:
+                        conteo['copia'] += 1
+                        print(f"   🔲 {publicado.name}")
+                        continue
+                    conteo[transferir(origen, publicado, enlazar)] += 1
+                    # Las variantes precomprimidas del QR anterior ya no sirven
+                    for variante in VARIANTES:
+                        publicado.with_name(publicado.name + variante).unlink(missing_ok=True)
+                except OSError as e:
+                    errores += 1
+                    print(f"❌ Error publicando {origen.name}: {str(e)}")
+
+        # QR huérfanos en la carpeta publicada
+        eliminados = 0
+        for publicado in sorted(destino_qr.glob('*.png')) if destino_qr.exists() else []:
+            if publicado.stem not in nombres:
+                print(f"   🗑️  Huérfano: {publicado.name}")
+                _eliminar(publicado, simulacion)
+                eliminados += 1
+
+        if not simulacion:
+            fsync_directorio(destino_qr)
+
+        # Resumen
+        transferidos = sum(conteo.values())
+        print(f"\n{'='*70}")
+        print(f"✅ {'Simulación' if simulacion else 'Publicación'} completada!")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        print(f"   • Transferidos:          {transferidos}"
+              + ('' if simulacion else f" ({conteo['enlace']} enlaces, {conteo['reflink']} reflink, "
+                                      f"{conteo['copia']} copias)"))
+        print(f"   • Sin cambios:           {sin_cambio}")
+        print(f"   • Huérfanos eliminados:  {eliminados}")
+        if errores:
+            print(f"   ❌ Errores:              {errores}")
+        print(f"{'='*70}\n")
+        return errores == 0
+
+    except FileNotFoundError as e:
+        print(f"❌ Error: No se encontró el archivo {e.filename or json_file}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+
+    if args and args[0] in ['-h', '--help']:
+        print("Uso: python publicar.py [json_file] [qr_dir] [destino] [--enlaces] [--simulacion]")
+        print()
+        print("Parámetros:")
+        print("  json_file     : JSON de empleados (default: empleados.json)")
+        print("  qr_dir        : Carpeta de QR (default: qr_codes)")
+        print("  destino       : Carpeta publicada (default: public)")
+        print("  --enlaces     : Publicar los QR con enlaces duros cuando se pueda")
+        print("  --simulacion  : Solo mostrar lo que se haría")
+        print()
+        print("Ejemplos:")
+        print("  python publicar.py")
+        print("  python publicar.py empleados.json qr_codes public --simulacion")
+        sys.exit(0)
+
+    enlazar = '--enlaces' in args
+    simulacion = '--simulacion' in args
+    args = [arg for arg in args if arg not in ('--enlaces', '--simulacion')]
+
+    json_file = args[0] if len(args) > 0 else 'empleados.json'
+    qr_dir = args[1] if len(args) > 1 else 'qr_codes'
+    destino = args[2] if len(args) > 2 else 'public'
+
+    if not Path(json_file).exists():
+        print(f"❌ Error: El archivo '{json_file}' no existe")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("  PUBLICAR EN PUBLIC/ - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = publicar(json_file, qr_dir, destino, enlazar, simulacion)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Filtro de credenciales revocadas (revocados.bin).
+The Money Center - Directorio de Empleados
+
+Cuando alguien deja la empresa se borra su fila del Excel maestro; su QR
+impreso deja de funcionar solo porque su id ya no está en empleados.json,
+y para saberlo hay que descargar el directorio completo. Este módulo
+guarda los ids eliminados y publica un filtro de Bloom con ellos: unos
+pocos KB con los que cualquier verificador rechaza una credencial revocada
+sin el directorio (ver src/utils/revocaciones.ts).
+
+- Los ids revocados se acumulan en .revocados.json junto al JSON (lista
+  exacta; no se publica). Si un id vuelve a aparecer en el Excel deja de
+  estar revocado.
+- Un filtro de Bloom no tiene falsos negativos: un id revocado siempre se
+  detecta. Con probabilidad `fp` (default 0.1 %) marca como revocado un id
+  que no lo está; el verificador debe confirmarlo con el directorio cuando
+  lo tenga.
+
+Formato (big-endian):
+
+    bytes 0-3    "RVK1"
+    byte 4       k (número de posiciones por id)
+    bytes 5-8    m (bits del filtro)
+    bytes 9-12   n (ids revocados)
+    bytes 13-    bits (el bit i está en el byte i >> 3, máscara 1 << (i & 7))
+
+Posiciones de un id: d = sha256(id en minúsculas), h1 = d[0:4], h2 = d[4:8] | 1,
+posición i = (h1 + i * h2) mod m, para i = 0..k-1.
+
+Se actualiza al exportar (actualizar_empleados.py, vigilar_maestro.py) o a mano:
+
+    python revocaciones.py verificar <id> [public/revocados.bin]
+"""
+
+import hashlib
+import json
+import math
+import struct
+import sys
+from pathlib import Path
+
+from escritores import escribir_atomico
+
+
+NOMBRE_FILTRO = 'revocados.bin'
+REGISTRO_REVOCADOS = '.revocados.json'
+
+FP_POR_DEFECTO = 0.001
+
+_MAGIA = b'RVK1'
+_CABECERA = struct.Struct('>4sBII')
+
+
+def ruta_filtro(json_file):
+    """Ruta del filtro junto al JSON de empleados."""
+    return Path(json_file).with_name(NOMBRE_FILTRO)
+
+
+def _posiciones(emp_id, m, k):
+    digest = hashlib.sha256(emp_id.strip().lower().encode('utf-8')).digest()
+    h1 = int.from_bytes(digest[0:4], 'big')
+    h2 = int.from_bytes(digest[4:8], 'big') | 1
+    return [(h1 + i * h2) % m for i in range(k)]
+
+
+def construir_filtro(ids, fp=FP_POR_DEFECTO):
+    """
+    Filtro de Bloom de un conjunto de ids.
+
+    Args:
+        ids: Ids revocados
+        fp: Tasa de falsos positivos buscada (0 < fp < 1)
+
+    Returns:
+        Bytes del filtro (formato RVK1)
+    """
+    if not 0 < fp < 1:
+        raise ValueError("La tasa de falsos positivos debe estar entre 0 y 1")
+    ids = sorted(set(ids))
+    n = len(ids)
+
+    # m = -n ln(fp) / ln(2)^2 bits, k = (m / n) ln(2) posiciones
+    m = max(64, math.ceil(-n * math.log(fp) / math.log(2) ** 2))
+    m = (m + 7) // 8 * 8
+    k = max(1, round(m / n * math.log(2))) if n else 1
+
+    bits = bytearray(m // 8)
+    for emp_id in ids:
+        for posicion in _posiciones(emp_id, m, k):
+            bits[posicion >> 3] |= 1 << (posicion & 7)
+    return _CABECERA.pack(_MAGIA, k, m, n) + bytes(bits)
+
+
+def leer_filtro(datos):
+    """
+    Decodifica un filtro.
+
+    Returns:
+        Diccionario con 'k', 'm', 'n' y 'bits'
+    """
+    if len(datos) < _CABECERA.size:
+        raise ValueError("Filtro de revocación incompleto")
+    magia, k, m, n = _CABECERA.unpack_from(datos)
+    bits = datos[_CABECERA.size:]
+    if magia != _MAGIA or len(bits) * 8 < m or k == 0:
+        raise ValueError("Filtro de revocación no válido")
+    return {'k': k, 'm': m, 'n': n, 'bits': bits}
+
+
+def cargar_filtro(ruta):
+    """Filtro desde un archivo revocados.bin."""
+    return leer_filtro(Path(ruta).read_bytes())
+
+
+def esta_revocado(filtro, emp_id):
+    """
+    True si el id está (probablemente) revocado; False si seguro no lo está.
+
+    Args:
+        filtro: Diccionario de leer_filtro / cargar_filtro
+        emp_id: Id del QR
+    """
+    bits = filtro['bits']
+    return all(bits[p >> 3] & (1 << (p & 7)) for p in _posiciones(emp_id, filtro['m'], filtro['k']))
+
+
+def escribir_filtro(ids, ruta, fp=FP_POR_DEFECTO):
+    """Escribe el filtro de forma atómica (temporal + renombrado)."""
+    datos = construir_filtro(ids, fp)
+    escribir_atomico(ruta, datos)
+    return datos
+
+
+def actualizar_revocaciones(ids_anteriores, empleados, json_file, fp=None):
+    """
+    Agrega al registro los ids que ya no están y reescribe el filtro.
+
+    Args:
+        ids_anteriores: Ids del JSON antes de reescribirlo
+        empleados: Empleados que se acaban de escribir
+        json_file: JSON de empleados (el filtro y el registro van al lado)
+        fp: Tasa de falsos positivos (default: la del registro, o 0.1 %)
+
+    Returns:
+        Diccionario con 'ruta', 'total' (ids revocados) y 'nuevos', o None
+        si no hay revocaciones ni filtro previo
+    """
+    registro_file = Path(json_file).with_name(REGISTRO_REVOCADOS)
+    registro = {'fp': FP_POR_DEFECTO, 'ids': []}
+    if registro_file.exists():
+        with open(registro_file, 'r', encoding='utf-8') as f:
+            registro = json.load(f)
+
+    actuales = {emp['id'] for emp in empleados}
+    revocados = set(registro['ids'])
+    nuevos = set(ids_anteriores) - actuales - revocados
+    # Un id que vuelve al Excel deja de estar revocado
+    revocados = (revocados | nuevos) - actuales
+    fp = fp or registro.get('fp', FP_POR_DEFECTO)
+
+    ruta = ruta_filtro(json_file)
+    if not revocados and not ruta.exists():
+        return None
+
+    if revocados != set(registro['ids']) or fp != registro.get('fp') or not ruta.exists():
+        escribir_filtro(revocados, ruta, fp)
+        with open(registro_file, 'w', encoding='utf-8') as f:
+            json.dump({'fp': fp, 'ids': sorted(revocados)}, f, indent=2)
+            f.write('\n')
+
+    return {'ruta': ruta, 'total': len(revocados), 'nuevos': len(nuevos)}
+
+
+def fp_desde_argv(argv):
+    """
+    Extrae --fp-revocacion=TASA de argv (lo quita de la lista).
+
+    Returns:
+        Tasa de falsos positivos, o None si no se indicó
+    """
+    fp = None
+    for arg in list(argv):
+        nombre, _, valor = arg.partition('=')
+        if nombre == '--fp-revocacion':
+            fp = float(valor)
+            if not 0 < fp < 1:
+                raise ValueError("--fp-revocacion debe estar entre 0 y 1 (ej: 0.001)")
+            argv.remove(arg)
+    return fp
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+
+    if len(args) < 2 or args[0] != 'verificar':
+        print("Uso: python revocaciones.py verificar <id> [filtro]")
+        print()
+        print("Parámetros:")
+        print("  id     : Id del QR (UUID)")
+        print(f"  filtro : Filtro de revocación (default: public/{NOMBRE_FILTRO})")
+        print()
+        print("El filtro lo generan actualizar_empleados.py y vigilar_maestro.py")
+        print("(--fp-revocacion=0.001 para cambiar la tasa de falsos positivos).")
+        sys.exit(0 if args and args[0] in ['-h', '--help'] else 1)
+
+    emp_id = args[1]
+    ruta = args[2] if len(args) > 2 else f'public/{NOMBRE_FILTRO}'
+
+    if not Path(ruta).exists():
+        print(f"❌ Error: No se encontró el filtro {ruta}")
+        sys.exit(1)
+
+    filtro = cargar_filtro(ruta)
+    print(f"📂 Filtro: {ruta} ({filtro['n']:,} ids, {len(filtro['bits']):,} bytes, k={filtro['k']})")
+    if esta_revocado(filtro, emp_id):
+        print(f"❌ {emp_id}: REVOCADO (confirmar con el directorio si hay dudas)")
+        sys.exit(1)
+    print(f"✅ {emp_id}: no está revocado")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Servidor HTTP local de consulta de empleados (opcional).
+The Money Center - Directorio de Empleados
+
+Para kioscos y la intranet: carga empleados.json en memoria con índices
+por UUID, por palabras del nombre, por gerencia y por puesto, y responde:
+
+    GET /empleado/<uuid>        Un empleado (JSON)
+    GET /empleado/<uuid>/qr     PNG del QR del empleado
+    GET /empleados              Listado paginado y filtrado (JSON):
+                                ?q=texto&gerencia=...&puesto=...&pagina=1&por_pagina=50
+    GET /qr_codes/<archivo>.png PNG del QR (misma ruta que la web)
+    GET /salud                  Estado y versión de los datos
+
+Las respuestas de empleados y QR llevan ETag: con If-None-Match el servidor contesta
+304 sin cuerpo. Si empleados.json cambia (por ejemplo con
+vigilar_maestro.py), se recarga en segundo plano sin reiniciar.
+
+Solo usa la biblioteca estándar (asyncio).
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from almacen_sqlite import normalizar_nombre
+from generar_qrs_imagenes import sanitize_filename
+from lectores import firma_archivo, iterar_empleados
+
+
+# Segundos entre revisiones de empleados.json
+INTERVALO_RECARGA = 1.0
+
+# Segundos que una conexión keep-alive puede quedar inactiva
+TIEMPO_INACTIVO = 30.0
+
+POR_PAGINA = 50
+MAX_POR_PAGINA = 500
+
+ARCHIVO_QR = re.compile(r'^[A-Za-z0-9_]+\.png$')
+
+
+def log(mensaje):
+    """Imprime un mensaje con la hora."""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {mensaje}", flush=True)
+
+
+class IndiceEmpleados:
+    """Empleados en memoria con índices por UUID, nombre, gerencia y puesto."""
+
+    def __init__(self, empleados, version):
+        self.empleados = empleados
+        self.version = version
+        self.por_id = {}
+        self.por_gerencia = defaultdict(list)
+        self.por_puesto = defaultdict(list)
+
+        # Índice de nombres: (palabra normalizada, posición) ordenado, para
+        # buscar por prefijo con bisect
+        palabras = []
+        for pos, emp in enumerate(empleados):
+            self.por_id[emp['id']] = pos
+            self.por_gerencia[emp.get('gerencia', '')].append(pos)
+            self.por_puesto[emp.get('puesto', '')].append(pos)
+            for palabra in set(normalizar_nombre(emp.get('nombre', '')).split()):
+                palabras.append((palabra, pos))
+        palabras.sort()
+        self.palabras = [palabra for palabra, _ in palabras]
+        self.posiciones = [pos for _, pos in palabras]
+
+    @classmethod
+    def cargar(cls, json_file):
+        """Carga el índice desde la exportación (JSON, NDJSON o SQLite)."""
+        firma = firma_archivo(json_file)
+        if firma is None:
+            raise FileNotFoundError(json_file)
+        empleados = list(iterar_empleados(json_file))
+        return cls(empleados, f"{firma[0]:x}-{firma[1]:x}")
+
+    def buscar(self, empleado_id):
+        """Empleado con ese UUID, o None."""
+        pos = self.por_id.get(empleado_id)
+        return None if pos is None else self.empleados[pos]
+
+    def buscar_nombre(self, texto):
+        """
+        Posiciones de los empleados que tienen, para cada palabra del texto,
+        una palabra del nombre que empieza con ella (sin acentos).
+        Ejemplo: "jose per" encuentra a "JOSÉ LUIS PÉREZ".
+        """
+        resultado = None
+        for palabra in normalizar_nombre(texto).split():
+            inicio = bisect_left(self.palabras, palabra)
+            fin = bisect_left(self.palabras, palabra + '\uffff', inicio)
+            encontrados = set(self.posiciones[inicio:fin])
+            resultado = encontrados if resultado is None else resultado & encontrados
+            if not resultado:
+                break
+        if resultado is None:
+            return range(len(self.empleados))
+        return sorted(resultado)
+
+    def filtrar(self, q=None, gerencia=None, puesto=None):
+        """
+        Posiciones (en orden) de los empleados que cumplen los filtros.
+
+        Parte de la lista más corta (nombre, gerencia o puesto) y la cruza
+        con las demás: con solo gerencia no se recorre a todos los empleados.
+        """
+        listas = [self.buscar_nombre(q)] if q else []
+        for valor, indice in ((gerencia, self.por_gerencia), (puesto, self.por_puesto)):
+            if valor:
+                listas.append(indice.get(valor, []))
+        if not listas:
+            return range(len(self.empleados))
+
+        listas.sort(key=len)
+        posiciones = listas[0]
+        for lista in listas[1:]:
+            if not posiciones:
+                break
+            permitidas = set(lista)
+            posiciones = [pos for pos in posiciones if pos in permitidas]
+        return posiciones
+
+
+def _etag(contenido):
+    """ETag a partir del contenido (bytes)."""
+    return f'"{hashlib.blake2b(contenido, digest_size=8).hexdigest()}"'
+
+
+def _coincide(if_none_match, etag):
+    """Indica si el encabezado If-None-Match incluye el ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    etiquetas = [e.strip().removeprefix('W/') for e in if_none_match.split(',')]
+    return etag.removeprefix('W/') in etiquetas
+
+
+def _json(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ServidorEmpleados:
+    """Servidor HTTP/1.1 mínimo (GET/HEAD) sobre asyncio."""
+
+    def __init__(self, json_file='public/empleados.json', qr_dir='public/qr_codes'):
+        self.json_file = json_file
+        self.qr_path = Path(qr_dir)
+        self.indice = IndiceEmpleados.cargar(json_file)
+
+    async def recargar_periodicamente(self, intervalo=INTERVALO_RECARGA):
+        """Recarga el índice cuando cambia empleados.json."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(intervalo)
+            firma = firma_archivo(self.json_file)
+            if firma is None or f"{firma[0]:x}-{firma[1]:x}" == self.indice.version:
+                continue
+            try:
+                # Cargar en otro hilo: el servidor sigue respondiendo con el
+                # índice anterior hasta que el nuevo esté completo
+                indice = await loop.run_in_executor(None, IndiceEmpleados.cargar, self.json_file)
+            except Exception as e:
+                log(f"⚠️  No se pudo recargar {self.json_file}: {str(e)}")
+                continue
+            self.indice = indice
+            log(f"🔄 {self.json_file} recargado: {len(indice.empleados)} empleados")
+
+    def resolver(self, destino, encabezados):
+        """
+        Resuelve una petición GET.
+
+        Returns:
+            Tupla (estado, encabezados de respuesta, cuerpo)
+        """
+        partes = urlsplit(destino)
+        ruta = unquote(partes.path).rstrip('/') or '/'
+        consulta = parse_qs(partes.query)
+        indice = self.indice  # El mismo índice durante toda la petición
+
+        if ruta == '/salud':
+            cuerpo = _json({'empleados': len(indice.empleados), 'version': indice.version})
+            return HTTPStatus.OK, {'Content-Type': 'application/json; charset=utf-8'}, cuerpo
+
+        if ruta == '/empleados':
+            # El listado solo depende de los datos y de la consulta: el ETag
+            # se calcula sin armar la respuesta
+            clave = hashlib.blake2b(partes.query.encode('utf-8'), digest_size=6).hexdigest()
+            etag = f'"{indice.version}-{clave}"'
+            if _coincide(encabezados.get('if-none-match'), etag):
+                return HTTPStatus.NOT_MODIFIED, {'ETag': etag}, b''
+
+            try:
+                pagina = max(1, int(consulta.get('pagina', ['1'])[0]))
+                por_pagina = min(MAX_POR_PAGINA, max(1, int(consulta.get('por_pagina', [str(POR_PAGINA)])[0])))
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, {}, _json({'error': 'pagina y por_pagina deben ser números'})
+
+            posiciones = indice.filtrar(
+                consulta.get('q', [''])[0],
+                consulta.get('gerencia', [''])[0],
+                consulta.get('puesto', [''])[0],
+            )
+            inicio = (pagina - 1) * por_pagina
+            cuerpo = _json({
+                'total': len(posiciones),
+                'pagina': pagina,
+                'por_pagina': por_pagina,
+                'empleados': [indice.empleados[pos] for pos in posiciones[inicio:inicio + por_pagina]],
+            })
+            return HTTPStatus.OK, {'Content-Type': 'application/json; charset=utf-8', 'ETag': etag}, cuerpo
+
+        if ruta.startswith('/empleado/'):
+            empleado_id, _, resto = ruta[len('/empleado/'):].partition('/')
+            empleado = indice.buscar(empleado_id)
+            if empleado is None:
+                return HTTPStatus.NOT_FOUND, {}, _json({'error': 'Empleado no encontrado'})
+            if resto == 'qr':
+                return self._qr(f"{sanitize_filename(empleado['nombre'])}.png", encabezados)
+            if resto:
+                return HTTPStatus.NOT_FOUND, {}, _json({'error': 'Ruta no encontrada'})
+
+            cuerpo = _json(empleado)
+            etag = _etag(cuerpo)
+            if _coincide(encabezados.get('if-none-match'), etag):
+                return HTTPStatus.NOT_MODIFIED, {'ETag': etag}, b''
+            return HTTPStatus.OK, {'Content-Type': 'application/json; charset=utf-8', 'ETag': etag}, cuerpo
+
+        if ruta.startswith('/qr_codes/'):
+            return self._qr(ruta[len('/qr_codes/'):], encabezados)
+
+        return HTTPStatus.NOT_FOUND, {}, _json({'error': 'Ruta no encontrada'})
+
+    def _qr(self, archivo, encabezados):
+        """PNG de un QR; el nombre se valida para no salir de la carpeta."""
+        if not ARCHIVO_QR.match(archivo):
+            return HTTPStatus.NOT_FOUND, {}, _json({'error': 'QR no encontrado'})
+
+        ruta = self.qr_path / archivo
+        firma = firma_archivo(ruta)
+        if firma is None:
+            return HTTPStatus.NOT_FOUND, {}, _json({'error': 'QR no encontrado'})
+
+        etag = f'"{firma[0]:x}-{firma[1]:x}"'
+        if _coincide(encabezados.get('if-none-match'), etag):
+            return HTTPStatus.NOT_MODIFIED, {'ETag': etag}, b''
+        return HTTPStatus.OK, {'Content-Type': 'image/png', 'ETag': etag}, ruta.read_bytes()
+
+    async def atender(self, reader, writer):
+        """Atiende las peticiones de una conexión (con keep-alive)."""
+        try:
+            while True:
+                try:
+                    linea = await asyncio.wait_for(reader.readline(), TIEMPO_INACTIVO)
+                except asyncio.TimeoutError:
+                    break
+                if not linea:
+                    break
+
+                try:
+                    metodo, destino, version = linea.decode('latin-1').split()
+                except ValueError:
+                    await self._responder(writer, 'GET', HTTPStatus.BAD_REQUEST, {}, b'', False)
+                    break
+
+                encabezados = {}
+                while True:
+                    encabezado = await reader.readline()
+                    if encabezado in (b'\r\n', b'\n', b''):
+                        break
+                    nombre, _, valor = encabezado.decode('latin-1').partition(':')
+                    encabezados[nombre.strip().lower()] = valor.strip()
+
+                mantener = (version == 'HTTP/1.1'
+                            and encabezados.get('connection', '').lower() != 'close')
+
+                if metodo not in ('GET', 'HEAD'):
+                    estado, extra, cuerpo = HTTPStatus.METHOD_NOT_ALLOWED, {'Allow': 'GET, HEAD'}, b''
+                else:
+                    try:
+                        estado, extra, cuerpo = self.resolver(destino, encabezados)
+                    except Exception as e:
+                        log(f"❌ Error en {destino}: {str(e)}")
+                        estado, extra, cuerpo = HTTPStatus.INTERNAL_SERVER_ERROR, {}, b''
+
+                await self._responder(writer, metodo, estado, extra, cuerpo, mantener)
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _responder(self, writer, metodo, estado, extra, cuerpo, mantener):
+        encabezados = {
+            'Content-Length': str(len(cuerpo)),
+            'Cache-Control': 'no-cache',  # Siempre revalidar con ETag
+            'Access-Control-Allow-Origin': '*',
+            'Connection': 'keep-alive' if mantener else 'close',
+        }
+        if cuerpo and 'Content-Type' not in extra:
+            encabezados['Content-Type'] = 'application/json; charset=utf-8'
+        encabezados.update(extra)
+
+        respuesta = f"HTTP/1.1 {estado.value} {estado.phrase}\r\n"
+        respuesta += ''.join(f"{nombre}: {valor}\r\n" for nombre, valor in encabezados.items())
+        writer.write(respuesta.encode('latin-1') + b'\r\n')
+        if metodo != 'HEAD' and estado != HTTPStatus.NOT_MODIFIED:
+            writer.write(cuerpo)
+        await writer.drain()
+
+
+async def servir(json_file='public/empleados.json', qr_dir='public/qr_codes', host='127.0.0.1', puerto=8080):
+    """Inicia el servidor y la recarga automática."""
+    servidor = ServidorEmpleados(json_file, qr_dir)
+    log(f"📂 {len(servidor.indice.empleados)} empleados cargados de {json_file}")
+
+    tcp = await asyncio.start_server(servidor.atender, host, puerto)
+    recarga = asyncio.create_task(servidor.recargar_periodicamente())
+    log(f"🌐 Escuchando en http://{host}:{puerto}/ (Ctrl+C para salir)")
+
+    try:
+        async with tcp:
+            await tcp.serve_forever()
+    finally:
+        recarga.cancel()
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    host = '127.0.0.1'
+    puerto = 8080
+    uso = "Uso: python servidor_empleados.py [json_file] [qr_dir] [--host H] [--puerto N]"
+
+    if args and args[0] in ['-h', '--help']:
+        print(uso)
+        print()
+        print("Parámetros:")
+        print("  json_file  : Exportación de empleados (default: public/empleados.json)")
+        print("  qr_dir     : Carpeta de QR (default: public/qr_codes)")
+        print("  --host H   : Dirección donde escuchar (default: 127.0.0.1; 0.0.0.0 para la red)")
+        print("  --puerto N : Puerto (default: 8080)")
+        print()
+        print("Ejemplos:")
+        print("  python servidor_empleados.py")
+        print("  python servidor_empleados.py public/empleados.json public/qr_codes --host 0.0.0.0")
+        print("  curl 'http://127.0.0.1:8080/empleados?q=perez&gerencia=THE+MONEY+CENTER+1'")
+        sys.exit(0)
+
+    # Opciones con valor
+    for opcion in ('--host', '--puerto'):
+        if opcion in args:
+            i = args.index(opcion)
+            try:
+                valor = args[i + 1]
+                if opcion == '--host':
+                    host = valor
+                else:
+                    puerto = int(valor)
+            except (IndexError, ValueError):
+                print(f"❌ Error: {opcion} requiere un valor" + (" numérico" if opcion == '--puerto' else ""))
+                print(uso)
+                sys.exit(1)
+            del args[i:i + 2]
+
+    json_file = args[0] if len(args) > 0 else 'public/empleados.json'
+    qr_dir = args[1] if len(args) > 1 else 'public/qr_codes'
+
+    if not Path(json_file).exists():
+        print(f"❌ Error: El archivo '{json_file}' no existe")
+        sys.exit(1)
+
+    try:
+        asyncio.run(servir(json_file, qr_dir, host, puerto))
+    except KeyboardInterrupt:
+        print()
+        log("👋 Servidor detenido")
+
+
+if __name__ == '__main__':
+    main()
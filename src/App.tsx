@@ -1,50 +1,24 @@
 import { useEffect, useState, useRef } from 'react';
 import type { Empleado } from './types/empleado';
+import CodigoQr from './components/CodigoQr';
 import Credencial from './components/Credencial';
 import ListaEmpleados from './components/ListaEmpleados';
+import Reloj from './components/Reloj';
+import SelloFirma from './components/SelloFirma';
 import logoImg from '/moneycenter.png';
+import { cargarManifiesto, getEmpleadosPath, getQRPath } from './utils/activos';
+import { QR_LOCAL, pngQr, urlQr } from './utils/codigoQr';
+import { cargarClavePublica, coincideNombre, verificarToken, type ResultadoFirma } from './utils/firmaQr';
+import { suscribir } from './utils/planificador';
+import { estaRevocado } from './utils/revocaciones';
 
 type LoadingState = 'loading' | 'success' | 'error';
 
-// Función para normalizar nombres (eliminar acentos y caracteres especiales)
-// Debe coincidir con la función sanitize_filename del script Python
-const sanitizeName = (name: string): string => {
-  // Mapa de reemplazos de acentos y caracteres especiales
-  const replacements: { [key: string]: string } = {
-    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-    'á': 'A', 'é': 'E', 'í': 'I', 'ó': 'O', 'ú': 'U',
-    'Ñ': 'N', 'ñ': 'N',
-    'Ü': 'U', 'ü': 'U',
-  };
-
-  let result = name.toUpperCase();
-
-  // Aplicar reemplazos
-  for (const [from, to] of Object.entries(replacements)) {
-    result = result.replace(new RegExp(from, 'g'), to);
-  }
-
-  // Reemplazar espacios por guiones bajos
-  result = result.replace(/ /g, '_');
-
-  // Eliminar cualquier caracter que no sea letra, número o guión bajo
-  result = result.replace(/[^A-Z0-9_]/g, '');
-
-  return result;
-};
-
-// Función para generar la ruta del QR basada en el nombre del empleado
-const getQRPath = (nombre: string): string => {
-  const qrFileName = sanitizeName(nombre) + '.png';
-  return `${import.meta.env.BASE_URL}qr_codes/${qrFileName}`;
-};
-
-// Función para descargar el código QR
-const downloadQR = async (nombre: string) => {
-  const qrPath = getQRPath(nombre);
+// Función para descargar el código QR (con VITE_QR_LOCAL se genera aquí)
+const downloadQR = async (empleado: Empleado, contenidoQr: string) => {
+  const { nombre } = empleado;
   try {
-    const response = await fetch(qrPath);
-    const blob = await response.blob();
+    const blob = QR_LOCAL ? await pngQr(contenidoQr) : await (await fetch(getQRPath(empleado))).blob();
     const url = window.URL.createObjectURL(blob);
     const link = document.createElement('a');
     link.href = url;
@@ -65,9 +39,15 @@ function App() {
   const [errorMessage, setErrorMessage] = useState<string>('');
   const [vistaCredencial, setVistaCredencial] = useState(false);
   const [mostrarLista, setMostrarLista] = useState(false);
+  const [sinDirectorio, setSinDirectorio] = useState(false);
+
+  // QR firmado (?t=): resultado de la verificación local
+  const [firma, setFirma] = useState<ResultadoFirma | null>(null);
+  const [nombreCoincide, setNombreCoincide] = useState<boolean | null>(null);
+  // Sin directorio: si el id está en el filtro de revocados (null = pendiente)
+  const [revocado, setRevocado] = useState<boolean | null>(null);
 
   // Estados de seguridad
-  const [currentTime, setCurrentTime] = useState(new Date());
   const [isIntegrityValid, setIsIntegrityValid] = useState(true);
   const [devToolsOpen, setDevToolsOpen] = useState(false);
   const originalDataRef = useRef<string>('');
@@ -78,12 +58,27 @@ function App() {
       const urlParams = new URLSearchParams(window.location.search);
       const empleadoId = urlParams.get('id');
       const view = urlParams.get('view');
+      const token = urlParams.get('t');
+
+      // La firma se verifica sin esperar al directorio (ni a la red)
+      if (empleadoId && token) {
+        cargarClavePublica()
+          .then((clave) => verificarToken(token, clave))
+          .then((resultado) => {
+            // El token debe ser del mismo id que la URL
+            setFirma(resultado.id && resultado.id !== empleadoId
+              ? { valido: false, motivo: 'firma' }
+              : resultado);
+          });
+      }
 
       // Determinar si se quiere ver la credencial
       setVistaCredencial(view === 'credencial');
 
       try {
-        const response = await fetch('./empleados.json');
+        // Primero el manifiesto (rutas con hash de los datos publicados)
+        await cargarManifiesto();
+        const response = await fetch(getEmpleadosPath());
 
         if (!response.ok) {
           throw new Error('No se pudo cargar el archivo de empleados');
@@ -115,6 +110,12 @@ function App() {
         }
       } catch (error) {
         console.error('Error:', error);
+        setSinDirectorio(true);
+        // Sin el directorio, el filtro de revocados (pocos KB) dice si el QR
+        // fue dado de baja
+        if (empleadoId) {
+          estaRevocado(empleadoId).then(setRevocado);
+        }
         setErrorMessage(
           'Error al cargar los datos. Verifique que el archivo empleados.json existe y es válido.'
         );
@@ -125,13 +126,17 @@ function App() {
     cargarDatos();
   }, []);
 
-  // Capa 2: Timestamp dinámico
+  // El nombre del directorio debe corresponder al hash firmado en el QR
   useEffect(() => {
-    const timer = setInterval(() => {
-      setCurrentTime(new Date());
-    }, 1000);
-    return () => clearInterval(timer);
-  }, []);
+    if (!firma?.valido || !empleado) return;
+    let vigente = true;
+    coincideNombre(firma, empleado.nombre).then((coincide) => {
+      if (vigente) setNombreCoincide(coincide);
+    });
+    return () => {
+      vigente = false;
+    };
+  }, [firma, empleado]);
 
   // Capa 3: Detector de integridad mejorado con MutationObserver
   useEffect(() => {
@@ -199,10 +204,10 @@ function App() {
           }, 500);
         }
 
-        const integrityTimer = setInterval(checkIntegrity, 2000);
+        const cancelarIntegridad = suscribir(2000, checkIntegrity);
 
         return () => {
-          clearInterval(integrityTimer);
+          cancelarIntegridad();
           observer.disconnect();
         };
       }, 3000);
@@ -236,28 +241,17 @@ function App() {
           }
         };
 
-        const devToolsTimer = setInterval(detectDevTools, 1000);
+        const cancelarDevTools = suscribir(1000, detectDevTools);
         window.addEventListener('resize', detectDevTools);
 
         return () => {
-          clearInterval(devToolsTimer);
+          cancelarDevTools();
           window.removeEventListener('resize', detectDevTools);
         };
       }
     }
   }, [mostrarLista, empleado]);
 
-  // Formatear fecha y hora
-  const formatDateTime = (date: Date) => {
-    const day = String(date.getDate()).padStart(2, '0');
-    const month = String(date.getMonth() + 1).padStart(2, '0');
-    const year = date.getFullYear();
-    const hours = String(date.getHours()).padStart(2, '0');
-    const minutes = String(date.getMinutes()).padStart(2, '0');
-    const seconds = String(date.getSeconds()).padStart(2, '0');
-    return `${day}/${month}/${year} - ${hours}:${minutes}:${seconds}`;
-  };
-
   // Mostrar lista de empleados cuando no hay ID
   if (mostrarLista && loadingState === 'success') {
     return <ListaEmpleados empleados={empleados} />;
@@ -336,6 +330,12 @@ function App() {
     );
   }
 
+  // Contenido del QR (VITE_QR_LOCAL): si se abrió desde un QR firmado válido,
+  // el mismo token para que el QR en pantalla sea el impreso
+  const contenidoQr = empleado
+    ? urlQr(empleado.id, firma?.valido ? new URLSearchParams(window.location.search).get('t') : null)
+    : '';
+
   // Vista de directorio individual
   return (
     <div className="min-h-screen bg-gradient-to-br from-[#ef4444] to-[#b91c1c] flex items-center justify-center p-2 xs:p-3 md:p-5">
@@ -372,8 +372,28 @@ function App() {
           </div>
         )}
 
+        {/* Sin directorio: credencial revocada (filtro de revocados) */}
+        {loadingState === 'error' && sinDirectorio && revocado && (
+          <div className="w-full mt-2 px-3 py-2 rounded-lg bg-red-50 border border-red-300">
+            <div className="flex items-center justify-center gap-2">
+              <span className="text-lg">✕</span>
+              <span className="text-xs xs:text-sm font-semibold text-red-700">
+                Perfil no válido
+              </span>
+            </div>
+            <p className="text-center text-[10px] xs:text-xs text-red-600 mt-1">
+              Estado: CREDENCIAL REVOCADA
+            </p>
+          </div>
+        )}
+
+        {/* Sin directorio (sin conexión) pero con QR firmado válido y no revocado */}
+        {loadingState === 'error' && sinDirectorio && revocado === false && firma?.valido && (
+          <SelloFirma firma={firma} sinDirectorio />
+        )}
+
         {/* Estado: Error */}
-        {loadingState === 'error' && (
+        {loadingState === 'error' && !(sinDirectorio && (revocado || (revocado === false && firma?.valido))) && (
           <div className="bg-red-50 rounded-2xl p-3 xs:p-4 md:p-6 mt-2 xs:mt-3 md:mt-5">
             <div className="text-3xl xs:text-4xl md:text-6xl mb-2 md:mb-3">⚠️</div>
             <h2 className="text-red-600 text-base xs:text-lg md:text-2xl font-bold mb-2">
@@ -394,16 +414,24 @@ function App() {
           <div>
             {/* QR Code del empleado */}
             <div className="flex flex-col items-center mb-3 xs:mb-4 md:mb-6">
-              <img
-                src={getQRPath(empleado.nombre)}
-                alt={`QR de ${empleado.nombre}`}
-                className="w-32 h-32 xs:w-40 xs:h-40 md:w-48 md:h-48 object-contain border-2 border-gray-200 rounded-xl p-2 bg-white mb-2 xs:mb-3"
-                onError={(e) => {
-                  e.currentTarget.style.display = 'none';
-                }}
-              />
+              {QR_LOCAL ? (
+                <CodigoQr
+                  texto={contenidoQr}
+                  etiqueta={`QR de ${empleado.nombre}`}
+                  className="w-32 h-32 xs:w-40 xs:h-40 md:w-48 md:h-48 object-contain border-2 border-gray-200 rounded-xl p-2 bg-white mb-2 xs:mb-3"
+                />
+              ) : (
+                <img
+                  src={getQRPath(empleado)}
+                  alt={`QR de ${empleado.nombre}`}
+                  className="w-32 h-32 xs:w-40 xs:h-40 md:w-48 md:h-48 object-contain border-2 border-gray-200 rounded-xl p-2 bg-white mb-2 xs:mb-3"
+                  onError={(e) => {
+                    e.currentTarget.style.display = 'none';
+                  }}
+                />
+              )}
               <button
-                onClick={() => downloadQR(empleado.nombre)}
+                onClick={() => downloadQR(empleado, contenidoQr)}
                 className="px-3 py-1.5 xs:px-4 xs:py-2 bg-[#ef4444] text-white text-[10px] xs:text-xs md:text-sm rounded-lg hover:bg-[#dc2626] transition-colors active:bg-[#b91c1c] flex items-center gap-1.5 xs:gap-2"
               >
                 <svg className="w-3 h-3 xs:w-4 xs:h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -457,9 +485,7 @@ function App() {
                 <p className={`text-[10px] xs:text-xs uppercase tracking-wide mb-1 font-bold ${empleado.baja ? 'text-red-600' : 'text-gray-500'}`}>
                   {empleado.baja ? 'DADO DE BAJA' : 'Verificado'}
                 </p>
-                <p className="text-gray-800 text-xs xs:text-sm md:text-base font-mono font-semibold">
-                  {formatDateTime(currentTime)}
-                </p>
+                <Reloj className="text-gray-800 text-xs xs:text-sm md:text-base font-mono font-semibold" />
               </div>
             </div>
 
@@ -489,6 +515,9 @@ function App() {
                 </p>
               </div>
             ) : null}
+
+            {/* Capa 5: Firma del QR (solo QR firmados) */}
+            {firma && <SelloFirma firma={firma} nombreCoincide={nombreCoincide} />}
           </div>
         )}
       </div>
@@ -0,0 +1,23 @@
+import { useEffect, useRef } from 'react';
+import { dibujarQr } from '../utils/codigoQr';
+
+interface CodigoQrProps {
+  // Contenido del QR (urlQr)
+  texto: string;
+  etiqueta: string;
+  className?: string;
+}
+
+// QR dibujado en el navegador, con los mismos píxeles que el PNG de
+// generar_qrs_imagenes.py (el canvas se escala con las clases del <img>)
+export default function CodigoQr({ texto, etiqueta, className }: CodigoQrProps) {
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+
+  useEffect(() => {
+    if (canvasRef.current) {
+      dibujarQr(canvasRef.current, texto);
+    }
+  }, [texto]);
+
+  return <canvas ref={canvasRef} role="img" aria-label={etiqueta} className={className} />;
+}
@@ -1,54 +1,26 @@
-import { useState, useMemo } from 'react';
+import { useState } from 'react';
 import type { Empleado } from '../types/empleado';
 import logoImg from '/moneycenter.png';
+import { getQRPath } from '../utils/activos';
+import { QR_LOCAL, pngQr, urlQr } from '../utils/codigoQr';
+import { useBusquedaEmpleados } from '../utils/useBusquedaEmpleados';
+import CodigoQr from './CodigoQr';
+import ListaVirtual from './ListaVirtual';
 
 interface ListaEmpleadosProps {
   empleados: Empleado[];
 }
 
-// Función para normalizar nombres (eliminar acentos y caracteres especiales)
-// Debe coincidir con la función sanitize_filename del script Python
-const sanitizeName = (name: string): string => {
-  // Mapa de reemplazos de acentos y caracteres especiales
-  const replacements: { [key: string]: string } = {
-    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-    'á': 'A', 'é': 'E', 'í': 'I', 'ó': 'O', 'ú': 'U',
-    'Ñ': 'N', 'ñ': 'N',
-    'Ü': 'U', 'ü': 'U',
-  };
+const claveEmpleado = (empleado: Empleado) => empleado.id;
 
-  let result = name.toUpperCase();
-
-  // Aplicar reemplazos
-  for (const [from, to] of Object.entries(replacements)) {
-    result = result.replace(new RegExp(from, 'g'), to);
-  }
-
-  // Reemplazar espacios por guiones bajos
-  result = result.replace(/ /g, '_');
-
-  // Eliminar cualquier caracter que no sea letra, número o guión bajo
-  result = result.replace(/[^A-Z0-9_]/g, '');
-
-  return result;
-};
-
-// Función para generar la ruta del QR basada en el nombre del empleado
-const getQRPath = (nombre: string): string => {
-  // Convertir "BRENDA BERMEO MENDOZA" a "BRENDA_BERMEO_MENDOZA.png"
-  const qrFileName = sanitizeName(nombre) + '.png';
-  return `${import.meta.env.BASE_URL}qr_codes/${qrFileName}`;
-};
-
-// Función para descargar el código QR
-const downloadQR = async (nombre: string, event: React.MouseEvent) => {
+// Función para descargar el código QR (con VITE_QR_LOCAL se genera aquí)
+const downloadQR = async (empleado: Empleado, event: React.MouseEvent) => {
   event.preventDefault();
   event.stopPropagation();
 
-  const qrPath = getQRPath(nombre);
+  const { nombre } = empleado;
   try {
-    const response = await fetch(qrPath);
-    const blob = await response.blob();
+    const blob = QR_LOCAL ? await pngQr(urlQr(empleado.id)) : await (await fetch(getQRPath(empleado))).blob();
     const url = window.URL.createObjectURL(blob);
     const link = document.createElement('a');
     link.href = url;
@@ -66,27 +38,8 @@ export default function ListaEmpleados({ empleados }: ListaEmpleadosProps) {
   const [busqueda, setBusqueda] = useState('');
   const [gerenciaFiltro, setGerenciaFiltro] = useState('todas');
 
-  // Obtener lista única de gerencias
-  const gerencias = useMemo(() => {
-    const lista = Array.from(new Set(empleados.map(emp => emp.gerencia)));
-    return lista.sort();
-  }, [empleados]);
-
-  // Filtrar empleados
-  const empleadosFiltrados = useMemo(() => {
-    return empleados.filter(emp => {
-      const matchBusqueda =
-        emp.nombre.toLowerCase().includes(busqueda.toLowerCase()) ||
-        emp.id.includes(busqueda) ||
-        emp.celular.includes(busqueda);
-
-      const matchGerencia =
-        gerenciaFiltro === 'todas' ||
-        emp.gerencia === gerenciaFiltro;
-
-      return matchBusqueda && matchGerencia;
-    });
-  }, [empleados, busqueda, gerenciaFiltro]);
+  // Filtrar empleados (en un Web Worker) y gerencias con número de empleados
+  const { empleadosFiltrados, gerencias } = useBusquedaEmpleados(empleados, busqueda, gerenciaFiltro);
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-[#ef4444] to-[#b91c1c] py-3 xs:py-4 md:py-8 px-2 xs:px-3 md:px-4">
@@ -142,8 +95,8 @@ export default function ListaEmpleados({ empleados }: ListaEmpleadosProps) {
               >
                 <option value="todas">Todas las gerencias</option>
                 {gerencias.map(gerencia => (
-                  <option key={gerencia} value={gerencia}>
-                    {gerencia}
+                  <option key={gerencia.nombre} value={gerencia.nombre}>
+                    {gerencia.nombre} ({gerencia.total})
                   </option>
                 ))}
               </select>
@@ -159,10 +112,14 @@ export default function ListaEmpleados({ empleados }: ListaEmpleadosProps) {
         </div>
 
         {/* Lista de empleados */}
-        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-1.5 xs:gap-2 md:gap-4">
-          {empleadosFiltrados.map((empleado) => (
+        {/* Solo se montan las tarjetas visibles (y sus QR) */}
+        <ListaVirtual
+          elementos={empleadosFiltrados}
+          clave={claveEmpleado}
+          alturaEstimada={300}
+          claseFila="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-1.5 xs:gap-2 md:gap-4 pb-1.5 xs:pb-2 md:pb-4"
+          renderElemento={(empleado) => (
             <a
-              key={empleado.id}
               href={`?id=${empleado.id}`}
               className={`rounded-xl shadow-lg p-2 xs:p-3 md:p-6 hover:shadow-xl hover:-translate-y-1 transition-all duration-300 cursor-pointer group active:scale-95 ${empleado.baja ? 'bg-red-50 border-2 border-red-400' : 'bg-white'}`}
             >
@@ -185,17 +142,28 @@ export default function ListaEmpleados({ empleados }: ListaEmpleadosProps) {
 
               {/* QR Code */}
               <div className="flex flex-col items-center mb-2 xs:mb-3 md:mb-4">
-                <img
-                  src={getQRPath(empleado.nombre)}
-                  alt={`QR de ${empleado.nombre}`}
-                  className="w-20 h-20 xs:w-24 xs:h-24 md:w-32 md:h-32 object-contain border-2 border-gray-200 rounded-lg p-1 mb-1.5 xs:mb-2"
-                  onError={(e) => {
-                    // Si no se encuentra el QR, ocultar la imagen
-                    e.currentTarget.style.display = 'none';
-                  }}
-                />
+                {QR_LOCAL ? (
+                  // Sin descargar una imagen por empleado
+                  <CodigoQr
+                    texto={urlQr(empleado.id)}
+                    etiqueta={`QR de ${empleado.nombre}`}
+                    className="w-20 h-20 xs:w-24 xs:h-24 md:w-32 md:h-32 object-contain border-2 border-gray-200 rounded-lg p-1 mb-1.5 xs:mb-2"
+                  />
+                ) : (
+                  <img
+                    src={getQRPath(empleado)}
+                    alt={`QR de ${empleado.nombre}`}
+                    loading="lazy"
+                    decoding="async"
+                    className="w-20 h-20 xs:w-24 xs:h-24 md:w-32 md:h-32 object-contain border-2 border-gray-200 rounded-lg p-1 mb-1.5 xs:mb-2"
+                    onError={(e) => {
+                      // Si no se encuentra el QR, ocultar la imagen
+                      e.currentTarget.style.display = 'none';
+                    }}
+                  />
+                )}
                 <button
-                  onClick={(e) => downloadQR(empleado.nombre, e)}
+                  onClick={(e) => downloadQR(empleado, e)}
                   className="px-2 py-1 xs:px-2.5 xs:py-1 bg-[#ef4444] text-white text-[9px] xs:text-[10px] rounded hover:bg-[#dc2626] transition-colors active:bg-[#b91c1c] flex items-center gap-1"
                   title="Descargar código QR"
                 >
@@ -227,8 +195,8 @@ export default function ListaEmpleados({ empleados }: ListaEmpleadosProps) {
                 <span>{empleado.celular}</span>
               </div>
             </a>
-          ))}
-        </div>
+          )}
+        />
 
         {/* Sin resultados */}
         {empleadosFiltrados.length === 0 && (
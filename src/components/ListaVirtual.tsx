@@ -0,0 +1,220 @@
+import { Fragment, useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
+import type { ReactNode } from 'react';
+
+// Lista en ventana: solo se montan las filas visibles (más `overscan` arriba
+// y abajo); el resto es espacio vacío con el alto estimado o ya medido.
+// La página se desplaza con la ventana, como el grid original.
+
+interface ListaVirtualProps<T> {
+  elementos: T[];
+  clave: (elemento: T) => string;
+  renderElemento: (elemento: T) => ReactNode;
+  // Alto aproximado de una fila (px), hasta medirla
+  alturaEstimada: number;
+  // Filas extra montadas arriba y abajo de las visibles
+  overscan?: number;
+  // Clases del grid de cada fila (deben coincidir con calcularColumnas)
+  claseFila: string;
+}
+
+// Columnas del grid según los breakpoints de Tailwind (md: 2, lg: 3)
+const calcularColumnas = (): number => {
+  if (window.matchMedia('(min-width: 1024px)').matches) return 3;
+  if (window.matchMedia('(min-width: 768px)').matches) return 2;
+  return 1;
+};
+
+// Última fila que empieza antes de `y` (búsqueda binaria)
+const buscarFila = (posiciones: Float64Array, filas: number, y: number): number => {
+  let inicio = 0;
+  let fin = filas - 1;
+  while (inicio < fin) {
+    const medio = (inicio + fin + 1) >> 1;
+    if (posiciones[medio] <= y) {
+      inicio = medio;
+    } else {
+      fin = medio - 1;
+    }
+  }
+  return Math.max(0, inicio);
+};
+
+export default function ListaVirtual<T>({
+  elementos,
+  clave,
+  renderElemento,
+  alturaEstimada,
+  overscan = 3,
+  claseFila,
+}: ListaVirtualProps<T>) {
+  const contenedorRef = useRef<HTMLDivElement>(null);
+  const [columnas, setColumnas] = useState(calcularColumnas);
+  const [rango, setRango] = useState({ inicio: 0, fin: 0 });
+
+  // Altos medidos por fila (clave: columnas + primer empleado de la fila)
+  const [alturas] = useState(() => new Map<string, number>());
+  const [versionAlturas, setVersionAlturas] = useState(0);
+
+  // Primera fila visible y su distancia al borde de la ventana, para no
+  // perder el lugar al cambiar los filtros
+  const anclaRef = useRef<{ clave: string; desplazamiento: number } | null>(null);
+
+  const filas = Math.ceil(elementos.length / columnas);
+  const claveFila = useCallback(
+    (fila: number) => `${columnas}:${clave(elementos[fila * columnas])}`,
+    [columnas, clave, elementos]
+  );
+
+  // Posición vertical de cada fila (posiciones[filas] = alto total)
+  const posiciones = useMemo(() => {
+    let suma = 0;
+    for (const altura of alturas.values()) suma += altura;
+    const promedio = alturas.size ? suma / alturas.size : alturaEstimada;
+
+    const resultado = new Float64Array(filas + 1);
+    for (let fila = 0; fila < filas; fila++) {
+      resultado[fila + 1] = resultado[fila] + (alturas.get(claveFila(fila)) ?? promedio);
+    }
+    return resultado;
+    // versionAlturas: recalcular cuando se mide una fila
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [filas, claveFila, alturas, alturaEstimada, versionAlturas]);
+
+  const posicionesRef = useRef(posiciones);
+  useLayoutEffect(() => {
+    posicionesRef.current = posiciones;
+  }, [posiciones]);
+
+  // Filas visibles según la posición de la ventana
+  const actualizarRango = useCallback(() => {
+    const contenedor = contenedorRef.current;
+    if (!contenedor || filas === 0) {
+      setRango((anterior) => (anterior.fin === 0 ? anterior : { inicio: 0, fin: 0 }));
+      anclaRef.current = null;
+      return;
+    }
+
+    const top = contenedor.getBoundingClientRect().top;
+    const desde = Math.max(0, -top);
+    const hasta = -top + window.innerHeight;
+    const primera = buscarFila(posiciones, filas, desde);
+    const inicio = Math.max(0, primera - overscan);
+    const fin = Math.min(filas, buscarFila(posiciones, filas, hasta) + 1 + overscan);
+
+    setRango((anterior) =>
+      anterior.inicio === inicio && anterior.fin === fin ? anterior : { inicio, fin }
+    );
+    anclaRef.current = {
+      clave: clave(elementos[primera * columnas]),
+      desplazamiento: top + posiciones[primera],
+    };
+  }, [filas, posiciones, overscan, clave, elementos, columnas]);
+
+  // Al cambiar los filtros (o las columnas), mantener a la vista la fila
+  // que estaba arriba si sigue en los resultados
+  const elementosRef = useRef(elementos);
+  const columnasRef = useRef(columnas);
+  useLayoutEffect(() => {
+    const ancla = anclaRef.current;
+    const contenedor = contenedorRef.current;
+    if ((elementosRef.current !== elementos || columnasRef.current !== columnas) && ancla && contenedor) {
+      const indice = elementos.findIndex((elemento) => clave(elemento) === ancla.clave);
+      if (indice >= 0) {
+        const fila = Math.floor(indice / columnas);
+        const actual = contenedor.getBoundingClientRect().top + posiciones[fila];
+        window.scrollBy(0, actual - ancla.desplazamiento);
+      }
+    }
+    elementosRef.current = elementos;
+    columnasRef.current = columnas;
+    actualizarRango();
+  }, [elementos, columnas, posiciones, clave, actualizarRango]);
+
+  // Scroll (una vez por cuadro) y cambios de tamaño de la ventana
+  useEffect(() => {
+    let cuadro = 0;
+    const alDesplazar = () => {
+      if (!cuadro) {
+        cuadro = requestAnimationFrame(() => {
+          cuadro = 0;
+          actualizarRango();
+        });
+      }
+    };
+    const alRedimensionar = () => {
+      setColumnas(calcularColumnas());
+      alDesplazar();
+    };
+
+    window.addEventListener('scroll', alDesplazar, { passive: true });
+    window.addEventListener('resize', alRedimensionar);
+    return () => {
+      cancelAnimationFrame(cuadro);
+      window.removeEventListener('scroll', alDesplazar);
+      window.removeEventListener('resize', alRedimensionar);
+    };
+  }, [actualizarRango]);
+
+  // Medir las filas montadas; si cambia el alto de una fila arriba de la
+  // vista, compensar el scroll para que el contenido no salte
+  const [observador] = useState(() => {
+    if (typeof ResizeObserver === 'undefined') return null;
+    return new ResizeObserver((entradas) => {
+      let compensar = 0;
+      let cambio = false;
+      for (const entrada of entradas) {
+        const elemento = entrada.target as HTMLElement;
+        const claveMedida = elemento.dataset.clave!;
+        const fila = Number(elemento.dataset.fila);
+        const altura = elemento.offsetHeight;
+        if (altura > 0 && alturas.get(claveMedida) !== altura) {
+          const anterior = posicionesRef.current[fila + 1] - posicionesRef.current[fila];
+          alturas.set(claveMedida, altura);
+          cambio = true;
+          // La fila estaba completa arriba de la ventana
+          if (elemento.getBoundingClientRect().top + anterior <= 0) {
+            compensar += altura - anterior;
+          }
+        }
+      }
+      if (cambio) {
+        if (Math.abs(compensar) > 0.5) {
+          window.scrollBy(0, compensar);
+        }
+        setVersionAlturas((version) => version + 1);
+      }
+    });
+  });
+  useEffect(() => () => observador?.disconnect(), [observador]);
+
+  const observar = useCallback((elemento: HTMLDivElement | null) => {
+    if (!elemento || !observador) return;
+    observador.observe(elemento);
+    return () => observador.unobserve(elemento);
+  }, [observador]);
+
+  const filasMontadas: ReactNode[] = [];
+  for (let fila = rango.inicio; fila < Math.min(rango.fin, filas); fila++) {
+    const grupo = elementos.slice(fila * columnas, (fila + 1) * columnas);
+    filasMontadas.push(
+      <div
+        key={claveFila(fila)}
+        ref={observar}
+        data-fila={fila}
+        data-clave={claveFila(fila)}
+        className={claseFila}
+        style={{ position: 'absolute', top: 0, left: 0, right: 0, transform: `translateY(${posiciones[fila]}px)` }}
+      >
+        {grupo.map((elemento) => (
+          <Fragment key={clave(elemento)}>{renderElemento(elemento)}</Fragment>
+        ))}
+      </div>
+    );
+  }
+
+  return (
+    <div ref={contenedorRef} style={{ position: 'relative', height: posiciones[filas] }}>
+      {filasMontadas}
+    </div>
+  );
+}
@@ -0,0 +1,27 @@
+import { useEffect, useState } from 'react';
+import { suscribir } from '../utils/planificador';
+
+interface RelojProps {
+  className: string;
+}
+
+// Formatear fecha y hora
+const formatDateTime = (date: Date) => {
+  const day = String(date.getDate()).padStart(2, '0');
+  const month = String(date.getMonth() + 1).padStart(2, '0');
+  const year = date.getFullYear();
+  const hours = String(date.getHours()).padStart(2, '0');
+  const minutes = String(date.getMinutes()).padStart(2, '0');
+  const seconds = String(date.getSeconds()).padStart(2, '0');
+  return `${day}/${month}/${year} - ${hours}:${minutes}:${seconds}`;
+};
+
+// Fecha y hora que se actualiza cada segundo (solo se vuelve a renderizar
+// este componente, no toda la credencial)
+export default function Reloj({ className }: RelojProps) {
+  const [currentTime, setCurrentTime] = useState(() => new Date());
+
+  useEffect(() => suscribir(1000, () => setCurrentTime(new Date())), []);
+
+  return <p className={className}>{formatDateTime(currentTime)}</p>;
+}
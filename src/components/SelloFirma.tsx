@@ -0,0 +1,58 @@
+import type { MotivoFirma, ResultadoFirma } from '../utils/firmaQr';
+
+interface SelloFirmaProps {
+  firma: ResultadoFirma;
+  // false si el nombre del directorio no corresponde al del token
+  nombreCoincide?: boolean | null;
+  // Sin directorio (sin conexión): mostrar los datos del token
+  sinDirectorio?: boolean;
+}
+
+const MOTIVOS: Record<MotivoFirma, string> = {
+  formato: 'El QR no contiene una firma válida',
+  firma: 'La firma no corresponde (QR alterado)',
+  no_vigente: 'La credencial todavía no es vigente',
+  vencido: 'La credencial está vencida',
+  sin_soporte: 'Este navegador no puede verificar la firma',
+};
+
+// Las fechas del token son medianoche UTC
+const formatDate = (date: Date) =>
+  date.toLocaleDateString('es-MX', { timeZone: 'UTC', day: '2-digit', month: '2-digit', year: 'numeric' });
+
+// Resultado de verificar la firma del QR (firma_qr.py)
+export default function SelloFirma({ firma, nombreCoincide = null, sinDirectorio = false }: SelloFirmaProps) {
+  const valida = firma.valido && nombreCoincide !== false;
+
+  if (!valida) {
+    const motivo = firma.valido ? 'El nombre no corresponde a la firma del QR' : MOTIVOS[firma.motivo ?? 'formato'];
+    return (
+      <div className="w-full mt-2 px-3 py-2 rounded-lg bg-red-50 border border-red-300">
+        <div className="flex items-center justify-center gap-2">
+          <span className="text-lg">✕</span>
+          <span className="text-xs xs:text-sm font-semibold text-red-700">Firma digital no válida</span>
+        </div>
+        <p className="text-center text-[10px] xs:text-xs text-red-600 mt-1">{motivo}</p>
+      </div>
+    );
+  }
+
+  return (
+    <div className="w-full mt-2 px-3 py-2 rounded-lg bg-green-50">
+      <div className="flex items-center justify-center gap-2">
+        <span className="text-lg">🔏</span>
+        <span className="text-xs xs:text-sm font-semibold text-green-700">
+          {sinDirectorio ? 'Credencial verificada sin conexión' : 'Firma digital válida'}
+        </span>
+      </div>
+      {sinDirectorio && firma.puesto && (
+        <p className="text-center text-xs xs:text-sm text-gray-800 font-medium mt-1">{firma.puesto}</p>
+      )}
+      {firma.hasta && (
+        <p className="text-center text-[10px] xs:text-xs text-green-600 mt-1">
+          Vigente hasta {formatDate(firma.hasta)}
+        </p>
+      )}
+    </div>
+  );
+}
@@ -5,4 +5,6 @@ export interface Empleado {
   gerencia: string;
   celular: string;
   baja?: boolean;
+  // Ruta del QR con hash (solo en empleados.<hash>.json, generar_manifiesto.py)
+  qr?: string;
 }
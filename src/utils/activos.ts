@@ -0,0 +1,76 @@
+// Rutas de los datos publicados (JSON de empleados y QR)
+//
+// En producción, generar_manifiesto.py publica copias con el hash del
+// contenido en el nombre (empleados.<hash>.json, qr_codes/<NOMBRE>.<hash>.png)
+// y un manifiesto.json, que es el único archivo que se pide sin caché. La
+// ruta de cada QR con hash viene en su empleado (campo qr), no en el
+// manifiesto. Sin manifiesto (npm run dev) se usan las rutas de siempre.
+
+import type { Empleado } from '../types/empleado';
+
+interface Manifiesto {
+  version: string;
+  empleados: string;
+  indice?: string;
+}
+
+let manifiesto: Manifiesto | null = null;
+
+// Cargar el manifiesto; debe llamarse antes de usar las demás funciones
+export const cargarManifiesto = async (): Promise<void> => {
+  try {
+    const response = await fetch(`${import.meta.env.BASE_URL}manifiesto.json`, {
+      cache: 'no-cache',
+    });
+    if (response.ok) {
+      manifiesto = await response.json();
+    }
+  } catch {
+    manifiesto = null;
+  }
+};
+
+// Función para normalizar nombres (eliminar acentos y caracteres especiales)
+// Debe coincidir con la función sanitize_filename del script Python
+export const sanitizeName = (name: string): string => {
+  // Mapa de reemplazos de acentos y caracteres especiales
+  const replacements: { [key: string]: string } = {
+    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
+    'á': 'A', 'é': 'E', 'í': 'I', 'ó': 'O', 'ú': 'U',
+    'Ñ': 'N', 'ñ': 'N',
+    'Ü': 'U', 'ü': 'U',
+  };
+
+  let result = name.toUpperCase();
+
+  // Aplicar reemplazos
+  for (const [from, to] of Object.entries(replacements)) {
+    result = result.replace(new RegExp(from, 'g'), to);
+  }
+
+  // Reemplazar espacios por guiones bajos
+  result = result.replace(/ /g, '_');
+
+  // Eliminar cualquier caracter que no sea letra, número o guión bajo
+  result = result.replace(/[^A-Z0-9_]/g, '');
+
+  return result;
+};
+
+// Ruta del JSON de empleados
+export const getEmpleadosPath = (): string => {
+  return `${import.meta.env.BASE_URL}${manifiesto?.empleados ?? 'empleados.json'}`;
+};
+
+// Ruta del índice de búsqueda (indice_busqueda.py)
+export const getIndicePath = (): string => {
+  return `${import.meta.env.BASE_URL}${manifiesto?.indice ?? 'indice_busqueda.json'}`;
+};
+
+// Función para generar la ruta del QR basada en el nombre del empleado
+export const getQRPath = (empleado: Pick<Empleado, 'nombre' | 'qr'>): string => {
+  // Convertir "BRENDA BERMEO MENDOZA" a "qr_codes/BRENDA_BERMEO_MENDOZA.png"
+  // (o la ruta con hash que trae el empleado publicado con generar_manifiesto.py)
+  const ruta = empleado.qr ?? `qr_codes/${sanitizeName(empleado.nombre)}.png`;
+  return `${import.meta.env.BASE_URL}${ruta}`;
+};
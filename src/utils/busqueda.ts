@@ -0,0 +1,260 @@
+// Búsqueda del directorio con el índice precalculado (indice_busqueda.py)
+//
+// Las palabras de la consulta se normalizan igual que en Python (sin
+// acentos y en minúsculas): "PEREZ" encuentra "PÉREZ". Con 1 o 2 caracteres
+// se buscan palabras del nombre que empiecen así; con 3 o más, palabras que
+// lo contengan (trigramas). Las consultas con dígitos (UUID o celular) se
+// comparan directamente, no están en el índice.
+//
+// La lista busca en un Web Worker (workers/busqueda.worker.ts); estas
+// funciones también se usan directamente si el navegador no tiene Workers.
+
+import type { Empleado } from '../types/empleado';
+import { getIndicePath } from './activos';
+
+interface IndiceJSON {
+  version: number;
+  total: number;
+  primero: string | null;
+  ultimo: string | null;
+  tokens: string[];
+  postings: number[][];
+  trigramas: Record<string, number[]>;
+  gerencias: { nombre: string; total: number; ordinales: number[] }[];
+}
+
+// Campos que se usan para buscar
+export type EmpleadoBusqueda = Pick<Empleado, 'id' | 'nombre' | 'celular' | 'gerencia'>;
+
+export interface Faceta {
+  nombre: string;
+  total: number;
+}
+
+export interface IndiceBusqueda {
+  tokens: string[];
+  postings: number[][];
+  trigramas: Map<string, number[]>;
+  gerencias: Map<string, number[]>;
+  // Palabras normalizadas de cada nombre (se calculan al verificar candidatos)
+  palabras: (string[] | undefined)[];
+}
+
+// Texto sin acentos y en minúsculas (igual que normalizar() en Python)
+export const foldText = (texto: string): string => {
+  return texto.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+};
+
+const separarPalabras = (texto: string): string[] => {
+  return foldText(texto).split(/[^a-z0-9]+/).filter(Boolean);
+};
+
+// Misma regla que el índice, sin índice: cada palabra de la consulta con
+// 1 o 2 caracteres inicia alguna palabra del nombre; con 3 o más, alguna
+// palabra del nombre la contiene
+const coincideNombre = (nombre: string, palabras: string[]): boolean => {
+  if (palabras.length === 0) {
+    return true;
+  }
+  const palabrasNombre = separarPalabras(nombre);
+  return palabras.every((palabra) =>
+    palabra.length >= 3
+      ? palabrasNombre.some((p) => p.includes(palabra))
+      : palabrasNombre.some((p) => p.startsWith(palabra))
+  );
+};
+
+// Las listas vienen como diferencias sucesivas: [3, 4, 1] → [3, 7, 8]
+const decodificar = (deltas: number[]): number[] => {
+  let anterior = 0;
+  return deltas.map((delta) => (anterior += delta));
+};
+
+// Cargar el índice; null si no existe o no corresponde a estos empleados
+export const cargarIndice = async (
+  empleados: EmpleadoBusqueda[],
+  ruta: string = getIndicePath()
+): Promise<IndiceBusqueda | null> => {
+  try {
+    const response = await fetch(ruta);
+    if (!response.ok) {
+      return null;
+    }
+
+    const indice: IndiceJSON = await response.json();
+    if (
+      indice.version !== 1 ||
+      indice.total !== empleados.length ||
+      indice.primero !== (empleados[0]?.id ?? null) ||
+      indice.ultimo !== (empleados[empleados.length - 1]?.id ?? null)
+    ) {
+      return null;
+    }
+
+    return {
+      tokens: indice.tokens,
+      postings: indice.postings.map(decodificar),
+      trigramas: new Map(
+        Object.entries(indice.trigramas).map(([trigrama, deltas]) => [trigrama, decodificar(deltas)])
+      ),
+      gerencias: new Map(indice.gerencias.map((g) => [g.nombre, decodificar(g.ordinales)])),
+      palabras: new Array(indice.total),
+    };
+  } catch {
+    return null;
+  }
+};
+
+// Intersección de dos listas ordenadas
+const interseccion = (a: number[], b: number[]): number[] => {
+  const resultado: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      resultado.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return resultado;
+};
+
+// Empleados con alguna palabra del nombre que empiece con el prefijo
+const buscarPrefijo = (indice: IndiceBusqueda, prefijo: string, total: number): number[] => {
+  // Primera palabra >= prefijo (búsqueda binaria)
+  let inicio = 0;
+  let fin = indice.tokens.length;
+  while (inicio < fin) {
+    const medio = (inicio + fin) >> 1;
+    if (indice.tokens[medio] < prefijo) {
+      inicio = medio + 1;
+    } else {
+      fin = medio;
+    }
+  }
+
+  const marcas = new Uint8Array(total);
+  for (let i = inicio; i < indice.tokens.length && indice.tokens[i].startsWith(prefijo); i++) {
+    for (const ordinal of indice.postings[i]) {
+      marcas[ordinal] = 1;
+    }
+  }
+
+  const resultado: number[] = [];
+  for (let ordinal = 0; ordinal < total; ordinal++) {
+    if (marcas[ordinal]) {
+      resultado.push(ordinal);
+    }
+  }
+  return resultado;
+};
+
+// Empleados con alguna palabra del nombre que contenga el texto (3+ caracteres)
+const buscarSubcadena = (indice: IndiceBusqueda, texto: string, empleados: EmpleadoBusqueda[]): number[] => {
+  let candidatos: number[] | null = null;
+  for (let i = 0; i + 3 <= texto.length; i++) {
+    const lista = indice.trigramas.get(texto.slice(i, i + 3));
+    if (!lista) {
+      return [];
+    }
+    candidatos = candidatos ? interseccion(candidatos, lista) : lista;
+  }
+
+  // Los trigramas pueden estar en palabras distintas: verificar
+  return (candidatos ?? []).filter((ordinal) => {
+    const palabras = (indice.palabras[ordinal] ??= separarPalabras(empleados[ordinal].nombre));
+    return palabras.some((palabra) => palabra.includes(texto));
+  });
+};
+
+// Consultas con dígitos: UUID o celular (comparación directa)
+const buscarIdCelular = (empleados: EmpleadoBusqueda[], consulta: string): number[] => {
+  const texto = consulta.trim().toLowerCase();
+  const digitos = texto.replace(/\D/g, '');
+  const resultado: number[] = [];
+  empleados.forEach((emp, ordinal) => {
+    if (emp.id.toLowerCase().includes(texto) || (digitos && emp.celular.replace(/\D/g, '').includes(digitos))) {
+      resultado.push(ordinal);
+    }
+  });
+  return resultado;
+};
+
+// Facetas de gerencia sin índice
+export const contarGerencias = (empleados: EmpleadoBusqueda[]): Faceta[] => {
+  const conteo = new Map<string, number>();
+  for (const emp of empleados) {
+    conteo.set(emp.gerencia, (conteo.get(emp.gerencia) ?? 0) + 1);
+  }
+  return Array.from(conteo, ([nombre, total]) => ({ nombre, total })).sort((a, b) =>
+    a.nombre < b.nombre ? -1 : a.nombre > b.nombre ? 1 : 0
+  );
+};
+
+// Posiciones de los empleados que cumplen la consulta y la gerencia
+// ('todas' = sin filtro), en el orden de empleados.json; null = todos
+export const buscarOrdinales = (
+  empleados: EmpleadoBusqueda[],
+  indice: IndiceBusqueda | null,
+  consulta: string,
+  gerencia: string
+): number[] | null => {
+  const palabras = separarPalabras(consulta);
+  if (palabras.length === 0 && gerencia === 'todas') {
+    return null;
+  }
+
+  // Sin índice: recorrer a todos (con la misma normalización y las mismas
+  // reglas por palabra que el índice)
+  if (!indice) {
+    const porIdCelular = /\d/.test(consulta) ? new Set(buscarIdCelular(empleados, consulta)) : null;
+    const resultado: number[] = [];
+    empleados.forEach((emp, ordinal) => {
+      const matchBusqueda = porIdCelular
+        ? porIdCelular.has(ordinal)
+        : coincideNombre(emp.nombre, palabras);
+      if (matchBusqueda && (gerencia === 'todas' || emp.gerencia === gerencia)) {
+        resultado.push(ordinal);
+      }
+    });
+    return resultado;
+  }
+
+  let ordinales: number[] | null = null;
+  if (/\d/.test(consulta)) {
+    ordinales = buscarIdCelular(empleados, consulta);
+  } else {
+    for (const palabra of palabras) {
+      const lista = palabra.length >= 3
+        ? buscarSubcadena(indice, palabra, empleados)
+        : buscarPrefijo(indice, palabra, empleados.length);
+      ordinales = ordinales ? interseccion(ordinales, lista) : lista;
+      if (ordinales.length === 0) {
+        break;
+      }
+    }
+  }
+
+  if (gerencia !== 'todas') {
+    const lista = indice.gerencias.get(gerencia) ?? [];
+    ordinales = ordinales ? interseccion(ordinales, lista) : lista;
+  }
+
+  return ordinales ?? [];
+};
+
+// Filtrar empleados por consulta y gerencia
+export const buscarEmpleados = <T extends EmpleadoBusqueda>(
+  empleados: T[],
+  indice: IndiceBusqueda | null,
+  consulta: string,
+  gerencia: string
+): T[] => {
+  const ordinales = buscarOrdinales(empleados, indice, consulta, gerencia);
+  return ordinales ? ordinales.map((ordinal) => empleados[ordinal]) : empleados;
+};
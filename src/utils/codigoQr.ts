@@ -0,0 +1,531 @@
+// Códigos QR generados en el navegador (modo VITE_QR_LOCAL=1)
+//
+// En lugar de descargar qr_codes/<NOMBRE>.png por empleado, la matriz del QR
+// se calcula aquí y se dibuja en un canvas. El contenido es el mismo que el
+// de generar_qrs_imagenes.py (`<base_url>?id=<id>`) y la codificación repite
+// la de python-qrcode con sus parámetros (ERROR_CORRECT_H, versión mínima que
+// cabe, división en segmentos de 20+ caracteres, misma elección de máscara):
+// con box_size 10 y border 4 los píxeles son idénticos a los del PNG impreso.
+//
+// Los QR firmados (&t=) solo se pueden repetir si se conoce el token, como en
+// la credencial abierta desde ese mismo QR.
+
+export const QR_LOCAL = import.meta.env.VITE_QR_LOCAL === '1';
+
+// Base de las URL de los QR (la de generar_qrs_imagenes.py, sin / final)
+const BASE_URL_QR: string = (
+  import.meta.env.VITE_QR_BASE_URL ?? `${window.location.origin}${import.meta.env.BASE_URL}`
+).replace(/\/+$/, '');
+
+// Parámetros de generar_qrs_imagenes.py
+export const TAMANO_MODULO = 10;
+export const BORDE = 4;
+
+// Nivel H en python-qrcode (L=1, M=0, Q=3, H=2)
+const NIVEL_H = 2;
+
+const MODO_NUMERICO = 1;
+const MODO_ALFANUMERICO = 2;
+const MODO_BYTES = 4;
+
+const ALFANUMERICO = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:';
+const SEGMENTO_MINIMO = 20;
+
+// Bloques Reed-Solomon del nivel H por versión: (cantidad, total, datos)...
+const BLOQUES_H: number[][] = [
+  [1, 26, 9], [1, 44, 16], [2, 35, 13], [4, 25, 9],
+  [2, 33, 11, 2, 34, 12], [4, 43, 15], [4, 39, 13, 1, 40, 14], [4, 40, 14, 2, 41, 15],
+  [4, 36, 12, 4, 37, 13], [6, 43, 15, 2, 44, 16], [3, 36, 12, 8, 37, 13], [7, 42, 14, 4, 43, 15],
+  [12, 33, 11, 4, 34, 12], [11, 36, 12, 5, 37, 13], [11, 36, 12, 7, 37, 13], [3, 45, 15, 13, 46, 16],
+  [2, 42, 14, 17, 43, 15], [2, 42, 14, 19, 43, 15], [9, 39, 13, 16, 40, 14], [15, 43, 15, 10, 44, 16],
+  [19, 46, 16, 6, 47, 17], [34, 37, 13], [16, 45, 15, 14, 46, 16], [30, 46, 16, 2, 47, 17],
+  [22, 45, 15, 13, 46, 16], [33, 46, 16, 4, 47, 17], [12, 45, 15, 28, 46, 16], [11, 45, 15, 31, 46, 16],
+  [19, 45, 15, 26, 46, 16], [23, 45, 15, 25, 46, 16], [23, 45, 15, 28, 46, 16], [19, 45, 15, 35, 46, 16],
+  [11, 45, 15, 46, 46, 16], [59, 46, 16, 1, 47, 17], [22, 45, 15, 41, 46, 16], [2, 45, 15, 64, 46, 16],
+  [24, 45, 15, 46, 46, 16], [42, 45, 15, 32, 46, 16], [10, 45, 15, 67, 46, 16], [20, 45, 15, 61, 46, 16],
+];
+
+// Centros de los patrones de alineación por versión
+const ALINEACION: number[][] = [
+  [], [6, 18], [6, 22], [6, 26],
+  [6, 30], [6, 34], [6, 22, 38], [6, 24, 42],
+  [6, 26, 46], [6, 28, 50], [6, 30, 54], [6, 32, 58],
+  [6, 34, 62], [6, 26, 46, 66], [6, 26, 48, 70], [6, 26, 50, 74],
+  [6, 30, 54, 78], [6, 30, 56, 82], [6, 30, 58, 86], [6, 34, 62, 90],
+  [6, 28, 50, 72, 94], [6, 26, 50, 74, 98], [6, 30, 54, 78, 102], [6, 28, 54, 80, 106],
+  [6, 32, 58, 84, 110], [6, 30, 58, 86, 114], [6, 34, 62, 90, 118], [6, 26, 50, 74, 98, 122],
+  [6, 30, 54, 78, 102, 126], [6, 26, 52, 78, 104, 130], [6, 30, 56, 82, 108, 134], [6, 34, 60, 86, 112, 138],
+  [6, 30, 58, 86, 114, 142], [6, 34, 62, 90, 118, 146], [6, 30, 54, 78, 102, 126, 150], [6, 24, 50, 76, 102, 128, 154],
+  [6, 28, 54, 80, 106, 132, 158], [6, 32, 58, 84, 110, 136, 162], [6, 26, 54, 82, 110, 138, 166], [6, 30, 58, 86, 114, 142, 170],
+];
+
+interface Bloque {
+  total: number;
+  datos: number;
+}
+
+interface Segmento {
+  modo: number;
+  bytes: Uint8Array;
+}
+
+const bloquesDe = (version: number): Bloque[] => {
+  const fila = BLOQUES_H[version - 1];
+  const bloques: Bloque[] = [];
+  for (let i = 0; i < fila.length; i += 3) {
+    for (let j = 0; j < fila[i]; j++) {
+      bloques.push({ total: fila[i + 1], datos: fila[i + 2] });
+    }
+  }
+  return bloques;
+};
+
+// Bits de datos disponibles por versión (índice 0 sin usar)
+const LIMITE_BITS = [0, ...BLOQUES_H.map((_, i) => 8 * bloquesDe(i + 1).reduce((s, b) => s + b.datos, 0))];
+
+// Bits del campo de longitud según modo y versión
+const bitsLongitud = (modo: number, version: number): number => {
+  const grupo = version < 10 ? 0 : version < 27 ? 1 : 2;
+  if (modo === MODO_NUMERICO) return [10, 12, 14][grupo];
+  if (modo === MODO_ALFANUMERICO) return [9, 11, 13][grupo];
+  return [8, 16, 16][grupo];
+};
+
+// --- Aritmética en GF(256) (polinomio 0x11d) ---
+
+const EXP = new Uint8Array(512);
+const LOG = new Uint8Array(256);
+for (let i = 0, x = 1; i < 255; i++) {
+  EXP[i] = x;
+  LOG[x] = i;
+  x <<= 1;
+  if (x & 0x100) x ^= 0x11d;
+}
+for (let i = 255; i < 512; i++) {
+  EXP[i] = EXP[i - 255];
+}
+
+const multiplicar = (a: number, b: number): number => (a && b ? EXP[LOG[a] + LOG[b]] : 0);
+
+const generadores = new Map<number, Uint8Array>();
+
+// Polinomio generador de grado n: (x + α^0)(x + α^1)...(x + α^(n-1))
+const generador = (n: number): Uint8Array => {
+  let g = generadores.get(n);
+  if (!g) {
+    g = new Uint8Array(n + 1);
+    g[0] = 1;
+    for (let i = 0; i < n; i++) {
+      for (let j = i + 1; j > 0; j--) {
+        g[j] = g[j] ^ multiplicar(g[j - 1], EXP[i]);
+      }
+    }
+    generadores.set(n, g);
+  }
+  return g;
+};
+
+// Residuo de datos·x^n entre el generador (bytes de corrección)
+const correccion = (datos: Uint8Array, n: number): Uint8Array => {
+  const g = generador(n);
+  const residuo = new Uint8Array(n);
+  for (const byte of datos) {
+    const factor = byte ^ residuo[0];
+    residuo.copyWithin(0, 1);
+    residuo[n - 1] = 0;
+    for (let j = 0; j < n; j++) {
+      residuo[j] ^= multiplicar(g[j + 1], factor);
+    }
+  }
+  return residuo;
+};
+
+// --- Datos ---
+
+class BufferBits {
+  bytes: number[] = [];
+  longitud = 0;
+
+  agregar(valor: number, bits: number) {
+    for (let i = bits - 1; i >= 0; i--) {
+      this.agregarBit(((valor >>> i) & 1) === 1);
+    }
+  }
+
+  agregarBit(bit: boolean) {
+    const indice = this.longitud >> 3;
+    if (this.bytes.length <= indice) this.bytes.push(0);
+    if (bit) this.bytes[indice] |= 0x80 >> (this.longitud & 7);
+    this.longitud++;
+  }
+}
+
+const esDigito = (byte: number) => byte >= 0x30 && byte <= 0x39;
+const esAlfanumerico = (byte: number) => byte < 0x80 && ALFANUMERICO.includes(String.fromCharCode(byte));
+
+// Tramos (coincide, bytes) como util._optimal_split de python-qrcode: con
+// `completo` solo coincide el tramo entero; si no, corridas de SEGMENTO_MINIMO+
+const dividir = (
+  bytes: Uint8Array,
+  coincide: (byte: number) => boolean,
+  completo: boolean,
+): [boolean, Uint8Array][] => {
+  if (completo) {
+    return bytes.length ? [[bytes.every(coincide), bytes]] : [];
+  }
+  const tramos: [boolean, Uint8Array][] = [];
+  let inicio = 0;
+  let i = 0;
+  while (i < bytes.length) {
+    if (!coincide(bytes[i])) {
+      i++;
+      continue;
+    }
+    let fin = i;
+    while (fin < bytes.length && coincide(bytes[fin])) fin++;
+    if (fin - i >= SEGMENTO_MINIMO) {
+      if (i > inicio) tramos.push([false, bytes.subarray(inicio, i)]);
+      tramos.push([true, bytes.subarray(i, fin)]);
+      inicio = fin;
+    }
+    i = fin;
+  }
+  if (inicio < bytes.length) tramos.push([false, bytes.subarray(inicio)]);
+  return tramos;
+};
+
+// Segmentos como QRCode.add_data(texto) (optimize=20)
+const segmentar = (texto: string): Segmento[] => {
+  const bytes = new TextEncoder().encode(texto);
+  const completo = bytes.length <= SEGMENTO_MINIMO;
+  const segmentos: Segmento[] = [];
+  for (const [numerico, tramo] of dividir(bytes, esDigito, completo)) {
+    if (numerico) {
+      segmentos.push({ modo: MODO_NUMERICO, bytes: tramo });
+      continue;
+    }
+    for (const [alfanumerico, parte] of dividir(tramo, esAlfanumerico, completo)) {
+      segmentos.push({ modo: alfanumerico ? MODO_ALFANUMERICO : MODO_BYTES, bytes: parte });
+    }
+  }
+  return segmentos;
+};
+
+const escribirSegmentos = (segmentos: Segmento[], version: number): BufferBits => {
+  const buffer = new BufferBits();
+  for (const { modo, bytes } of segmentos) {
+    buffer.agregar(modo, 4);
+    buffer.agregar(bytes.length, bitsLongitud(modo, version));
+    if (modo === MODO_NUMERICO) {
+      for (let i = 0; i < bytes.length; i += 3) {
+        const grupo = bytes.subarray(i, i + 3);
+        buffer.agregar(Number(String.fromCharCode(...grupo)), [0, 4, 7, 10][grupo.length]);
+      }
+    } else if (modo === MODO_ALFANUMERICO) {
+      for (let i = 0; i < bytes.length; i += 2) {
+        const a = ALFANUMERICO.indexOf(String.fromCharCode(bytes[i]));
+        if (i + 1 < bytes.length) {
+          buffer.agregar(a * 45 + ALFANUMERICO.indexOf(String.fromCharCode(bytes[i + 1])), 11);
+        } else {
+          buffer.agregar(a, 6);
+        }
+      }
+    } else {
+      for (const byte of bytes) buffer.agregar(byte, 8);
+    }
+  }
+  return buffer;
+};
+
+// Versión mínima en la que caben los datos (QRCode.best_fit)
+const mejorVersion = (segmentos: Segmento[], desde = 1): number => {
+  const necesarios = escribirSegmentos(segmentos, desde).longitud;
+  let version = desde;
+  while (version <= 40 && LIMITE_BITS[version] < necesarios) version++;
+  if (version > 40) {
+    throw new Error('Los datos no caben en un código QR');
+  }
+  const grupo = (v: number) => (v < 10 ? 0 : v < 27 ? 1 : 2);
+  return grupo(version) === grupo(desde) ? version : mejorVersion(segmentos, version);
+};
+
+// Codewords finales (datos y corrección intercalados por bloque)
+const crearDatos = (segmentos: Segmento[], version: number): number[] => {
+  const buffer = escribirSegmentos(segmentos, version);
+  const limite = LIMITE_BITS[version];
+
+  for (let i = 0; i < Math.min(limite - buffer.longitud, 4); i++) buffer.agregarBit(false);
+  while (buffer.longitud % 8) buffer.agregarBit(false);
+  for (let i = 0; buffer.longitud < limite; i++) buffer.agregar(i % 2 === 0 ? 0xec : 0x11, 8);
+
+  const datos: Uint8Array[] = [];
+  const ecc: Uint8Array[] = [];
+  let posicion = 0;
+  for (const bloque of bloquesDe(version)) {
+    const parte = Uint8Array.from(buffer.bytes.slice(posicion, posicion + bloque.datos));
+    posicion += bloque.datos;
+    datos.push(parte);
+    ecc.push(correccion(parte, bloque.total - bloque.datos));
+  }
+
+  const resultado: number[] = [];
+  for (const grupo of [datos, ecc]) {
+    const maximo = Math.max(...grupo.map((b) => b.length));
+    for (let i = 0; i < maximo; i++) {
+      for (const b of grupo) {
+        if (i < b.length) resultado.push(b[i]);
+      }
+    }
+  }
+  return resultado;
+};
+
+// --- Matriz ---
+
+const BCH = (datos: number, generadorBch: number, grado: number): number => {
+  let d = datos << grado;
+  const digitos = (x: number) => 32 - Math.clz32(x);
+  while (digitos(d) - digitos(generadorBch) >= 0) {
+    d ^= generadorBch << (digitos(d) - digitos(generadorBch));
+  }
+  return (datos << grado) | d;
+};
+
+const G15 = 0b10100110111;
+const G15_MASCARA = 0b101010000010010;
+const G18 = 0b1111100100101;
+
+const MASCARAS: ((i: number, j: number) => boolean)[] = [
+  (i, j) => (i + j) % 2 === 0,
+  (i) => i % 2 === 0,
+  (_, j) => j % 3 === 0,
+  (i, j) => (i + j) % 3 === 0,
+  (i, j) => (Math.floor(i / 2) + Math.floor(j / 3)) % 2 === 0,
+  (i, j) => ((i * j) % 2) + ((i * j) % 3) === 0,
+  (i, j) => (((i * j) % 2) + ((i * j) % 3)) % 2 === 0,
+  (i, j) => (((i * j) % 3) + ((i + j) % 2)) % 2 === 0,
+];
+
+// Patrones fijos (localización, alineación y sincronización). La matriz es
+// un arreglo plano de n*n: 1 oscuro, 0 claro, VACIO sin asignar
+const VACIO = 2;
+
+const matrizBase = (version: number): Uint8Array => {
+  const n = version * 4 + 17;
+  const m = new Uint8Array(n * n).fill(VACIO);
+
+  for (const [fila, col] of [[0, 0], [n - 7, 0], [0, n - 7]]) {
+    for (let r = -1; r < 8; r++) {
+      if (fila + r < 0 || fila + r >= n) continue;
+      for (let c = -1; c < 8; c++) {
+        if (col + c < 0 || col + c >= n) continue;
+        const oscuro =
+          (r >= 0 && r <= 6 && (c === 0 || c === 6)) ||
+          (c >= 0 && c <= 6 && (r === 0 || r === 6)) ||
+          (r >= 2 && r <= 4 && c >= 2 && c <= 4);
+        m[(fila + r) * n + col + c] = oscuro ? 1 : 0;
+      }
+    }
+  }
+
+  const posiciones = ALINEACION[version - 1];
+  for (const fila of posiciones) {
+    for (const col of posiciones) {
+      if (m[fila * n + col] !== VACIO) continue;
+      for (let r = -2; r <= 2; r++) {
+        for (let c = -2; c <= 2; c++) {
+          const oscuro = Math.abs(r) === 2 || Math.abs(c) === 2 || (r === 0 && c === 0);
+          m[(fila + r) * n + col + c] = oscuro ? 1 : 0;
+        }
+      }
+    }
+  }
+
+  for (let i = 8; i < n - 8; i++) {
+    if (m[i * n + 6] === VACIO) m[i * n + 6] = i % 2 === 0 ? 1 : 0;
+    if (m[6 * n + i] === VACIO) m[6 * n + i] = i % 2 === 0 ? 1 : 0;
+  }
+  return m;
+};
+
+// QRCode.makeImpl: con `prueba` la información de formato queda en blanco
+const construir = (base: Uint8Array, version: number, datos: number[], mascara: number, prueba: boolean): Uint8Array => {
+  const n = version * 4 + 17;
+  const m = base.slice();
+  const poner = (fila: number, col: number, oscuro: boolean) => {
+    m[fila * n + col] = oscuro ? 1 : 0;
+  };
+
+  const formato = BCH((NIVEL_H << 3) | mascara, G15, 10) ^ G15_MASCARA;
+  for (let i = 0; i < 15; i++) {
+    const bit = !prueba && ((formato >> i) & 1) === 1;
+    poner(i < 6 ? i : i < 8 ? i + 1 : n - 15 + i, 8, bit);
+    poner(8, i < 8 ? n - i - 1 : i < 9 ? 15 - i : 15 - i - 1, bit);
+  }
+  poner(n - 8, 8, !prueba);
+
+  if (version >= 7) {
+    const bits = BCH(version, G18, 12);
+    for (let i = 0; i < 18; i++) {
+      const bit = !prueba && ((bits >> i) & 1) === 1;
+      poner(Math.floor(i / 3), (i % 3) + n - 8 - 3, bit);
+      poner((i % 3) + n - 8 - 3, Math.floor(i / 3), bit);
+    }
+  }
+
+  const enMascara = MASCARAS[mascara];
+  let incremento = -1;
+  let fila = n - 1;
+  let bit = 7;
+  let indice = 0;
+  for (let col = n - 1; col > 0; col -= 2) {
+    if (col === 6) col--;
+    for (;;) {
+      for (let c = col; c >= col - 1; c--) {
+        if (m[fila * n + c] !== VACIO) continue;
+        let oscuro = indice < datos.length && ((datos[indice] >> bit) & 1) === 1;
+        if (enMascara(fila, c)) oscuro = !oscuro;
+        m[fila * n + c] = oscuro ? 1 : 0;
+        if (--bit === -1) {
+          indice++;
+          bit = 7;
+        }
+      }
+      fila += incremento;
+      if (fila < 0 || fila >= n) {
+        fila -= incremento;
+        incremento = -incremento;
+        break;
+      }
+    }
+  }
+  return m;
+};
+
+// Penalización de una máscara, igual que util.lost_point de python-qrcode
+// (incluidos sus atajos, que no siguen la norma al pie de la letra)
+const penalizacion = (m: Uint8Array, n: number): number => {
+  let puntos = 0;
+
+  // Filas (paso 1) y columnas (paso n)
+  for (const [paso, salto] of [[1, n], [n, 1]]) {
+    for (let linea = 0; linea < n; linea++) {
+      const inicio = linea * salto;
+      const v = (i: number) => m[inicio + i * paso];
+
+      // Corridas de 5 o más módulos del mismo color
+      let anterior = v(0);
+      let largo = 0;
+      for (let i = 0; i < n; i++) {
+        const actual = v(i);
+        if (actual === anterior) {
+          largo++;
+        } else {
+          if (largo >= 5) puntos += largo - 2;
+          largo = 1;
+          anterior = actual;
+        }
+      }
+      if (largo >= 5) puntos += largo - 2;
+
+      // Patrón 1:1:3:1:1 con 4 módulos claros antes o después
+      for (let i = 0; i < n - 10; i++) {
+        if (
+          !v(i + 1) && v(i + 4) && !v(i + 5) && v(i + 6) && !v(i + 9) &&
+          ((v(i) && v(i + 2) && v(i + 3) && !v(i + 7) && !v(i + 8) && !v(i + 10)) ||
+            (!v(i) && !v(i + 2) && !v(i + 3) && v(i + 7) && v(i + 8) && v(i + 10)))
+        ) {
+          puntos += 40;
+        }
+        if (v(i + 10)) i++;
+      }
+    }
+  }
+
+  // Bloques de 2x2
+  for (let fila = 0; fila < n - 1; fila++) {
+    const esta = fila * n;
+    const siguiente = esta + n;
+    for (let col = 0; col < n - 1; col++) {
+      const derecha = m[esta + col + 1];
+      if (derecha !== m[siguiente + col + 1]) {
+        col++;
+      } else if (derecha === m[esta + col] && derecha === m[siguiente + col]) {
+        puntos += 3;
+      }
+    }
+  }
+
+  // Proporción de módulos oscuros
+  let oscuros = 0;
+  for (const modulo of m) oscuros += modulo;
+  const porcentaje = oscuros / (n * n);
+  return puntos + Math.trunc(Math.abs(porcentaje * 100 - 50) / 5) * 10;
+};
+
+export interface MatrizQr {
+  // Módulos por lado (sin borde)
+  lado: number;
+  // lado * lado módulos por filas: 1 oscuro, 0 claro
+  modulos: Uint8Array;
+}
+
+const cache = new Map<string, MatrizQr>();
+
+// Matriz del QR de un texto, memorizada (la lista vuelve a montar las tarjetas)
+export const matrizQr = (texto: string): MatrizQr => {
+  let matriz = cache.get(texto);
+  if (matriz) return matriz;
+
+  const segmentos = segmentar(texto);
+  const version = mejorVersion(segmentos);
+  const datos = crearDatos(segmentos, version);
+  const base = matrizBase(version);
+  const lado = version * 4 + 17;
+
+  let mejor = 0;
+  let minimo = 0;
+  for (let mascara = 0; mascara < 8; mascara++) {
+    const puntos = penalizacion(construir(base, version, datos, mascara, true), lado);
+    if (mascara === 0 || puntos < minimo) {
+      minimo = puntos;
+      mejor = mascara;
+    }
+  }
+
+  matriz = { lado, modulos: construir(base, version, datos, mejor, false) };
+  cache.set(texto, matriz);
+  return matriz;
+};
+
+// Contenido del QR de un empleado (el mismo que imprime generar_qrs_imagenes.py)
+export const urlQr = (id: string, token?: string | null): string =>
+  token ? `${BASE_URL_QR}?id=${id}&t=${token}` : `${BASE_URL_QR}?id=${id}`;
+
+// Dibuja el QR en un canvas con los píxeles del PNG de Python
+export const dibujarQr = (canvas: HTMLCanvasElement, texto: string): void => {
+  const { lado: modulos, modulos: oscuros } = matrizQr(texto);
+  const lado = (modulos + BORDE * 2) * TAMANO_MODULO;
+  canvas.width = lado;
+  canvas.height = lado;
+  const ctx = canvas.getContext('2d');
+  if (!ctx) return;
+  ctx.fillStyle = '#ffffff';
+  ctx.fillRect(0, 0, lado, lado);
+  ctx.fillStyle = '#000000';
+  for (let r = 0; r < modulos; r++) {
+    for (let c = 0; c < modulos; c++) {
+      if (oscuros[r * modulos + c]) {
+        ctx.fillRect((c + BORDE) * TAMANO_MODULO, (r + BORDE) * TAMANO_MODULO, TAMANO_MODULO, TAMANO_MODULO);
+      }
+    }
+  }
+};
+
+// PNG del QR (para "Descargar QR" sin pedirlo al servidor)
+export const pngQr = (texto: string): Promise<Blob> =>
+  new Promise((resolve, reject) => {
+    const canvas = document.createElement('canvas');
+    dibujarQr(canvas, texto);
+    canvas.toBlob((blob) => (blob ? resolve(blob) : reject(new Error('No se pudo generar el PNG'))), 'image/png');
+  });
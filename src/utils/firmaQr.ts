@@ -0,0 +1,128 @@
+// Verificación sin conexión de los QR firmados (firma_qr.py)
+//
+// En modo firmado el QR lleva `?id=<uuid>&t=<token>`. El token contiene el
+// id, el hash del nombre, el puesto y la vigencia, firmados con Ed25519;
+// se verifica con la clave pública (firma_qr.json, que el service worker
+// guarda) sin descargar ni recorrer el directorio.
+//
+// Token (base64url) = datos + firma (64 bytes). Datos: versión (1 byte),
+// UUID (16), sha256 del nombre normalizado (8), válido desde y hasta
+// (2 + 2, días desde 1970-01-01, big-endian) y el puesto (UTF-8).
+
+import { foldText } from './busqueda';
+
+const VERSION_TOKEN = 1;
+const CABECERA = 29;
+const LONGITUD_FIRMA = 64;
+const MS_DIA = 86_400_000;
+
+export type MotivoFirma = 'formato' | 'firma' | 'no_vigente' | 'vencido' | 'sin_soporte';
+
+export interface ResultadoFirma {
+  valido: boolean;
+  motivo: MotivoFirma | null;
+  id?: string;
+  hashNombre?: string;
+  puesto?: string;
+  desde?: Date;
+  hasta?: Date;
+}
+
+const desdeBase64Url = (texto: string): Uint8Array<ArrayBuffer> => {
+  const binario = atob(texto.replace(/-/g, '+').replace(/_/g, '/'));
+  const bytes = new Uint8Array(binario.length);
+  for (let i = 0; i < binario.length; i++) {
+    bytes[i] = binario.charCodeAt(i);
+  }
+  return bytes;
+};
+
+const hex = (bytes: Uint8Array): string =>
+  Array.from(bytes, (byte) => byte.toString(16).padStart(2, '0')).join('');
+
+const formatearUuid = (bytes: Uint8Array): string => {
+  const h = hex(bytes);
+  return `${h.slice(0, 8)}-${h.slice(8, 12)}-${h.slice(12, 16)}-${h.slice(16, 20)}-${h.slice(20)}`;
+};
+
+let clavePromesa: Promise<CryptoKey | null> | null = null;
+
+// Clave pública publicada por firma_qr.py; null si no hay clave o el
+// navegador no soporta Ed25519 en WebCrypto
+export const cargarClavePublica = (): Promise<CryptoKey | null> => {
+  clavePromesa ??= (async () => {
+    try {
+      const response = await fetch(`${import.meta.env.BASE_URL}firma_qr.json`);
+      if (!response.ok) return null;
+      const { clave } = await response.json();
+      return await crypto.subtle.importKey('raw', desdeBase64Url(clave), { name: 'Ed25519' }, false, ['verify']);
+    } catch {
+      return null;
+    }
+  })();
+  return clavePromesa;
+};
+
+// Primeros 8 bytes del sha256 del nombre normalizado (hash_nombre en Python)
+export const hashNombre = async (nombre: string): Promise<string> => {
+  const texto = foldText(nombre).trim().split(/\s+/).join(' ');
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(texto));
+  return hex(new Uint8Array(digest, 0, 8));
+};
+
+// Verificar un token: una decodificación y una firma, sin red
+export const verificarToken = async (
+  token: string,
+  clave: CryptoKey | null,
+  hoy: Date = new Date()
+): Promise<ResultadoFirma> => {
+  if (!clave) return { valido: false, motivo: 'sin_soporte' };
+
+  let crudo: Uint8Array<ArrayBuffer>;
+  try {
+    crudo = desdeBase64Url(token);
+  } catch {
+    return { valido: false, motivo: 'formato' };
+  }
+  if (crudo.length < CABECERA + LONGITUD_FIRMA || crudo[0] !== VERSION_TOKEN) {
+    return { valido: false, motivo: 'formato' };
+  }
+
+  const datos = crudo.subarray(0, crudo.length - LONGITUD_FIRMA);
+  const firma = crudo.subarray(crudo.length - LONGITUD_FIRMA);
+  try {
+    if (!(await crypto.subtle.verify({ name: 'Ed25519' }, clave, firma, datos))) {
+      return { valido: false, motivo: 'firma' };
+    }
+  } catch {
+    return { valido: false, motivo: 'sin_soporte' };
+  }
+
+  const vista = new DataView(datos.buffer, datos.byteOffset, datos.byteLength);
+  const desde = new Date(vista.getUint16(25) * MS_DIA);
+  const hasta = new Date(vista.getUint16(27) * MS_DIA);
+  const resultado: ResultadoFirma = {
+    valido: true,
+    motivo: null,
+    id: formatearUuid(datos.subarray(1, 17)),
+    hashNombre: hex(datos.subarray(17, 25)),
+    puesto: new TextDecoder().decode(datos.subarray(CABECERA)),
+    desde,
+    hasta,
+  };
+
+  // Vigencia por día calendario local, inclusive (desde/hasta son medianoche UTC)
+  const dia = Date.UTC(hoy.getFullYear(), hoy.getMonth(), hoy.getDate());
+  if (dia < desde.getTime()) {
+    return { ...resultado, valido: false, motivo: 'no_vigente' };
+  }
+  if (dia > hasta.getTime()) {
+    return { ...resultado, valido: false, motivo: 'vencido' };
+  }
+  return resultado;
+};
+
+// True si el nombre corresponde al hash del token verificado
+export const coincideNombre = async (resultado: ResultadoFirma, nombre: string): Promise<boolean> => {
+  return resultado.hashNombre === (await hashNombre(nombre));
+};
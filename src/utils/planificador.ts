@@ -0,0 +1,79 @@
+// Planificador compartido de tareas periódicas
+//
+// Un solo temporizador, alineado al cambio de segundo, ejecuta todas las
+// tareas suscritas (reloj, verificación de integridad, detector de
+// DevTools). Se detiene mientras la página está oculta (pantalla apagada,
+// otra pestaña) y al volver ejecuta de inmediato todas las tareas.
+
+interface Tarea {
+  periodo: number;
+  ultima: number;
+  ejecutar: () => void;
+}
+
+const tareas = new Set<Tarea>();
+let temporizador: ReturnType<typeof setTimeout> | null = null;
+let escuchandoVisibilidad = false;
+
+const detener = () => {
+  if (temporizador !== null) {
+    clearTimeout(temporizador);
+    temporizador = null;
+  }
+};
+
+// Siguiente ejecución al inicio del próximo segundo
+const programar = () => {
+  detener();
+  if (tareas.size > 0 && !document.hidden) {
+    temporizador = setTimeout(tick, 1000 - (Date.now() % 1000));
+  }
+};
+
+const ejecutarTareas = (todas: boolean) => {
+  const ahora = Date.now();
+  for (const tarea of tareas) {
+    // Margen de 50 ms por la imprecisión de setTimeout
+    if (todas || ahora - tarea.ultima >= tarea.periodo - 50) {
+      tarea.ultima = ahora;
+      tarea.ejecutar();
+    }
+  }
+};
+
+function tick() {
+  temporizador = null;
+  ejecutarTareas(false);
+  programar();
+}
+
+const alCambiarVisibilidad = () => {
+  if (document.hidden) {
+    detener();
+  } else {
+    ejecutarTareas(true);
+    programar();
+  }
+};
+
+// Ejecutar `ejecutar` cada `periodo` ms (múltiplo de 1000); devuelve la
+// función para cancelar la suscripción
+export const suscribir = (periodo: number, ejecutar: () => void): (() => void) => {
+  if (!escuchandoVisibilidad) {
+    document.addEventListener('visibilitychange', alCambiarVisibilidad);
+    escuchandoVisibilidad = true;
+  }
+
+  const tarea: Tarea = { periodo, ultima: Date.now(), ejecutar };
+  tareas.add(tarea);
+  if (temporizador === null) {
+    programar();
+  }
+
+  return () => {
+    tareas.delete(tarea);
+    if (tareas.size === 0) {
+      detener();
+    }
+  };
+};
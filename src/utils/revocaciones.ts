@@ -0,0 +1,63 @@
+// Filtro de credenciales revocadas (revocaciones.py)
+//
+// revocados.bin es un filtro de Bloom con los ids eliminados del Excel
+// maestro: unos pocos KB que permiten rechazar un QR revocado sin el
+// directorio completo (por ejemplo sin conexión). No tiene falsos
+// negativos; con una probabilidad baja marca como revocado un id que no lo
+// está, así que cuando el directorio está disponible manda el directorio.
+//
+// Formato: "RVK1", k (1 byte), m y n (uint32 big-endian), bits. Posición i
+// de un id: (h1 + i * h2) mod m, con h1/h2 de sha256(id en minúsculas).
+
+const MAGIA = 'RVK1';
+const CABECERA = 13;
+
+interface FiltroRevocados {
+  k: number;
+  m: number;
+  bits: Uint8Array;
+}
+
+let filtroPromesa: Promise<FiltroRevocados | null> | null = null;
+
+// Filtro publicado; null si no existe (nadie revocado) o no es válido
+export const cargarRevocaciones = (): Promise<FiltroRevocados | null> => {
+  filtroPromesa ??= (async () => {
+    try {
+      const response = await fetch(`${import.meta.env.BASE_URL}revocados.bin`);
+      if (!response.ok) return null;
+      const datos = new Uint8Array(await response.arrayBuffer());
+      const vista = new DataView(datos.buffer);
+      const magia = String.fromCharCode(...datos.subarray(0, 4));
+      if (datos.length < CABECERA || magia !== MAGIA) return null;
+      const k = vista.getUint8(4);
+      const m = vista.getUint32(5);
+      const bits = datos.subarray(CABECERA);
+      return k > 0 && bits.length * 8 >= m ? { k, m, bits } : null;
+    } catch {
+      return null;
+    }
+  })();
+  return filtroPromesa;
+};
+
+// true si el id está (probablemente) revocado; false si no lo está o no
+// hay filtro
+export const estaRevocado = async (id: string): Promise<boolean> => {
+  const filtro = await cargarRevocaciones();
+  if (!filtro) return false;
+
+  const texto = new TextEncoder().encode(id.trim().toLowerCase());
+  const digest = new DataView(await crypto.subtle.digest('SHA-256', texto));
+  const h1 = digest.getUint32(0);
+  const h2 = (digest.getUint32(4) | 1) >>> 0;
+
+  for (let i = 0; i < filtro.k; i++) {
+    // h1 + i * h2 < 2^53: exacto con number
+    const posicion = (h1 + i * h2) % filtro.m;
+    if ((filtro.bits[posicion >>> 3] & (1 << (posicion & 7))) === 0) {
+      return false;
+    }
+  }
+  return true;
+};
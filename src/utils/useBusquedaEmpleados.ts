@@ -0,0 +1,109 @@
+// Búsqueda de la lista de empleados fuera del hilo principal
+//
+// Los empleados se envían una sola vez al Worker como un solo buffer
+// (transferible, sin copia): id, nombre, celular y gerencia separados por
+// '\0'. Cada consulta se envía 100 ms después de la última tecla; el Worker
+// descarta las consultas que quedaron viejas y responde con las posiciones
+// de los empleados encontrados.
+
+import { useEffect, useMemo, useRef, useState } from 'react';
+import type { Empleado } from '../types/empleado';
+import { getIndicePath } from './activos';
+import { buscarEmpleados, contarGerencias } from './busqueda';
+
+// Espera después de la última tecla antes de buscar (ms)
+const ESPERA_CONSULTA = 100;
+
+export type MensajeBusqueda =
+  | { tipo: 'datos'; datos: Uint8Array; rutaIndice: string }
+  | { tipo: 'buscar'; id: number; consulta: string; gerencia: string };
+
+export interface RespuestaBusqueda {
+  tipo: 'resultado';
+  id: number;
+  // null = todos los empleados
+  ordinales: Uint32Array | null;
+}
+
+// Empleados como un solo buffer UTF-8 (4 campos por empleado)
+const codificarEmpleados = (empleados: Empleado[]): Uint8Array<ArrayBuffer> => {
+  const texto = empleados
+    .map((emp) => `${emp.id}\0${emp.nombre}\0${emp.celular}\0${emp.gerencia}`)
+    .join('\0');
+  return new TextEncoder().encode(texto);
+};
+
+const crearWorker = (): Worker | null => {
+  if (typeof Worker === 'undefined') return null;
+  try {
+    return new Worker(new URL('../workers/busqueda.worker.ts', import.meta.url), { type: 'module' });
+  } catch {
+    return null;
+  }
+};
+
+export const useBusquedaEmpleados = (empleados: Empleado[], consulta: string, gerencia: string) => {
+  const workerRef = useRef<Worker | null>(null);
+  const ultimaRef = useRef(0);
+  const [sinWorker, setSinWorker] = useState(false);
+  const [resultado, setResultado] = useState<{ empleados: Empleado[]; ordinales: Uint32Array | null } | null>(null);
+
+  const sinFiltro = consulta.trim() === '' && gerencia === 'todas';
+
+  // Un Worker por lista de empleados
+  useEffect(() => {
+    const worker = crearWorker();
+    workerRef.current = worker;
+    if (!worker) {
+      setSinWorker(true);
+      return;
+    }
+
+    worker.onmessage = (evento: MessageEvent<RespuestaBusqueda>) => {
+      // Ignorar respuestas de consultas anteriores
+      if (evento.data.id === ultimaRef.current) {
+        setResultado({ empleados, ordinales: evento.data.ordinales });
+      }
+    };
+    worker.onerror = () => {
+      worker.terminate();
+      workerRef.current = null;
+      setSinWorker(true);
+    };
+
+    const datos = codificarEmpleados(empleados);
+    const mensaje: MensajeBusqueda = { tipo: 'datos', datos, rutaIndice: getIndicePath() };
+    worker.postMessage(mensaje, [datos.buffer]);
+
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+    };
+  }, [empleados]);
+
+  // Enviar la consulta cuando se deja de escribir
+  useEffect(() => {
+    const worker = workerRef.current;
+    if (sinFiltro || !worker) return;
+
+    const temporizador = setTimeout(() => {
+      const mensaje: MensajeBusqueda = { tipo: 'buscar', id: ++ultimaRef.current, consulta, gerencia };
+      worker.postMessage(mensaje);
+    }, ESPERA_CONSULTA);
+    return () => clearTimeout(temporizador);
+  }, [empleados, consulta, gerencia, sinFiltro]);
+
+  // Gerencias con número de empleados
+  const gerencias = useMemo(() => contarGerencias(empleados), [empleados]);
+
+  const empleadosFiltrados = useMemo(() => {
+    if (sinFiltro) return empleados;
+    // Sin Workers: buscar en el hilo principal (recorre la lista)
+    if (sinWorker) return buscarEmpleados(empleados, null, consulta, gerencia);
+    // Mientras llega la respuesta se muestra el resultado anterior
+    if (!resultado || resultado.empleados !== empleados || !resultado.ordinales) return empleados;
+    return Array.from(resultado.ordinales, (ordinal) => empleados[ordinal]);
+  }, [empleados, consulta, gerencia, sinFiltro, sinWorker, resultado]);
+
+  return { empleadosFiltrados, gerencias };
+};
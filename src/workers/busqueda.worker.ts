@@ -0,0 +1,57 @@
+// Worker de búsqueda de la lista de empleados (ver utils/useBusquedaEmpleados.ts)
+
+import { buscarOrdinales, cargarIndice } from '../utils/busqueda';
+import type { EmpleadoBusqueda, IndiceBusqueda } from '../utils/busqueda';
+import type { MensajeBusqueda, RespuestaBusqueda } from '../utils/useBusquedaEmpleados';
+
+const ambito = self as unknown as Worker;
+
+let datos: { empleados: EmpleadoBusqueda[]; indice: IndiceBusqueda | null } | null = null;
+
+// Solo se atiende la consulta más reciente; las que llegan mientras se
+// resuelve otra reemplazan a las anteriores
+let pendiente: Extract<MensajeBusqueda, { tipo: 'buscar' }> | null = null;
+let programada = false;
+
+const procesar = () => {
+  programada = false;
+  if (!datos || !pendiente) return;
+
+  const { id, consulta, gerencia } = pendiente;
+  pendiente = null;
+
+  const lista = buscarOrdinales(datos.empleados, datos.indice, consulta, gerencia);
+  const ordinales = lista ? Uint32Array.from(lista) : null;
+  const respuesta: RespuestaBusqueda = { tipo: 'resultado', id, ordinales };
+  ambito.postMessage(respuesta, ordinales ? [ordinales.buffer] : []);
+};
+
+const programar = () => {
+  if (!programada) {
+    programada = true;
+    setTimeout(procesar, 0);
+  }
+};
+
+ambito.addEventListener('message', async (evento: MessageEvent<MensajeBusqueda>) => {
+  const mensaje = evento.data;
+
+  if (mensaje.tipo === 'buscar') {
+    pendiente = mensaje;
+    programar();
+    return;
+  }
+
+  // Decodificar los empleados (4 campos por empleado)
+  const campos = mensaje.datos.length ? new TextDecoder().decode(mensaje.datos).split('\0') : [];
+  const empleados: EmpleadoBusqueda[] = [];
+  for (let i = 0; i + 3 < campos.length; i += 4) {
+    empleados.push({ id: campos[i], nombre: campos[i + 1], celular: campos[i + 2], gerencia: campos[i + 3] });
+  }
+
+  // Mientras carga el índice se busca recorriendo la lista
+  const nuevos: { empleados: EmpleadoBusqueda[]; indice: IndiceBusqueda | null } = { empleados, indice: null };
+  datos = nuevos;
+  programar();
+  nuevos.indice = await cargarIndice(empleados, mensaje.rutaIndice);
+});
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Verificador masivo de credenciales para el registro de asistencia.
+The Money Center - Directorio de Empleados
+
+En eventos se fotografían o escanean cientos de credenciales. Este script
+lee las fotos (una carpeta, una lista de archivos o rutas que llegan por
+la entrada estándar mientras la cámara las guarda), decodifica los QR en
+paralelo y resuelve cada id contra el directorio cargado en memoria:
+
+1. Carga empleados.json (o NDJSON) en un diccionario id → empleado
+2. Decodifica cada imagen en un proceso aparte (ProcessPoolExecutor),
+   probando en orden: escala de grises, imagen reducida y umbral (Otsu);
+   se detiene en el primer paso que encuentra algún QR
+3. Una foto puede tener varias credenciales: se registran todas
+4. Escribe asistencia.csv: archivo, id, nombre, puesto, gerencia, estado
+   (presente, duplicado, desconocido, revocado, sin_qr) y paso que decodificó
+5. Reporta el rendimiento en imágenes por segundo
+
+Los ids que no están en el directorio se buscan en revocados.bin (si existe
+junto al JSON, ver revocaciones.py) para distinguir una credencial dada de
+baja de un QR desconocido.
+
+Requiere pyzbar (pip install pyzbar) y la biblioteca zbar del sistema
+(apt install libzbar0 / brew install zbar).
+
+Con --silencioso / --log controla el reporte de progreso (ver progreso.py).
+"""
+
+import csv
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from lectores import iterar_empleados
+from progreso import Progreso, formatear_duracion, progreso_desde_argv
+from revocaciones import cargar_filtro, esta_revocado, ruta_filtro
+
+
+EXTENSIONES = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tif', '.tiff'}
+
+# Lado mayor de la imagen reducida (las fotos de cámara son de 12 MP o más)
+LADO_REDUCIDO = 1200
+
+_UUID = re.compile(r'[?&]id=([0-9A-Fa-f-]{36})')
+
+
+def _decodificador():
+    """Función decode de pyzbar, o None si no está instalado (dependencia opcional)."""
+    try:
+        from pyzbar.pyzbar import decode
+    except (ImportError, OSError):
+        return None
+    return decode
+
+
+def _umbral_otsu(gris):
+    """Imagen en blanco y negro con el umbral de Otsu (maximiza la varianza entre clases)."""
+    histograma = gris.histogram()
+    total = sum(histograma)
+    suma_total = sum(i * n for i, n in enumerate(histograma))
+    suma_fondo = peso_fondo = 0
+    mejor, umbral = -1.0, 128
+    for i, n in enumerate(histograma):
+        peso_fondo += n
+        if peso_fondo == 0:
+            continue
+        peso_frente = total - peso_fondo
+        if peso_frente == 0:
+            break
+        suma_fondo += i * n
+        media_fondo = suma_fondo / peso_fondo
+        media_frente = (suma_total - suma_fondo) / peso_frente
+        varianza = peso_fondo * peso_frente * (media_fondo - media_frente) ** 2
+        if varianza > mejor:
+            mejor, umbral = varianza, i
+    return gris.point(lambda p: 255 if p > umbral else 0)
+
+
+def _pasos(imagen):
+    """Variantes de la imagen, de la más barata a la más costosa de preparar."""
+    gris = imagen.convert('L')
+    yield 'gris', gris
+
+    lado = max(gris.size)
+    reducida = gris
+    if lado > LADO_REDUCIDO:
+        reducida = gris.reduce(-(-lado // LADO_REDUCIDO))
+        yield 'reducida', reducida
+
+    yield 'umbral', _umbral_otsu(ImageOps.autocontrast(reducida))
+
+
+def ids_en_texto(texto):
+    """Ids de empleado en el texto de un QR (URL con ?id=...)."""
+    return [m.group(1).lower() for m in _UUID.finditer(texto)]
+
+
+def decodificar_imagen(ruta):
+    """
+    Decodifica los QR de una imagen (se ejecuta en un proceso aparte).
+
+    Args:
+        ruta: Ruta de la imagen
+
+    Returns:
+        Tupla (ruta, lista de ids, paso que decodificó o None, error o None)
+    """
+    decode = _decodificador()
+    try:
+        with Image.open(ruta) as imagen:
+            imagen.draft('L', (LADO_REDUCIDO * 2, LADO_REDUCIDO * 2))  # JPEG: decodificar ya reducido
+            for paso, variante in _pasos(imagen):
+                ids = []
+                for simbolo in decode(variante):
+                    for emp_id in ids_en_texto(simbolo.data.decode('utf-8', 'replace')):
+                        if emp_id not in ids:
+                            ids.append(emp_id)
+                if ids:
+                    return str(ruta), ids, paso, None
+        return str(ruta), [], None, None
+    except Exception as e:
+        return str(ruta), [], None, str(e)
+
+
+def listar_imagenes(entradas):
+    """
+    Rutas de imágenes de las entradas (carpetas, archivos o '-' para leer
+    rutas de la entrada estándar, una por línea, a medida que llegan).
+    """
+    for entrada in entradas:
+        if entrada == '-':
+            for linea in sys.stdin:
+                if linea.strip():
+                    yield Path(linea.strip())
+        elif Path(entrada).is_dir():
+            yield from sorted(p for p in Path(entrada).rglob('*') if p.suffix.lower() in EXTENSIONES)
+        else:
+            yield Path(entrada)
+
+
+def decodificar_en_paralelo(rutas, workers=None):
+    """
+    Decodifica las imágenes en varios procesos y entrega cada resultado en
+    cuanto termina (no en el orden de llegada).
+
+    A diferencia de executor.map, solo mantiene unas cuantas imágenes en
+    vuelo, así funciona con rutas que llegan por la entrada estándar. Las
+    rutas se leen en un hilo aparte: mientras se espera la siguiente foto
+    de la cámara, las que ya se decodificaron se entregan de inmediato.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        cupo = threading.Semaphore(workers * 4)
+        terminados = queue.Queue()
+
+        def enviar():
+            """Envía las rutas al pool; al final pone cuántas se enviaron."""
+            enviadas = 0
+            try:
+                for ruta in rutas:
+                    cupo.acquire()
+                    executor.submit(decodificar_imagen, ruta).add_done_callback(terminados.put)
+                    enviadas += 1
+            except Exception as e:
+                terminados.put(e)
+            finally:
+                terminados.put(enviadas)
+
+        threading.Thread(target=enviar, daemon=True).start()
+
+        entregadas = 0
+        total = None
+        while total is None or entregadas < total:
+            elemento = terminados.get()
+            if isinstance(elemento, Exception):
+                raise elemento
+            if isinstance(elemento, int):
+                total = elemento
+                continue
+            cupo.release()
+            entregadas += 1
+            yield elemento.result()
+
+
+def verificar_asistencia(entradas, json_file='public/empleados.json', csv_file='asistencia.csv', workers=None,
+                         opciones_progreso=None):
+    """
+    Registra la asistencia a partir de fotos de credenciales.
+
+    Args:
+        entradas: Carpetas, imágenes o '-' (rutas por la entrada estándar)
+        json_file: JSON de empleados del que se resuelven los ids
+        csv_file: CSV de asistencia de salida
+        workers: Procesos en paralelo (default: número de CPUs)
+        opciones_progreso: Opciones de Progreso (silencioso, log_file)
+
+    Returns:
+        True si se procesaron las imágenes
+    """
+    opciones_progreso = opciones_progreso or {}
+
+    if _decodificador() is None:
+        print("❌ Error: se requiere pyzbar (pip install pyzbar) y la biblioteca zbar")
+        print("   (apt install libzbar0 / brew install zbar)")
+        return False
+
+    try:
+        print(f"📂 Leyendo empleados: {json_file}")
+        empleados = {emp['id'].lower(): emp for emp in iterar_empleados(json_file)}
+        print(f"   ✓ {len(empleados):,} empleados en memoria")
+
+        filtro = None
+        if ruta_filtro(json_file).exists():
+            filtro = cargar_filtro(ruta_filtro(json_file))
+            print(f"   ✓ Filtro de revocados: {filtro['n']:,} ids")
+
+        print(f"\n🔍 Decodificando imágenes...\n")
+        progreso = Progreso("Verificando credenciales", **opciones_progreso)
+
+        conteo = {'presente': 0, 'duplicado': 0, 'desconocido': 0, 'revocado': 0, 'sin_qr': 0}
+        imagenes = errores = 0
+        presentes = set()
+        inicio = time.perf_counter()
+
+        # Con rutas por la entrada estándar el CSV se consulta durante el
+        # evento: con búfer de línea cada fila se escribe en cuanto se conoce
+        tiempo_real = '-' in entradas
+
+        with open(csv_file, 'w', newline='', encoding='utf-8-sig', buffering=1 if tiempo_real else -1) as f:
+            escritor = csv.writer(f)
+            escritor.writerow(['archivo', 'hora', 'id', 'nombre', 'puesto', 'gerencia', 'estado', 'paso'])
+
+            for ruta, ids, paso, error in decodificar_en_paralelo(listar_imagenes(entradas), workers):
+                imagenes += 1
+                progreso.avanzar()
+                if error:
+                    errores += 1
+                    progreso.error(f"Error leyendo {ruta}: {error}", archivo=ruta)
+                    continue
+
+                try:
+                    hora = datetime.fromtimestamp(Path(ruta).stat().st_mtime).isoformat(timespec='seconds')
+                except OSError:
+                    hora = ''
+
+                if not ids:
+                    conteo['sin_qr'] += 1
+                    escritor.writerow([ruta, hora, '', '', '', '', 'sin_qr', ''])
+                    progreso.aviso(f"Sin QR legible: {ruta}", archivo=ruta)
+                    continue
+
+                for emp_id in ids:
+                    emp = empleados.get(emp_id)
+                    if emp is None:
+                        estado = 'revocado' if filtro and esta_revocado(filtro, emp_id) else 'desconocido'
+                        emp = {}
+                    elif emp_id in presentes:
+                        estado = 'duplicado'
+                    else:
+                        estado = 'presente'
+                        presentes.add(emp_id)
+                    conteo[estado] += 1
+                    escritor.writerow([ruta, hora, emp_id, emp.get('nombre', ''), emp.get('puesto', ''),
+                                       emp.get('gerencia', ''), estado, paso])
+                    progreso.registrar(estado, archivo=ruta, id=emp_id, nombre=emp.get('nombre'))
+
+        duracion = time.perf_counter() - inicio
+        progreso.terminar()
+
+        # Resumen
+        ritmo = imagenes / duracion if duracion > 0 else 0
+        print(f"\n{'='*70}")
+        print(f"✅ Verificación completada!")
+        print(f"{'='*70}")
+        print(f"📊 RESUMEN:")
+        print(f"   • Imágenes:              {imagenes:,} ({ritmo:,.1f} imágenes/s, {formatear_duracion(duracion)})")
+        print(f"   • Presentes:             {conteo['presente']:,} de {len(empleados):,} empleados")
+        if conteo['duplicado']:
+            print(f"   • Duplicados:            {conteo['duplicado']:,}")
+        if conteo['revocado']:
+            print(f"   ⚠️  Revocados:            {conteo['revocado']:,}")
+        if conteo['desconocido']:
+            print(f"   ⚠️  Desconocidos:         {conteo['desconocido']:,}")
+        if conteo['sin_qr']:
+            print(f"   ⚠️  Sin QR legible:       {conteo['sin_qr']:,}")
+        if errores:
+            print(f"   ❌ Errores de lectura:   {errores:,}")
+        print(f"\n📁 Archivo generado: {csv_file}")
+        print(f"{'='*70}\n")
+
+        return True
+
+    except FileNotFoundError:
+        print(f"❌ Error: No se encontró el archivo {json_file}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Función principal del script."""
+    opciones_progreso = progreso_desde_argv(sys.argv, 'verificar_asistencia')
+    args = sys.argv[1:]
+    json_file = 'public/empleados.json'
+    csv_file = 'asistencia.csv'
+    workers = None
+
+    if not args or args[0] in ['-h', '--help']:
+        print("Uso: python verificar_asistencia.py <carpeta|imagen|-> [...] [opciones]")
+        print()
+        print("Parámetros:")
+        print("  carpeta|imagen : Fotos de credenciales (las carpetas se recorren completas)")
+        print("  -              : Lee rutas de imágenes de la entrada estándar, una por línea")
+        print("  --json F       : JSON de empleados (default: public/empleados.json)")
+        print("  --csv F        : CSV de asistencia (default: asistencia.csv)")
+        print("  --workers N    : Procesos en paralelo (default: número de CPUs)")
+        print("  --silencioso   : Sin contador de progreso (solo errores y resumen)")
+        print("  --log          : Registro JSONL por imagen (progreso_verificar_asistencia.jsonl)")
+        print()
+        print("Ejemplos:")
+        print("  python verificar_asistencia.py fotos_evento/")
+        print("  python verificar_asistencia.py fotos_evento/ --csv asistencia_posada.csv --workers 8")
+        print("  inotifywait -m -e close_write --format '%w%f' camara/ | python verificar_asistencia.py -")
+        sys.exit(0 if args else 1)
+
+    for opcion in ['--json', '--csv', '--workers']:
+        if opcion in args:
+            i = args.index(opcion)
+            valor = args[i + 1]
+            del args[i:i + 2]
+            if opcion == '--json':
+                json_file = valor
+            elif opcion == '--csv':
+                csv_file = valor
+            else:
+                workers = int(valor)
+
+    print("=" * 70)
+    print("  REGISTRO DE ASISTENCIA - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+
+    success = verificar_asistencia(args, json_file, csv_file, workers, opciones_progreso)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Script que vigila el Excel maestro y actualiza la web cada vez que se guarda.
+The Money Center - Directorio de Empleados
+
+Este script:
+1. Revisa cada segundo si el Excel maestro cambió (fecha y tamaño)
+2. Espera a que termine de guardarse (sin cambios durante 2 segundos)
+3. Compara los empleados contra public/empleados.json por UUID
+4. Reescribe el JSON (de forma atómica) solo si hubo cambios
+5. Genera solo los QR de empleados nuevos o con nombre/UUID distinto
+6. Agrega los UUID eliminados al filtro de revocados (revocaciones.py)
+
+Reemplaza correr a mano actualizar_empleados.py y generar_qrs_faltantes.py
+después de cada cambio.
+
+Los empleados con UUID vacío en el Excel conservan el UUID que se les
+asignó la primera vez (se buscan por nombre), así su QR no cambia en cada
+guardado. Los QR de empleados eliminados o renombrados no se borran, solo
+se reportan (igual que en diagnosticar_qrs.py).
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from actualizar_empleados import leer_maestro
+from escritores import escribir_atomico, reemplazar_empleados
+from generar_qrs_imagenes import crear_png_qr, sanitize_filename
+from indice_busqueda import actualizar_indice
+from lectores import firma_archivo, iterar_empleados
+from revocaciones import actualizar_revocaciones
+
+
+# Segundos entre revisiones del archivo
+INTERVALO = 1.0
+
+# Segundos sin cambios para considerar que el guardado terminó
+ESPERA = 2.0
+
+
+def log(mensaje):
+    """Imprime un mensaje con la hora."""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {mensaje}", flush=True)
+
+
+def esperar_cambio(ruta, firma_actual, intervalo=INTERVALO, espera=ESPERA):
+    """
+    Espera a que el archivo cambie y deje de cambiar durante `espera` segundos.
+
+    Returns:
+        Nueva firma del archivo
+    """
+    while True:
+        time.sleep(intervalo)
+        firma = firma_archivo(ruta)
+        if firma is None or firma == firma_actual:
+            continue
+
+        # Esperar a que termine el guardado (varios cambios seguidos = uno solo)
+        while True:
+            time.sleep(espera)
+            nueva = firma_archivo(ruta)
+            if nueva == firma:
+                break
+            firma = nueva
+
+        if firma is not None and firma != firma_actual:
+            return firma
+
+
+def asignar_ids_previos(empleados, sin_uuid, anteriores):
+    """
+    A los empleados sin UUID en el Excel les asigna el UUID que ya tenían
+    en el JSON (buscando por nombre), si ningún otro empleado lo usa.
+
+    Returns:
+        Número de UUIDs reutilizados
+    """
+    posiciones = set(sin_uuid)
+    explicitos = {emp['id'] for i, emp in enumerate(empleados) if i not in posiciones}
+
+    ids_por_nombre = {}
+    for emp_id, emp in anteriores.items():
+        if emp_id not in explicitos:
+            ids_por_nombre.setdefault(emp['nombre'], emp_id)
+
+    reutilizados = 0
+    for i in sin_uuid:
+        emp_id = ids_por_nombre.pop(empleados[i]['nombre'], None)
+        if emp_id:
+            empleados[i]['id'] = emp_id
+            reutilizados += 1
+    return reutilizados
+
+
+def sincronizar(excel_file, json_file, qr_dir, base_url, anteriores, completo=False):
+    """
+    Actualiza el JSON y los QR afectados a partir del Excel maestro.
+
+    Args:
+        excel_file: Excel maestro
+        json_file: JSON de la web (ej: public/empleados.json)
+        qr_dir: Carpeta de QR de la web (ej: public/qr_codes)
+        base_url: URL base de los QR
+        anteriores: Diccionario UUID → empleado de la última sincronización
+        completo: Además genera los QR que falten aunque el empleado no cambió
+                  (la primera sincronización)
+
+    Returns:
+        Diccionario UUID → empleado actualizado (o anteriores si no se pudo leer)
+    """
+    empleados, sin_uuid, errores = leer_maestro(excel_file)
+
+    if not empleados and anteriores:
+        log("⚠️  El Excel no tiene empleados; no se actualiza nada")
+        return anteriores
+
+    asignar_ids_previos(empleados, sin_uuid, anteriores)
+    actuales = {emp['id']: emp for emp in empleados}
+
+    nuevos = [emp for emp_id, emp in actuales.items() if emp_id not in anteriores]
+    eliminados = [emp for emp_id, emp in anteriores.items() if emp_id not in actuales]
+    modificados = [emp for emp_id, emp in actuales.items()
+                   if emp_id in anteriores and anteriores[emp_id] != emp]
+
+    # Reescribir el JSON solo si cambió algo (incluido el orden)
+    if nuevos or eliminados or modificados or list(anteriores) != list(actuales):
+        reemplazar_empleados(empleados, json_file)
+        actualizar_indice(empleados, json_file)
+        revocaciones = actualizar_revocaciones(anteriores, empleados, json_file)
+        if revocaciones and revocaciones['nuevos']:
+            log(f"🚫 {revocaciones['ruta']}: {revocaciones['total']} credenciales revocadas "
+                f"(+{revocaciones['nuevos']})")
+        log(f"💾 {json_file}: {len(empleados)} empleados "
+            f"(+{len(nuevos)} nuevos, {len(modificados)} modificados, -{len(eliminados)} eliminados)")
+    elif not completo:
+        log("ℹ️  Sin cambios en los empleados")
+
+    # QR: solo empleados nuevos o renombrados (el QR depende del UUID y el
+    # nombre del archivo, del nombre)
+    qr_path = Path(qr_dir)
+    qr_path.mkdir(parents=True, exist_ok=True)
+    generados = 0
+    for emp in empleados:
+        anterior = anteriores.get(emp['id'])
+        archivo = qr_path / f"{sanitize_filename(emp['nombre'])}.png"
+        if anterior is None or anterior['nombre'] != emp['nombre'] or (completo and not archivo.exists()):
+            try:
+                escribir_atomico(archivo, crear_png_qr(f"{base_url}?id={emp['id']}"))
+                generados += 1
+            except Exception as e:
+                log(f"❌ Error generando QR para {emp['nombre']}: {str(e)}")
+
+    if generados:
+        log(f"🔲 {generados} QR generados en {qr_dir}/")
+
+    # QR que ya no corresponden a ningún empleado (no se borran)
+    usados = {sanitize_filename(emp['nombre']) for emp in empleados}
+    anteriores_afectados = eliminados + [anteriores[emp['id']] for emp in modificados]
+    for nombre_archivo in sorted({sanitize_filename(emp['nombre']) for emp in anteriores_afectados} - usados):
+        if (qr_path / f"{nombre_archivo}.png").exists():
+            log(f"⚠️  QR huérfano (no se elimina): {nombre_archivo}.png")
+
+    if errores:
+        log(f"⚠️  Filas con error en el Excel: {errores}")
+
+    return actuales
+
+
+def vigilar_maestro(excel_file='empleados_maestro.xlsx', json_file='public/empleados.json',
+                    qr_dir='public/qr_codes', base_url=None, intervalo=INTERVALO, espera=ESPERA,
+                    una_vez=False):
+    """
+    Sincroniza al iniciar y luego cada vez que se guarda el Excel maestro.
+
+    Args:
+        una_vez: Solo la sincronización inicial (sin quedarse vigilando)
+    """
+    if not base_url:
+        base_url = "https://ramz0.github.io/credenciales-empleados"
+
+    print("=" * 70)
+    print("  VIGILANCIA DEL EXCEL MAESTRO - THE MONEY CENTER")
+    print("=" * 70)
+    print()
+    print(f"📂 Excel maestro: {excel_file}")
+    print(f"📁 JSON:          {json_file}")
+    print(f"📁 QR codes:      {qr_dir}/")
+    print(f"ℹ️  URL base:      {base_url}")
+    print()
+
+    anteriores = {}
+    if Path(json_file).exists():
+        anteriores = {emp['id']: emp for emp in iterar_empleados(json_file)}
+
+    firma = firma_archivo(excel_file)
+    try:
+        anteriores = sincronizar(excel_file, json_file, qr_dir, base_url, anteriores, completo=True)
+        log(f"✅ Sincronizado: {len(anteriores)} empleados")
+    except Exception as e:
+        log(f"❌ Error leyendo {excel_file}: {str(e)}")
+        if una_vez:
+            return False
+
+    if una_vez:
+        return True
+
+    log(f"👀 Vigilando {excel_file} (Ctrl+C para salir)")
+    try:
+        while True:
+            firma = esperar_cambio(excel_file, firma, intervalo, espera)
+            log("🔄 Cambio detectado en el Excel maestro")
+            try:
+                inicio = time.perf_counter()
+                anteriores = sincronizar(excel_file, json_file, qr_dir, base_url, anteriores)
+                log(f"✅ Listo en {time.perf_counter() - inicio:.1f} s")
+            except Exception as e:
+                # Se reintenta en el siguiente guardado
+                log(f"❌ Error leyendo {excel_file}: {str(e)}")
+    except KeyboardInterrupt:
+        print()
+        log("👋 Vigilancia detenida")
+
+    return True
+
+
+def main():
+    """Función principal del script."""
+    args = sys.argv[1:]
+    intervalo = INTERVALO
+    espera = ESPERA
+    una_vez = False
+    uso = "Uso: python vigilar_maestro.py [excel_maestro] [json_file] [qr_dir] [base_url] [opciones]"
+
+    if args and args[0] in ['-h', '--help']:
+        print(uso)
+        print()
+        print("Parámetros:")
+        print("  excel_maestro : Excel maestro (default: empleados_maestro.xlsx)")
+        print("  json_file     : JSON de la web (default: public/empleados.json)")
+        print("  qr_dir        : Carpeta de QR de la web (default: public/qr_codes)")
+        print("  base_url      : URL base de GitHub Pages")
+        print()
+        print("Opciones:")
+        print(f"  --intervalo N : Segundos entre revisiones (default: {INTERVALO:g})")
+        print(f"  --espera N    : Segundos sin cambios para procesar un guardado (default: {ESPERA:g})")
+        print("  --una-vez     : Sincroniza una vez y termina")
+        print()
+        print("Ejemplos:")
+        print("  python vigilar_maestro.py")
+        print("  python vigilar_maestro.py empleados_maestro.xlsx public/empleados.json public/qr_codes")
+        sys.exit(0)
+
+    # Opciones con valor
+    for opcion in ('--intervalo', '--espera'):
+        if opcion in args:
+            i = args.index(opcion)
+            try:
+                valor = float(args[i + 1])
+            except (IndexError, ValueError):
+                print(f"❌ Error: {opcion} requiere un número de segundos")
+                print(uso)
+                sys.exit(1)
+            del args[i:i + 2]
+            if opcion == '--intervalo':
+                intervalo = valor
+            else:
+                espera = valor
+
+    if '--una-vez' in args:
+        una_vez = True
+        args.remove('--una-vez')
+
+    excel_file = args[0] if len(args) > 0 else 'empleados_maestro.xlsx'
+    json_file = args[1] if len(args) > 1 else 'public/empleados.json'
+    qr_dir = args[2] if len(args) > 2 else 'public/qr_codes'
+    base_url = args[3] if len(args) > 3 else None
+
+    if not Path(excel_file).exists():
+        print(f"❌ Error: El archivo '{excel_file}' no existe")
+        sys.exit(1)
+
+    success = vigilar_maestro(excel_file, json_file, qr_dir, base_url, intervalo, espera, una_vez)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()